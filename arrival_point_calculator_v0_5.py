@@ -3,6 +3,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from rhumb_v0_2 import Rhumb
+from coordinates_v0_1 import ddm_to_decimal, decimal_to_ddm, validate_inputs
+from gui_worker_v0_1 import BackgroundTask
 import math
 
 def build_gui(parent):
@@ -87,36 +89,6 @@ def build_gui(parent):
     result_text.config(state="disabled")
     result_text.pack(pady=10)
 
-    # ========== Helper functions ==========
-
-    def validate_inputs(deg_str, min_str, max_deg, label):
-        deg = float(deg_str)
-        mins = float(min_str)
-
-        if not (0 <= deg <= max_deg):
-            raise ValueError(f"{label}: Degrees must be between 0 and {max_deg}.")
-        if not (0 <= mins < 60):
-            raise ValueError(f"{label}: Minutes must be between 0 and 59,99.")
-        if deg == max_deg and mins > 0:
-            raise ValueError(f"{label}: When degrees = {max_deg}, minutes must be 0.")
-
-    def ddm_to_decimal(degrees, minutes, hemi):
-        degrees = float(degrees)
-        minutes = float(minutes)
-        value = degrees + minutes / 60
-        if hemi in ("S", "W"):
-            value = -value
-        return value
-
-    def decimal_to_ddm(val, hemi_pos, hemi_neg, deg_digits=2):
-        hemi = hemi_pos if val >= 0 else hemi_neg
-        abs_val = abs(val)
-        degrees = int(abs_val)
-        minutes = (abs_val - degrees) * 60
-        deg_str = str(degrees).zfill(deg_digits)
-        min_str = f"{minutes:05.2f}"
-        return f"{deg_str}° {min_str}' {hemi}"
-
     latest_result = {"lat2": None, "lon2": None, "lat_ddm": None, "lon_ddm": None}
 
     def calculate():
@@ -138,11 +110,20 @@ def build_gui(parent):
             # Convert coordinates
             lat1 = ddm_to_decimal(dep_lat_deg.get(), dep_lat_min.get(), dep_lat_hemi.get())
             lon1 = ddm_to_decimal(dep_lon_deg.get(), dep_lon_min.get(), dep_lon_hemi.get())
+        except Exception as e:
+            show_error(e)
+            return
+        task.start(compute, lat1, lon1, azimuth, distance_nm)
+
+    def compute(task, lat1, lon1, azimuth, distance_nm):
+        # Runs on the worker thread
+        r = Rhumb()
+        res = r.Direct(lat1, lon1, azimuth, distance_nm * 1852.0)
+        return res['lat2'], res['lon2']
 
-            r = Rhumb()
-            res = r.Direct(lat1, lon1, azimuth, distance_nm * 1852.0)
-            lat2 = res['lat2']
-            lon2 = res['lon2']
+    def show_result(result):
+        try:
+            lat2, lon2 = result
 
             # Format results
             lat_ddm = decimal_to_ddm(lat2, "N", "S", deg_digits=2)
@@ -167,7 +148,13 @@ def build_gui(parent):
         except Exception as e:
             messagebox.showerror("Error", str(e), parent=parent)
 
+    def show_error(e):
+        messagebox.showerror("Error", str(e), parent=parent)
+
+    task = BackgroundTask(parent, show_result, on_error=show_error)
+
     def clear():
+        task.cancel()
         for e in [dep_lat_deg, dep_lat_min, dep_lon_deg, dep_lon_min, dist_entry, az_entry]:
             e.delete(0, tk.END)
         dep_lat_hemi.set("N")
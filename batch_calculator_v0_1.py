@@ -0,0 +1,146 @@
+# batch_calculator_v0_1.py
+# Headless streaming batch calculator for CSV / NDJSON route files
+# Usage: python batch_calculator_v0_1.py rhumb-inverse routes.csv -o results.csv
+
+import argparse
+import csv
+import json
+import math
+import sys
+from itertools import islice
+
+import numpy as np
+from rhumb_v0_2 import Rhumb
+from coordinates_v0_1 import parse_ddm_batch
+
+# Input columns and result columns for each calculation mode
+MODES = {
+    "rhumb-inverse": (("lat1", "lon1", "lat2", "lon2"), ("s12", "azi12")),
+    "rhumb-direct": (("lat1", "lon1", "azi12", "s12"), ("lat2", "lon2", "azi12")),
+    "geodesic-inverse": (("lat1", "lon1", "lat2", "lon2"), ("s12", "azi1", "azi2")),
+    "geodesic-direct": (("lat1", "lon1", "azi1", "s12"), ("lat2", "lon2", "azi2")),
+}
+
+# Columns holding a latitude or longitude (accepted in DDM or decimal degrees)
+COORD_COLUMNS = {"lat1": 90, "lon1": 180, "lat2": 90, "lon2": 180}
+
+
+def read_rows(stream, fmt):
+    """Yield one dict per input row from a CSV (with header) or NDJSON stream."""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    else:
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+def chunk_arrays(rows, columns, first_row):
+    """Convert a list of row dicts into one float array per input column."""
+    arrays = {}
+    for name in columns:
+        try:
+            texts = [row[name] for row in rows]
+        except KeyError:
+            raise ValueError(f"Row {first_row}: missing column '{name}'.")
+        if name in COORD_COLUMNS:
+            arrays[name] = parse_ddm_batch(texts, COORD_COLUMNS[name], label="Row", start=first_row)
+            continue
+        values = np.empty(len(rows))
+        for i, text in enumerate(texts):
+            try:
+                values[i] = float(text)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Row {first_row + i}: invalid {name} ({e}).")
+            if not math.isfinite(values[i]):
+                raise ValueError(f"Row {first_row + i}: invalid {name} (not a finite number: {text!r}).")
+        arrays[name] = values
+    return arrays
+
+
+def compute_chunk(rhumb, mode, arrays, nautical_miles=False):
+    """Run one chunk through the matching Rhumb solver. Returns a dict of result arrays."""
+    scale = 1852.0 if nautical_miles else 1.0
+    if mode == "rhumb-inverse":
+        res = rhumb.inverse_batch(arrays["lat1"], arrays["lon1"], arrays["lat2"], arrays["lon2"])
+        return {"s12": res["s12"] / scale, "azi12": res["azi12"]}
+    if mode == "rhumb-direct":
+        return rhumb.direct_batch(arrays["lat1"], arrays["lon1"], arrays["azi12"], arrays["s12"] * scale)
+    if mode == "geodesic-inverse":
+        res = rhumb.geodesic_inverse_batch(arrays["lat1"], arrays["lon1"], arrays["lat2"], arrays["lon2"])
+        return {"s12": res.s12 / scale, "azi1": res.azi1, "azi2": res.azi2}
+    res = rhumb.geodesic_direct_batch(arrays["lat1"], arrays["lon1"], arrays["azi1"], arrays["s12"] * scale)
+    return {"lat2": res.lat2, "lon2": res.lon2, "azi2": res.azi2}
+
+
+def process(instream, outstream, mode, fmt="csv", chunk_size=10000, nautical_miles=False):
+    """
+    Stream rows from instream through the chosen solver in fixed-size chunks,
+    writing each input row followed by its results to outstream.
+    Memory use is bounded by chunk_size. Returns the number of rows processed.
+    """
+    columns, results = MODES[mode]
+    rhumb = Rhumb()
+    rows = read_rows(instream, fmt)
+    writer = None
+    count = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        arrays = chunk_arrays(chunk, columns, count + 1)
+        res = compute_chunk(rhumb, mode, arrays, nautical_miles)
+        out_columns = [np.asarray(res[name]).tolist() for name in results]
+        if fmt == "csv":
+            if writer is None:
+                fieldnames = list(chunk[0].keys())
+                fieldnames += [name for name in results if name not in fieldnames]
+                writer = csv.DictWriter(outstream, fieldnames=fieldnames, extrasaction="ignore")
+                writer.writeheader()
+            for row, values in zip(chunk, zip(*out_columns)):
+                row.update(zip(results, values))
+                writer.writerow(row)
+        else:
+            for row, values in zip(chunk, zip(*out_columns)):
+                row.update(zip(results, values))
+                outstream.write(json.dumps(row) + "\n")
+        count += len(chunk)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Stream route files through the rhumb line and geodesic calculators."
+    )
+    parser.add_argument("mode", choices=sorted(MODES), help="Calculation to run on each row.")
+    parser.add_argument("input", nargs="?", default="-", help="Input file (default: stdin).")
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout).")
+    parser.add_argument("--format", choices=("csv", "ndjson"),
+                        help="Input/output format (default: from file extension, else csv).")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Rows per chunk (default: 10000).")
+    parser.add_argument("--nm", action="store_true", help="Distances in nautical miles instead of meters.")
+    args = parser.parse_args(argv)
+
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1.")
+    fmt = args.format
+    if fmt is None:
+        fmt = "ndjson" if args.input.endswith((".ndjson", ".jsonl")) else "csv"
+
+    instream = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    outstream = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        process(instream, outstream, args.mode, fmt, args.chunk_size, args.nm)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if instream is not sys.stdin:
+            instream.close()
+        if outstream is not sys.stdout:
+            outstream.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+# bench_rhumb_v0_2.py
+# Micro-benchmarks for the Rhumb calculation core
+# Run: python bench_rhumb_v0_2.py [--json results.json] [--compare baseline.json]
+
+import argparse
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+from rhumb_v0_2 import Rhumb
+
+
+def time_per_call(func, args_list, repeat=5):
+    """Best time per call (seconds) of func over args_list, out of repeat runs."""
+    def run():
+        for args in args_list:
+            func(*args)
+    return min(timeit.repeat(run, number=1, repeat=repeat)) / len(args_list)
+
+
+def bench_isometric(n=20000, seed=1):
+    """Exact vs fast isometric latitude (scalar) and the rhumb solvers that use it."""
+    rng = random.Random(seed)
+    exact = Rhumb()
+    fast = Rhumb(isometric="fast")
+    phis = [(rng.uniform(-math.pi / 2 + 1e-6, math.pi / 2 - 1e-6),) for _ in range(n)]
+    pairs = [(rng.uniform(-80, 80), rng.uniform(-180, 180), rng.uniform(-80, 80), rng.uniform(-180, 180))
+             for _ in range(n)]
+    legs = [(rng.uniform(-60, 80), rng.uniform(-180, 180), rng.uniform(0, 360), rng.uniform(0, 2e6))
+            for _ in range(n)]
+    rows = []
+    for label, attr, args in (("isometric_lat", "isometric_lat", phis),
+                              ("Inverse", "Inverse", pairs),
+                              ("Direct", "Direct", legs)):
+        t_exact = time_per_call(getattr(exact, attr), args)
+        t_fast = time_per_call(getattr(fast, attr), args)
+        rows.append((label, t_exact, t_fast))
+
+    max_err = max(abs(exact.isometric_lat(p) - fast.isometric_lat(p)) for (p,) in phis)
+    return rows, max_err
+
+
+def bench_exact_rhumb(n=20000, seed=2):
+    """Approximate (Inverse / Direct) vs exact ellipsoidal rhumb solutions."""
+    rng = random.Random(seed)
+    rh = Rhumb()
+    pairs = [(rng.uniform(-80, 80), rng.uniform(-180, 180), rng.uniform(-80, 80), rng.uniform(-180, 180))
+             for _ in range(n)]
+    legs = [(rng.uniform(-60, 80), rng.uniform(-180, 180), rng.uniform(0, 360), rng.uniform(0, 2e6))
+            for _ in range(n)]
+    return [("Inverse", time_per_call(rh.Inverse, pairs), time_per_call(rh.exact_inverse, pairs)),
+            ("Direct", time_per_call(rh.Direct, legs), time_per_call(rh.exact_direct, legs))]
+
+
+def allocated_bytes(func):
+    """Bytes still allocated after func() returns (its result kept alive), and the peak."""
+    tracemalloc.start()
+    kept = func()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size, peak
+
+
+def bench_allocations(n=100000, seed=3):
+    """Memory held by n scalar results (dict vs result type) and batch peak with/without out=."""
+    rng = random.Random(seed)
+    rh = Rhumb()
+    pairs = [(rng.uniform(-80, 80), rng.uniform(-180, 180), rng.uniform(-80, 80), rng.uniform(-180, 180))
+             for _ in range(n)]
+    values = [rh.Inverse(*p) for p in pairs]
+    dict_bytes, _ = allocated_bytes(lambda: [{'s12': s12, 'azi12': azi12} for s12, azi12 in values])
+    result_bytes, _ = allocated_bytes(lambda: [rh.Inverse(*p) for p in pairs])
+
+    cols = [np.array(c) for c in zip(*pairs)]
+    out = (np.empty(n), np.empty(n))
+    _, fresh_peak = allocated_bytes(lambda: rh.inverse_batch(*cols))
+    _, out_peak = allocated_bytes(lambda: rh.inverse_batch(*cols, out=out))
+    return [("scalar results (dict)", dict_bytes), ("scalar results (slots)", result_bytes),
+            ("inverse_batch peak", fresh_peak), ("inverse_batch peak, out=", out_peak)]
+
+
+# =========================
+# Benchmark suite
+# =========================
+def coordinate_sets(n=2000, seed=12):
+    """
+    Seeded random coordinate sets, each a dict of position pairs and legs:
+    "global" (anywhere below 85° of latitude), "polar" (80°..89.5° north and south)
+    and "antimeridian" (pairs straddling ±180° of longitude).
+    Polar legs are kept short of the pole so that Direct never clamps there.
+    Returns: dict of set name -> {"pairs": [(lat1, lon1, lat2, lon2)], "legs": [(lat1, lon1, azi12, s12)]}
+    """
+    rng = random.Random(seed)
+
+    def polar_lat():
+        return rng.choice((-1, 1)) * rng.uniform(80, 89.5)
+
+    def leg(lat):
+        # Stay within 90% of the meridian distance to the nearer pole
+        reach = math.radians(90 - abs(lat)) * 6378137 * 0.9
+        return (lat, rng.uniform(-180, 180), rng.uniform(0, 360), rng.uniform(0, min(2e6, reach)))
+
+    sets = {}
+    lats = [rng.uniform(-85, 85) for _ in range(2 * n)]
+    sets["global"] = {
+        "pairs": [(lats[i], rng.uniform(-180, 180), lats[n + i], rng.uniform(-180, 180)) for i in range(n)],
+        "legs": [leg(rng.uniform(-85, 85)) for _ in range(n)],
+    }
+    sets["polar"] = {
+        "pairs": [(polar_lat(), rng.uniform(-180, 180), polar_lat(), rng.uniform(-180, 180)) for _ in range(n)],
+        "legs": [leg(polar_lat()) for _ in range(n)],
+    }
+    sets["antimeridian"] = {
+        "pairs": [(rng.uniform(-70, 70), rng.uniform(170, 180), rng.uniform(-70, 70), rng.uniform(-180, -170))
+                  for _ in range(n)],
+        "legs": [(rng.uniform(-70, 70), rng.uniform(175, 180), rng.choice((rng.uniform(45, 135), rng.uniform(225, 315))),
+                  rng.uniform(1e5, 1e6)) for _ in range(n)],
+    }
+    return sets
+
+
+def _record(name, set_name, unit, seconds):
+    return {"name": name, "set": set_name, "unit": unit, "seconds": seconds}
+
+
+def run_suite(n=2000, seed=12, repeat=5, segments=(10, 100, 10000), routes=5):
+    """
+    Time every hot path of the calculation core on each coordinate set:
+    scalar Inverse / Direct / isometric_lat, their batch versions (per element),
+    geodesic_inverse / geodesic_direct and great-circle waypoint generation
+    (per route, for each number of segments). The result caches stay disabled.
+    Returns: list of records {"name", "set", "unit", "seconds"}
+    """
+    rh = Rhumb()
+    records = []
+    for set_name, data in coordinate_sets(n, seed).items():
+        pairs, legs = data["pairs"], data["legs"]
+        phis = [(math.radians(p[0]),) for p in pairs]
+        pair_cols = [np.array(c) for c in zip(*pairs)]
+        leg_cols = [np.array(c) for c in zip(*legs)]
+        phi_col = np.radians(pair_cols[0])
+
+        records.append(_record("Inverse", set_name, "call", time_per_call(rh.Inverse, pairs, repeat)))
+        records.append(_record("Direct", set_name, "call", time_per_call(rh.Direct, legs, repeat)))
+        records.append(_record("isometric_lat", set_name, "call", time_per_call(rh.isometric_lat, phis, repeat)))
+        for name, func, cols in (("inverse_batch", rh.inverse_batch, pair_cols),
+                                 ("direct_batch", rh.direct_batch, leg_cols),
+                                 ("isometric_lat_batch", rh.isometric_lat_batch, (phi_col,))):
+            records.append(_record(name, set_name, "element", time_per_call(func, [cols], repeat) / n))
+
+        # GeographicLib is much slower; a tenth of the set is plenty
+        few = max(1, n // 10)
+        records.append(_record("geodesic_inverse", set_name, "call",
+                               time_per_call(rh.geodesic_inverse, pairs[:few], repeat)))
+        records.append(_record("geodesic_direct", set_name, "call",
+                               time_per_call(rh.geodesic_direct, legs[:few], repeat)))
+
+        for count in segments:
+            args = [p + (count,) for p in pairs[:routes]]
+            seconds = time_per_call(lambda *a: sum(1 for _ in rh.geodesic_waypoints(*a)), args,
+                                    repeat if count < 10000 else 1)
+            records.append(_record(f"geodesic_waypoints[{count}]", set_name, "route", seconds))
+    return records
+
+
+def environment():
+    """Python / numpy / platform versions and the current git commit, if any."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"python": platform.python_version(), "numpy": np.__version__,
+            "platform": platform.platform(), "commit": commit}
+
+
+def save_results(path, records, **settings):
+    """Write records with the environment and settings (n, seed, ...) to a JSON file."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "settings": settings, "results": records}, f, indent=2)
+
+
+def load_results(path):
+    """Read the records of a JSON file written by save_results."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare_results(baseline, current, threshold=1.10):
+    """
+    Match records by name and set and compute current / baseline time ratios.
+    A ratio above threshold counts as a regression.
+    Returns: list of (name, set, baseline seconds, current seconds, ratio, regressed)
+    """
+    base = {(r["name"], r["set"]): r["seconds"] for r in baseline}
+    rows = []
+    for r in current:
+        key = (r["name"], r["set"])
+        if key in base and base[key] > 0:
+            ratio = r["seconds"] / base[key]
+            rows.append((r["name"], r["set"], base[key], r["seconds"], ratio, ratio > threshold))
+    return rows
+
+
+def print_suite(records):
+    print(f"{'Benchmark':<28}{'Set':<14}{'Unit':<9}{'µs':>12}")
+    for r in records:
+        print(f"{r['name']:<28}{r['set']:<14}{r['unit']:<9}{r['seconds'] * 1e6:>12.3f}")
+
+
+def print_comparison(rows):
+    print(f"{'Benchmark':<28}{'Set':<14}{'base (µs)':>12}{'now (µs)':>12}{'ratio':>9}")
+    for name, set_name, t_base, t_now, ratio, regressed in rows:
+        flag = "  SLOWER" if regressed else ""
+        print(f"{name:<28}{set_name:<14}{t_base * 1e6:>12.3f}{t_now * 1e6:>12.3f}{ratio:>8.2f}x{flag}")
+
+
+def print_reports():
+    rows, max_err = bench_isometric()
+    print(f"{'Method':<16}{'exact (µs)':>12}{'fast (µs)':>12}{'speedup':>10}")
+    for label, t_exact, t_fast in rows:
+        print(f"{label:<16}{t_exact * 1e6:>12.3f}{t_fast * 1e6:>12.3f}{t_exact / t_fast:>9.2f}x")
+    print(f"Max |psi_exact - psi_fast| over sample: {max_err:.3e}")
+    print()
+    print(f"{'Rhumb solver':<16}{'approx (µs)':>12}{'exact (µs)':>12}{'ratio':>10}")
+    for label, t_approx, t_exact in bench_exact_rhumb():
+        print(f"{label:<16}{t_approx * 1e6:>12.3f}{t_exact * 1e6:>12.3f}{t_approx / t_exact:>9.2f}x")
+    print()
+    print(f"{'Allocation (100k results)':<28}{'MiB':>10}")
+    for label, nbytes in bench_allocations():
+        print(f"{label:<28}{nbytes / 2 ** 20:>10.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Rhumb calculation core.")
+    parser.add_argument("--n", type=int, default=2000, help="coordinates per set (default 2000)")
+    parser.add_argument("--seed", type=int, default=12, help="random seed (default 12)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats, best is kept (default 5)")
+    parser.add_argument("--json", metavar="PATH", help="save the results to a JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a saved JSON baseline (run with the same --n and --seed)")
+    parser.add_argument("--threshold", type=float, default=1.10,
+                        help="slowdown ratio reported as a regression (default 1.10)")
+    parser.add_argument("--reports", action="store_true",
+                        help="also print the exact/fast, approx/exact and allocation reports")
+    args = parser.parse_args(argv)
+
+    records = run_suite(args.n, args.seed, args.repeat)
+    print_suite(records)
+    if args.json:
+        save_results(args.json, records, n=args.n, seed=args.seed, repeat=args.repeat)
+    if args.reports:
+        print()
+        print_reports()
+    if args.compare:
+        rows = compare_results(load_results(args.compare), records, args.threshold)
+        print()
+        print_comparison(rows)
+        if any(row[5] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
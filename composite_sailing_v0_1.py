@@ -0,0 +1,166 @@
+# composite_sailing_v0_1.py
+# Composite (limited-latitude) great circle sailing on WGS84
+# Where the great circle (geodesic) would climb beyond a limiting parallel, the
+# route becomes: geodesic to the limit, along the parallel, geodesic down again.
+
+import math
+from collections import namedtuple
+
+import numpy as np
+from rhumb_v0_2 import Rhumb
+
+# Composite route: total distance s12 = s1 + s2 + s3 (meters) of the three parts
+# (geodesic to the limit, along the parallel, geodesic from the limit), initial and
+# final azimuths azi1, azi2 (degrees), the two tangent points on the limiting
+# parallel, and whether the limit was needed at all (if not, s12 = s1 is the plain
+# geodesic and both tangent points are the destination)
+CompositeResult = namedtuple('CompositeResult',
+                             's12 s1 s2 s3 azi1 azi2 lat_t1 lon_t1 lat_t2 lon_t2 composite')
+
+
+def _lon_diff(lon1, lon2):
+    """lon2 - lon1 reduced to [-180°, 180°)."""
+    return (lon2 - lon1 + 180) % 360 - 180
+
+
+def tangent_azimuth(lat, limit, east, f=1 / 298.257223563):
+    """
+    Azimuth (degrees) from latitude lat of the geodesic whose vertex lies on the
+    parallel limit (signed degrees), heading east or west. Clairaut's relation
+    cos(beta) sin(alpha) = cos(beta_limit) gives it from the reduced latitudes.
+    Returns: azimuth in [0°, 360°)
+    """
+    phi, phi_l = math.radians(lat), math.radians(abs(limit))
+    cos_beta = math.cos(math.atan2((1 - f) * math.sin(phi), math.cos(phi)))
+    cos_beta_l = math.cos(math.atan2((1 - f) * math.sin(phi_l), math.cos(phi_l)))
+    alpha = math.degrees(math.asin(min(1.0, cos_beta_l / cos_beta)))
+    if limit >= 0:
+        return alpha if east else 360 - alpha
+    return 180 - alpha if east else 180 + alpha
+
+
+def composite_sailing(lat1, lon1, lat2, lon2, limit, rhumb=None):
+    """
+    Shortest route from point 1 to point 2 that stays within latitude +/- limit.
+    The geodesic is solved first; if its vertex lies between the two points and
+    beyond the limit, the route is made of the geodesics from each point tangent to
+    the limiting parallel (vertex on it, see Rhumb.geodesic_vertex) joined by the
+    arc of the parallel between the tangent points.
+    Returns: CompositeResult
+    """
+    if not 0 < limit < 90:
+        raise ValueError("Limiting latitude must be between 0° and 90°.")
+    if not all(math.isfinite(v) for v in (lat1, lon1, lat2, lon2)):
+        raise ValueError("Departure and destination must be finite.")
+    rhumb = rhumb or Rhumb()
+    s12, azi1, azi2 = rhumb.geodesic_inverse(lat1, lon1, lat2, lon2)
+    vertex = rhumb.geodesic_vertex(lat1, lon1, azi1)
+    if vertex.s12 >= s12 or abs(vertex.lat2) <= limit:
+        return CompositeResult(s12, s12, 0.0, 0.0, azi1, azi2, lat2, lon2, lat2, lon2, False)
+
+    limit = math.copysign(limit, vertex.lat2)
+    if max(lat1 / limit, lat2 / limit) > 1:  # An end point beyond the limit, on its side
+        raise ValueError("Departure and destination must lie within the limiting latitude.")
+    east = 0 < azi1 < 180
+    direction = 1 if east else -1
+    t1 = rhumb.geodesic_vertex(lat1, lon1, tangent_azimuth(lat1, limit, east))
+    back = tangent_azimuth(lat2, limit, not east)
+    t2 = rhumb.geodesic_vertex(lat2, lon2, back)
+
+    dlon = max(0.0, direction * _lon_diff(t1.lon2, t2.lon2))
+    s2 = rhumb._parallel_radius(math.radians(limit)) * math.radians(dlon)
+    s12 = t1.s12 + s2 + t2.s12
+    return CompositeResult(s12, t1.s12, s2, t2.s12, tangent_azimuth(lat1, limit, east),
+                           (back + 180) % 360, limit, t1.lon2, limit, t2.lon2, True)
+
+
+def _tangent_azimuths(lat, limit, east, f):
+    """tangent_azimuth over arrays (east a boolean array)."""
+    phi, phi_l = np.radians(lat), np.radians(np.abs(limit))
+    cos_beta = np.cos(np.arctan2((1 - f) * np.sin(phi), np.cos(phi)))
+    cos_beta_l = np.cos(np.arctan2((1 - f) * np.sin(phi_l), np.cos(phi_l)))
+    alpha = np.degrees(np.arcsin(np.minimum(1.0, cos_beta_l / cos_beta)))
+    return np.where(limit >= 0, np.where(east, alpha, 360 - alpha), np.where(east, 180 - alpha, 180 + alpha))
+
+
+def composite_batch(lat1, lon1, lat2, lon2, limit, rhumb=None):
+    """
+    composite_sailing over arrays (broadcast against each other), e.g. to sweep
+    many departure / destination / limit combinations. All of them are solved at
+    once: the geodesics, their vertices and the tangent geodesics by the NumPy
+    kernel (Rhumb.geodesic_inverse_batch / geodesic_vertex_batch). Invalid limits
+    and non-finite positions raise ValueError, as in composite_sailing; combinations
+    that have no composite route (an end point beyond the limit the geodesic would
+    cross) give nan and composite False.
+    Returns: CompositeResult of arrays
+    """
+    rhumb = rhumb or Rhumb()
+    args = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (lat1, lon1, lat2, lon2, limit)))
+    shape = args[0].shape
+    lat1, lon1, lat2, lon2, limit = (a.ravel() for a in args)
+    if not ((0 < limit) & (limit < 90)).all():
+        raise ValueError("Limiting latitude must be between 0° and 90°.")
+    if not np.isfinite([lat1, lon1, lat2, lon2]).all():
+        raise ValueError("Departure and destination must be finite.")
+
+    s12, azi1, azi2 = rhumb.geodesic_inverse_batch(lat1, lon1, lat2, lon2)
+    vertex = rhumb.geodesic_vertex_batch(lat1, lon1, azi1)
+    out = np.array([s12, s12, np.zeros_like(s12), np.zeros_like(s12), azi1, azi2, lat2, lon2, lat2, lon2])
+    composite = (vertex.s12 < s12) & (np.abs(vertex.lat2) > limit)
+    limit = np.copysign(limit, vertex.lat2)
+    with np.errstate(invalid="ignore"):
+        beyond = composite & (np.maximum(lat1 / limit, lat2 / limit) > 1)  # An end point beyond the limit
+    out[:, beyond] = np.nan
+    composite &= ~beyond
+
+    k = np.flatnonzero(composite)
+    if k.size:
+        lim = limit[k]
+        east = (0 < azi1[k]) & (azi1[k] < 180)
+        tangent = _tangent_azimuths(lat1[k], lim, east, rhumb.f)
+        t1 = rhumb.geodesic_vertex_batch(lat1[k], lon1[k], tangent)
+        back = _tangent_azimuths(lat2[k], lim, ~east, rhumb.f)
+        t2 = rhumb.geodesic_vertex_batch(lat2[k], lon2[k], back)
+        dlon = np.maximum(0.0, np.where(east, 1, -1) * _lon_diff(t1.lon2, t2.lon2))
+        phi = np.radians(lim)
+        sin_phi = np.sin(phi)
+        s2 = rhumb.a * np.cos(phi) / np.sqrt(1 - rhumb._e2 * sin_phi * sin_phi) * np.radians(dlon)
+        out[:, k] = (t1.s12 + s2 + t2.s12, t1.s12, s2, t2.s12, tangent, (back + 180) % 360,
+                     lim, t1.lon2, lim, t2.lon2)
+    return CompositeResult(*(column.reshape(shape) for column in out), composite.reshape(shape))
+
+
+def composite_waypoints(lat1, lon1, lat2, lon2, limit, spacing, rhumb=None):
+    """
+    Waypoints along the composite route about every spacing meters: each part is cut
+    into equal steps and the tangent points are always included.
+    Returns: (lats, lons, distances from the start in meters) arrays
+    """
+    if spacing <= 0:
+        raise ValueError("Spacing must be positive.")
+    rhumb = rhumb or Rhumb()
+    res = composite_sailing(lat1, lon1, lat2, lon2, limit, rhumb)
+    lats, lons, dists = [np.array([lat1])], [np.array([lon1])], [np.zeros(1)]
+    done = 0.0
+
+    def geodesic_part(la1, lo1, la2, lo2, s):
+        n = max(1, math.ceil(s / spacing))
+        points = np.array(list(rhumb.geodesic_waypoints(la1, lo1, la2, lo2, n))[1:])
+        lats.append(points[:, 0])
+        lons.append(points[:, 1])
+        dists.append(done + s * np.arange(1, n + 1) / n)
+
+    if not res.composite:
+        geodesic_part(lat1, lon1, lat2, lon2, res.s12)
+    else:
+        geodesic_part(lat1, lon1, res.lat_t1, res.lon_t1, res.s1)
+        done += res.s1
+        if res.s2 > 0:
+            n = max(1, math.ceil(res.s2 / spacing))
+            step = _lon_diff(res.lon_t1, res.lon_t2) / n
+            lats.append(np.full(n, res.lat_t1))
+            lons.append((res.lon_t1 + step * np.arange(1, n + 1) + 180) % 360 - 180)
+            dists.append(done + res.s2 * np.arange(1, n + 1) / n)
+            done += res.s2
+        geodesic_part(res.lat_t2, res.lon_t2, lat2, lon2, res.s3)
+    return np.concatenate(lats), np.concatenate(lons), np.concatenate(dists)
@@ -0,0 +1,161 @@
+# coordinates_v0_1.py
+# Degrees Decimal Minutes (DDM) parsing, formatting and validation
+# Shared by the GUI tabs and the headless tools, with batch versions for arrays
+# (numpy is only imported by the batch functions)
+
+import re
+
+# One DDM coordinate such as "38° 42.50' N", "038 42.5 W" or "38°42.5'N".
+# Horizontal whitespace only, so the same pattern can scan many lines at once.
+DDM_PATTERN = re.compile(
+    r"^[ \t]*(\d{1,3})[ \t]*(?:°|[ \t])[ \t]*(\d{1,2}(?:\.\d*)?)[ \t]*'?[ \t]*([NSEWnsew])[ \t]*$",
+    re.MULTILINE,
+)
+
+
+def ddm_to_decimal(degrees, minutes, hemi):
+    """Convert Degrees Decimal Minutes to decimal degrees."""
+    degrees = float(degrees)
+    minutes = float(minutes)
+    value = degrees + minutes / 60
+    if hemi in ("S", "W"):
+        value = -value
+    return value
+
+
+def decimal_to_ddm(val, hemi_pos, hemi_neg, deg_digits=2):
+    """Convert decimal degrees to Degrees Decimal Minutes string."""
+    hemi = hemi_pos if val >= 0 else hemi_neg
+    abs_val = abs(val)
+    degrees = int(abs_val)
+    minutes = (abs_val - degrees) * 60
+    deg_str = str(degrees).zfill(deg_digits)
+    min_str = f"{minutes:05.2f}"
+    return f"{deg_str}° {min_str}' {hemi}"
+
+
+def validate_inputs(deg_str, min_str, max_deg, label):
+    """
+    Validate degree and minute inputs for latitude or longitude.
+
+    - Degrees must be numeric and between 0 and max_deg.
+    - Minutes must be numeric and between 0 and 60.
+    - If degrees == max_deg, minutes must be exactly 0.
+    """
+    try:
+        deg = float(deg_str)
+        mins = float(min_str)
+    except ValueError:
+        raise ValueError(f"{label}: Degrees and minutes must be numeric.")
+
+    if not (0 <= deg <= max_deg):
+        raise ValueError(f"{label}: Degrees must be between 0 and {max_deg}.")
+
+    if not (0 <= mins < 60):
+        raise ValueError(f"{label}: Minutes must be between 0 and 59,99.")
+
+    if deg == max_deg and mins != 0:
+        raise ValueError(f"{label}: If degrees are {max_deg}, minutes must be 0.")
+
+    return deg, mins
+
+
+def parse_coordinate(text):
+    """Convert a DDM string or a decimal degrees value to decimal degrees."""
+    if isinstance(text, (int, float)):
+        return float(text)
+    match = DDM_PATTERN.match(text)
+    if match is None:
+        return float(text)
+    degrees, minutes, hemi = match.groups()
+    if float(minutes) >= 60:
+        raise ValueError(f"Minutes must be between 0 and 59,99: {text!r}")
+    value = float(degrees) + float(minutes) / 60
+    if hemi.upper() in ("S", "W"):
+        value = -value
+    return value
+
+
+def parse_ddm_batch(texts, max_deg=None, label="Coordinate", start=1):
+    """
+    Convert a sequence of DDM strings (decimal degree values are accepted too)
+    to a float array of decimal degrees.
+    When every entry is DDM, the compiled pattern scans all of them in one pass and
+    the conversion is done on arrays; the result is then validated in one pass:
+    finite values, minutes below 60 and, if max_deg is given, at most max_deg
+    degrees with a hemisphere of that axis (N / S for 90, E / W for 180).
+    Raises ValueError naming the first bad entry, numbering entries from start.
+    """
+    import numpy as np
+    n = len(texts)
+    groups = None
+    if n and all(isinstance(t, str) for t in texts):
+        joined = "\n".join(texts)
+        if joined.count("\n") == n - 1:
+            groups = DDM_PATTERN.findall(joined)
+            if len(groups) != n:
+                groups = None
+
+    if groups is not None:
+        fields = np.array(groups)
+        degrees = fields[:, 0].astype(float)
+        minutes = fields[:, 1].astype(float)
+        hemis = np.char.upper(fields[:, 2])
+        negative = np.isin(hemis, ("S", "W"))
+        is_ddm = np.ones(n, dtype=bool)
+    else:
+        degrees = np.empty(n)
+        minutes = np.zeros(n)
+        hemis = np.full(n, "", dtype="<U1")
+        negative = np.zeros(n, dtype=bool)
+        is_ddm = np.zeros(n, dtype=bool)
+        for i, text in enumerate(texts):
+            match = DDM_PATTERN.match(text) if isinstance(text, str) else None
+            if match is None:
+                try:
+                    degrees[i] = float(text)
+                except (TypeError, ValueError):
+                    raise ValueError(f"{label} {start + i}: not a DDM or decimal coordinate: {text!r}")
+            else:
+                d, m, hemi = match.groups()
+                degrees[i] = float(d)
+                minutes[i] = float(m)
+                hemis[i] = hemi.upper()
+                negative[i] = hemis[i] in ("S", "W")
+                is_ddm[i] = True
+
+    values = degrees + minutes / 60
+    np.negative(values, out=values, where=negative)
+
+    infinite = ~np.isfinite(values)
+    axis = {90: ("N", "S"), 180: ("E", "W")}.get(max_deg)
+    wrong_axis = is_ddm & ~np.isin(hemis, axis) if axis else np.zeros(n, dtype=bool)
+    bad_minutes = is_ddm & (minutes >= 60)
+    bad = infinite | wrong_axis | bad_minutes
+    if max_deg is not None:
+        bad |= np.abs(values) > max_deg
+    if bad.any():
+        i = int(np.argmax(bad))
+        if infinite[i]:
+            raise ValueError(f"{label} {start + i}: not a finite coordinate: {texts[i]!r}")
+        if wrong_axis[i]:
+            raise ValueError(f"{label} {start + i}: hemisphere must be {axis[0]} or {axis[1]}: {texts[i]!r}")
+        if bad_minutes[i]:
+            raise ValueError(f"{label} {start + i}: minutes must be between 0 and 59,99: {texts[i]!r}")
+        raise ValueError(f"{label} {start + i}: must be between -{max_deg}° and {max_deg}°: {texts[i]!r}")
+    return values
+
+
+def format_ddm_batch(values, hemi_pos, hemi_neg, deg_digits=2):
+    """
+    Format an array of decimal degrees as DDM strings, identical to decimal_to_ddm
+    element by element. Degrees, minutes and hemispheres are computed on arrays.
+    """
+    import numpy as np
+    values = np.asarray(values, dtype=float)
+    abs_vals = np.abs(values)
+    degrees = abs_vals.astype(np.int64)
+    minutes = (abs_vals - degrees) * 60
+    hemis = np.where(values >= 0, hemi_pos, hemi_neg)
+    fmt = f"{{:0{deg_digits}d}}° {{:05.2f}}' {{}}".format
+    return [fmt(d, m, h) for d, m, h in zip(degrees.tolist(), minutes.tolist(), hemis.tolist())]
@@ -0,0 +1,733 @@
+# geodesic_batch_v0_1.py
+# Vectorised ellipsoidal geodesics (inverse and direct problems) with NumPy
+# A transcription of Karney's algorithms (J. Geodesy 87, 43-55, 2013), the ones
+# GeographicLib implements, working on whole arrays at once: every step of the
+# scalar code is applied to all elements together, and the Newton iteration of the
+# inverse problem runs on the elements that have not converged yet. Nearly antipodal
+# points are handled by the same series (astroid start, bracketed Newton), so the
+# results agree with GeographicLib to round-off everywhere.
+
+import math
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+ORDER = 6  # Order of the series in the third flattening (as GeographicLib)
+
+_TINY = math.sqrt(sys.float_info.min)
+_TOL0 = sys.float_info.epsilon
+_TOL1 = 200 * _TOL0
+_TOL2 = math.sqrt(_TOL0)
+_TOLB = _TOL0
+_XTHRESH = 1000 * _TOL2
+_MAXIT1 = 20
+_MAXIT2 = _MAXIT1 + sys.float_info.mant_dig + 10
+
+# =========================
+# Series coefficients (Karney 2013): numerators, highest power first, then divisor
+# =========================
+_A1_COEFF = (1, 4, 64, 0, 256)
+_C1_COEFF = (-1, 6, -16, 32, -9, 64, -128, 2048, 9, -16, 768,
+             3, -5, 512, -7, 1280, -7, 2048)
+_C1P_COEFF = (205, -432, 768, 1536, 4005, -4736, 3840, 12288, -225, 116, 384,
+              -7173, 2695, 7680, 3467, 7680, 38081, 61440)
+_A2_COEFF = (-11, -28, -192, 0, 256)
+_C2_COEFF = (1, 2, 16, 32, 35, 64, 384, 2048, 15, 80, 768,
+             7, 35, 512, 63, 1280, 77, 2048)
+_A3_COEFF = (-3, 128, -2, -3, 64, -1, -3, -1, 16, 3, -1, -2, 8, 1, -1, 2, 1, 1)
+_C3_COEFF = (3, 128, 2, 5, 128, -1, 3, 3, 64, -1, 0, 1, 8, -1, 1, 4,
+             5, 256, 1, 3, 128, -3, -2, 3, 64, 1, -3, 2, 32,
+             7, 512, -10, 9, 384, 5, -9, 5, 192,
+             7, 512, -14, 7, 512, 21, 2560)
+
+
+def _unpack(coeff, orders):
+    """Split a flat coefficient table into (polynomial, divisor) pairs of the given orders."""
+    out, o = [], 0
+    for m in orders:
+        out.append((tuple(float(c) for c in coeff[o:o + m + 1]), float(coeff[o + m + 1])))
+        o += m + 2
+    return out
+
+
+def _polyval(p, x):
+    """Horner evaluation of the polynomial p (highest power first) at x."""
+    y = p[0]
+    for c in p[1:]:
+        y = y * x + c
+    return y
+
+
+_A1 = _unpack(_A1_COEFF, [ORDER // 2])[0]
+_A2 = _unpack(_A2_COEFF, [ORDER // 2])[0]
+_C1 = _unpack(_C1_COEFF, [(ORDER - l) // 2 for l in range(1, ORDER + 1)])
+_C1P = _unpack(_C1P_COEFF, [(ORDER - l) // 2 for l in range(1, ORDER + 1)])
+_C2 = _unpack(_C2_COEFF, [(ORDER - l) // 2 for l in range(1, ORDER + 1)])
+
+
+def _eps_series(table, eps):
+    """Coefficients c[l] = eps^l P_l(eps^2) / d_l, l = 1..ORDER (c[0] unused)."""
+    eps2 = eps * eps
+    c = [None]
+    d = eps
+    for poly, div in table:
+        c.append(d * _polyval(poly, eps2) / div)
+        d = d * eps
+    return c
+
+
+def _sin_series(sinx, cosx, c):
+    """Sum c[l] sin(2 l x), l = 1..len(c) - 1, by Clenshaw summation."""
+    k = len(c)
+    n = k - 1
+    ar = 2 * (cosx - sinx) * (cosx + sinx)
+    y1 = 0.0
+    if n & 1:
+        k -= 1
+        y0 = c[k]
+    else:
+        y0 = 0.0
+    for _ in range(n // 2):
+        k -= 1
+        y1 = ar * y0 - y1 + c[k]
+        k -= 1
+        y0 = ar * y1 - y0 + c[k]
+    return 2 * sinx * cosx * y0
+
+
+# =========================
+# Angle helpers (exact reductions, as GeographicLib's Math)
+# =========================
+def _remainder(x):
+    """x reduced to [-180°, 180°] exactly (nan for infinities)."""
+    with np.errstate(invalid="ignore"):
+        r = np.fmod(x, 360.0)
+    return np.where(r > 180, r - 360, np.where(r < -180, r + 360, r))
+
+
+def _ang_normalize(x):
+    y = _remainder(x)
+    return np.where(np.abs(y) == 180, np.copysign(180.0, x), y)
+
+
+def _ang_round(x):
+    """Round an angle so that small values underflow to zero."""
+    z = 1 / 16.0
+    y = np.abs(x)
+    y = np.where(y < z, z - (z - y), y)
+    return np.copysign(y, x)
+
+
+def _lat_fix(x):
+    return np.where(np.abs(x) > 90, np.nan, x)
+
+
+def _two_sum(u, v):
+    """Error-free sum: s = fl(u + v) and its rounding error t."""
+    s = u + v
+    up = s - v
+    vpp = s - up
+    up = up - u
+    vpp = vpp - v
+    return s, np.where(s == 0, s, 0.0 - (up + vpp))
+
+
+def _ang_diff(x, y):
+    """y - x reduced to [-180°, 180°] as a sum d + t of two doubles."""
+    d, t = _two_sum(_remainder(-x), _remainder(y))
+    d, t = _two_sum(_remainder(d), t)
+    fix = (d == 0) | (np.abs(d) == 180)
+    return np.where(fix, np.copysign(d, np.where(t == 0, y - x, -t)), d), t
+
+
+def _quadrant(s, c, q):
+    """Rotate (sin, cos) of the reduced angle by q quarter turns."""
+    q = q.astype(np.int64) % 4
+    s, c = (np.select([q == 1, q == 2, q == 3], [c, -s, -c], s),
+            np.select([q == 1, q == 2, q == 3], [-s, -c, s], c))
+    return s, c + 0.0
+
+
+def _sincosd(x):
+    """Sine and cosine of x in degrees, exact at multiples of 90°."""
+    with np.errstate(invalid="ignore"):
+        r = np.fmod(x, 360.0)
+    q = np.where(np.isnan(r), 0.0, np.round(r / 90))
+    r = np.radians(r - 90 * q)
+    s, c = _quadrant(np.sin(r), np.cos(r), q)
+    return np.where(s == 0, np.copysign(s, x), s), c
+
+
+def _sincosde(x, t):
+    """Sine and cosine of x + t in degrees, x in [-180°, 180°]."""
+    q = np.where(np.isfinite(x), np.round(x / 90), 0.0)
+    r = np.radians(_ang_round(x - 90 * q + t))
+    s, c = _quadrant(np.sin(r), np.cos(r), q)
+    return np.where(s == 0, np.copysign(s, x), s), c
+
+
+def _atan2d(y, x):
+    """atan2(y, x) in degrees, reduced to the first octant first for accuracy."""
+    swap = np.abs(y) > np.abs(x)
+    x, y = np.where(swap, y, x), np.where(swap, x, y)
+    neg = x < 0
+    x = np.where(neg, -x, x)
+    ang = np.degrees(np.arctan2(y, x))
+    return np.select([neg & ~swap, swap & ~neg, swap & neg],
+                     [np.copysign(180.0, y) - ang, 90 - ang, -90 + ang], ang)
+
+
+def _norm(x, y):
+    r = np.hypot(x, y)
+    return x / r, y / r
+
+
+def _astroid(x, y):
+    """Positive root k of k^4 + 2 k^3 - (x^2 + y^2 - 1) k^2 - 2 y^2 k - y^2 = 0."""
+    p = x * x
+    q = y * y
+    r = (p + q - 1) / 6
+    S = p * q / 4
+    r2 = r * r
+    r3 = r * r2
+    disc = S * (S + 2 * r3)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        T3 = S + r3
+        T3 = T3 + np.where(T3 < 0, -np.sqrt(disc), np.sqrt(disc))
+        T = np.copysign(np.abs(T3) ** (1 / 3.0), T3)
+        u_real = r + T + np.where(T != 0, r2 / T, 0.0)
+        ang = np.arctan2(np.sqrt(-disc), -(S + r3))
+        u = np.where(disc >= 0, u_real, r + 2 * r * np.cos(ang / 3))
+        v = np.sqrt(u * u + q)
+        uv = np.where(u < 0, q / (v - u), u + v)
+        w = (uv - q) / (2 * v)
+        k = uv / (np.sqrt(uv + w * w) + w)
+    return np.where((q == 0) & (r <= 0), 0.0, k)
+
+
+# A bundle of geodesics leaving their start points (see GeodesicBatch._line)
+_Line = namedtuple('_Line', 'salp0 calp0 ssig1 csig1 somg1 comg1 k2 eps A1m1 C1a B11 C3a A3c B31')
+
+
+class GeodesicBatch:
+    """
+    Geodesic inverse and direct problems on an oblate ellipsoid for whole arrays.
+    Inputs broadcast against each other (degrees, meters); results have the
+    broadcast shape, azimuths in [-180°, 180°] as GeographicLib's.
+    """
+
+    def __init__(self, a=6378137, f=1 / 298.257223563):
+        if not (math.isfinite(a) and a > 0):
+            raise ValueError("Equatorial radius must be positive.")
+        if not 0 <= f < 1:
+            raise ValueError("Flattening must be in [0, 1) (oblate ellipsoids only).")
+        self.a = float(a)
+        self.f = float(f)
+        self._f1 = 1 - self.f
+        self._e2 = self.f * (2 - self.f)
+        self._ep2 = self._e2 / (self._f1 * self._f1)
+        self._n = self.f / (2 - self.f)
+        self._b = self.a * self._f1
+        self._etol2 = 0.1 * _TOL2 / math.sqrt(max(0.001, abs(self.f)) * min(1.0, 1 - self.f / 2) / 2)
+        n = self._n
+        # A3 and C3 as polynomials in eps whose coefficients depend on n only
+        a3, o = [], 0
+        for j in range(ORDER - 1, -1, -1):
+            m = min(ORDER - j - 1, j)
+            a3.append(_polyval([float(c) for c in _A3_COEFF[o:o + m + 1]], n) / _A3_COEFF[o + m + 1])
+            o += m + 2
+        self._A3x = tuple(a3)
+        c3, o = [], 0
+        for l in range(1, ORDER):
+            for j in range(ORDER - 1, l - 1, -1):
+                m = min(ORDER - j - 1, j)
+                c3.append(_polyval([float(c) for c in _C3_COEFF[o:o + m + 1]], n) / _C3_COEFF[o + m + 1])
+                o += m + 2
+        self._C3x = tuple(c3)
+
+    # =========================
+    # Series in eps
+    # =========================
+    def _eps(self, k2):
+        return k2 / (2 * (1 + np.sqrt(1 + k2)) + k2)
+
+    def _A3f(self, eps):
+        return _polyval(self._A3x, eps)
+
+    def _C3f(self, eps):
+        c = [None]
+        mult = 1.0
+        o = 0
+        for l in range(1, ORDER):
+            m = ORDER - l - 1
+            mult = mult * eps
+            c.append(mult * _polyval(self._C3x[o:o + m + 1], eps))
+            o += m + 1
+        return c
+
+    @staticmethod
+    def _A1m1f(eps):
+        t = _polyval(_A1[0], eps * eps) / _A1[1]
+        return (t + eps) / (1 - eps)
+
+    @staticmethod
+    def _A2m1f(eps):
+        t = _polyval(_A2[0], eps * eps) / _A2[1]
+        return (t - eps) / (1 + eps)
+
+    def _lengths(self, eps, sig12, ssig1, csig1, dn1, ssig2, csig2, dn2, distance=True, reduced=False):
+        """
+        Scaled distance s12 / b and reduced length m12 / b (nan when not asked for).
+        Returns: (s12b, m12b)
+        """
+        s12b = m12b = np.nan
+        A1 = self._A1m1f(eps)
+        C1a = _eps_series(_C1, eps)
+        if reduced:
+            A2 = self._A2m1f(eps)
+            C2a = _eps_series(_C2, eps)
+            m0x = A1 - A2
+            A2 = 1 + A2
+        A1 = 1 + A1
+        if distance:
+            B1 = _sin_series(ssig2, csig2, C1a) - _sin_series(ssig1, csig1, C1a)
+            s12b = A1 * (sig12 + B1)
+            if reduced:
+                B2 = _sin_series(ssig2, csig2, C2a) - _sin_series(ssig1, csig1, C2a)
+                J12 = m0x * sig12 + (A1 * B1 - A2 * B2)
+        elif reduced:
+            # GeographicLib combines all but the last term of the two series
+            C2a = [None] + [A1 * C1a[l] - A2 * C2a[l] for l in range(1, ORDER)] + [C2a[ORDER]]
+            J12 = m0x * sig12 + (_sin_series(ssig2, csig2, C2a) - _sin_series(ssig1, csig1, C2a))
+        if reduced:
+            m12b = dn2 * (csig1 * ssig2) - dn1 * (ssig1 * csig2) - csig1 * csig2 * J12
+        return s12b, m12b
+
+    # =========================
+    # Inverse problem
+    # =========================
+    def _inverse_start(self, sbet1, cbet1, sbet2, cbet2, lam12, slam12, clam12):
+        """
+        Starting azimuth for Newton's method, or the solution itself for short lines.
+        Returns: (sig12 (-1 unless solved), salp1, calp1, salp2, calp2, dnm)
+        """
+        f1, ep2, n = self._f1, self._ep2, self._n
+        sbet12 = sbet2 * cbet1 - cbet2 * sbet1
+        cbet12 = cbet2 * cbet1 + sbet2 * sbet1
+        sbet12a = sbet2 * cbet1 + cbet2 * sbet1
+        short = (cbet12 >= 0) & (sbet12 < 0.5) & (cbet2 * lam12 < 0.5)
+        sbetm2 = (sbet1 + sbet2) * (sbet1 + sbet2)
+        sbetm2 = sbetm2 / (sbetm2 + (cbet1 + cbet2) * (cbet1 + cbet2))
+        dnm = np.where(short, np.sqrt(1 + ep2 * sbetm2), np.nan)
+        omg12 = lam12 / (f1 * dnm)
+        somg12 = np.where(short, np.sin(omg12), slam12)
+        comg12 = np.where(short, np.cos(omg12), clam12)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            salp1 = cbet2 * somg12
+            calp1 = np.where(comg12 >= 0,
+                             sbet12 + cbet2 * sbet1 * (somg12 * somg12) / (1 + comg12),
+                             sbet12a - cbet2 * sbet1 * (somg12 * somg12) / (1 - comg12))
+            ssig12 = np.hypot(salp1, calp1)
+            csig12 = sbet1 * sbet2 + cbet1 * cbet2 * comg12
+
+            close = short & (ssig12 < self._etol2)
+            salp2 = cbet1 * somg12
+            calp2 = sbet12 - cbet1 * sbet2 * np.where(comg12 >= 0, (somg12 * somg12) / (1 + comg12), 1 - comg12)
+            salp2, calp2 = _norm(salp2, calp2)
+            salp2 = np.where(close, salp2, np.nan)
+            calp2 = np.where(close, calp2, np.nan)
+            sig12 = np.where(close, np.arctan2(ssig12, csig12), -1.0)
+
+        # Nearly antipodal: start from the astroid solution (Karney 2013, sec. 5)
+        astro = ~close & ~((abs(n) >= 0.1) | (csig12 >= 0) | (ssig12 >= 6 * abs(n) * math.pi * (cbet1 * cbet1)))
+        if astro.any():
+            i = np.flatnonzero(astro)
+            sb1, cb1, cb2, sb12a = sbet1[i], cbet1[i], cbet2[i], sbet12a[i]
+            lam12x = np.arctan2(-slam12[i], -clam12[i])
+            eps = self._eps(sb1 * sb1 * ep2)
+            lamscale = self.f * cb1 * self._A3f(eps) * math.pi
+            betscale = lamscale * cb1
+            x = lam12x / lamscale
+            y = sb12a / betscale
+            simple = (y > -_TOL1) & (x > -1 - _XTHRESH)
+            k = _astroid(x, y)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                omg12a = lamscale * (-x * k / (1 + k))
+                somg = np.sin(omg12a)
+                comg = -np.cos(omg12a)
+                s_simple = np.minimum(1.0, -x)
+                salp1[i] = np.where(simple, s_simple, cb2 * somg)
+                calp1[i] = np.where(simple, -np.sqrt(1 - s_simple * s_simple),
+                                    sb12a - cb2 * sb1 * (somg * somg) / (1 - comg))
+
+        bad = salp1 <= 0
+        with np.errstate(invalid="ignore"):
+            salp1, calp1 = _norm(salp1, calp1)
+        salp1 = np.where(bad, 1.0, salp1)
+        calp1 = np.where(bad, 0.0, calp1)
+        return sig12, salp1, calp1, salp2, calp2, dnm
+
+    def _lambda12(self, sbet1, cbet1, dn1, sbet2, cbet2, dn2, salp1, calp1, slam120, clam120, diffp):
+        """
+        Longitude difference (minus the target one) reached by leaving point 1 on
+        azimuth alp1, and its derivative with respect to alp1 when diffp.
+        Returns: (v, salp2, calp2, sig12, ssig1, csig1, ssig2, csig2, eps, dv)
+        """
+        ep2 = self._ep2
+        calp1 = np.where((sbet1 == 0) & (calp1 == 0), -_TINY, calp1)
+        salp0 = salp1 * cbet1
+        calp0 = np.hypot(calp1, salp1 * sbet1)
+        somg1 = salp0 * sbet1
+        csig1 = comg1 = calp1 * cbet1
+        ssig1, csig1 = _norm(sbet1, csig1)
+
+        same = cbet2 == cbet1
+        salp2 = np.where(same, salp1, salp0 / cbet2)
+        calp2 = np.sqrt(calp1 * cbet1 * (calp1 * cbet1)
+                        + np.where(cbet1 < -sbet1, (cbet2 - cbet1) * (cbet1 + cbet2),
+                                   (sbet1 - sbet2) * (sbet1 + sbet2))) / cbet2
+        calp2 = np.where(same & (np.abs(sbet2) == -sbet1), np.abs(calp1), calp2)
+        somg2 = salp0 * sbet2
+        csig2 = comg2 = calp2 * cbet2
+        ssig2, csig2 = _norm(sbet2, csig2)
+
+        sig12 = np.arctan2(np.maximum(0.0, csig1 * ssig2 - ssig1 * csig2) + 0.0, csig1 * csig2 + ssig1 * ssig2)
+        somg12 = np.maximum(0.0, comg1 * somg2 - somg1 * comg2) + 0.0
+        comg12 = comg1 * comg2 + somg1 * somg2
+        eta = np.arctan2(somg12 * clam120 - comg12 * slam120, comg12 * clam120 + somg12 * slam120)
+        eps = self._eps(calp0 * calp0 * ep2)
+        C3a = self._C3f(eps)
+        B312 = _sin_series(ssig2, csig2, C3a) - _sin_series(ssig1, csig1, C3a)
+        domg12 = -self.f * self._A3f(eps) * salp0 * (sig12 + B312)
+        v = eta + domg12
+
+        dv = None
+        if diffp:
+            _, dv = self._lengths(eps, sig12, ssig1, csig1, dn1, ssig2, csig2, dn2, distance=False, reduced=True)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                dv = np.where(calp2 == 0, -2 * self._f1 * dn1 / sbet1, dv * self._f1 / (calp2 * cbet2))
+        return v, salp2, calp2, sig12, ssig1, csig1, ssig2, csig2, eps, dv
+
+    def _newton(self, sbet1, cbet1, dn1, sbet2, cbet2, dn2, salp1, calp1, slam12, clam12):
+        """
+        Solve lambda12(alp1) = lam12 for every element, Newton steps with bisection
+        inside the bracket [alp1a, alp1b] as a safeguard. All elements step together;
+        each leaves the loop when it has converged.
+        Returns: (s12b, salp1, calp1, salp2, calp2)
+        """
+        m = salp1.size
+        out = [np.empty(m) for _ in range(5)]
+        salp1a = np.full(m, _TINY)
+        calp1a = np.ones(m)
+        salp1b = np.full(m, _TINY)
+        calp1b = np.full(m, -1.0)
+        tripn = np.zeros(m, dtype=bool)
+        tripb = np.zeros(m, dtype=bool)
+        act = np.arange(m)
+        for numit in range(_MAXIT2 + 1):
+            args = (sbet1[act], cbet1[act], dn1[act], sbet2[act], cbet2[act], dn2[act])
+            (v, salp2, calp2, sig12, ssig1, csig1, ssig2, csig2, eps, dv) = self._lambda12(
+                *args, salp1, calp1, slam12[act], clam12[act], numit < _MAXIT1)
+            done = tripb | ~(np.abs(v) >= np.where(tripn, 8.0, 1.0) * _TOL0) | (numit == _MAXIT2)
+            if done.any():
+                d = np.flatnonzero(done)
+                s12b, _ = self._lengths(eps[d], sig12[d], ssig1[d], csig1[d], dn1[act[d]],
+                                        ssig2[d], csig2[d], dn2[act[d]])
+                for arr, val in zip(out, (s12b, salp1[d], calp1[d], salp2[d], calp2[d])):
+                    arr[act[d]] = val
+                keep = ~done
+                act = act[keep]
+                if not act.size:
+                    break
+                v, salp1, calp1 = v[keep], salp1[keep], calp1[keep]
+                dv = None if dv is None else dv[keep]
+                salp1a, calp1a, salp1b, calp1b = salp1a[keep], calp1a[keep], salp1b[keep], calp1b[keep]
+                tripn = tripn[keep]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                up_b = (v > 0) & ((numit > _MAXIT1) | (calp1 / salp1 > calp1b / salp1b))
+                up_a = (v < 0) & ((numit > _MAXIT1) | (calp1 / salp1 < calp1a / salp1a))
+            salp1b, calp1b = np.where(up_b, salp1, salp1b), np.where(up_b, calp1, calp1b)
+            salp1a, calp1a = np.where(up_a, salp1, salp1a), np.where(up_a, calp1, calp1a)
+
+            newton = np.zeros(act.size, dtype=bool)
+            if numit + 1 < _MAXIT1:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    dalp1 = np.where(dv > 0, -v / dv, np.inf)
+                newton = np.abs(dalp1) < math.pi
+                if newton.any():
+                    sdalp1, cdalp1 = np.sin(dalp1), np.cos(dalp1)
+                    nsalp1 = salp1 * cdalp1 + calp1 * sdalp1
+                    newton &= nsalp1 > 0
+                    ncalp1 = calp1 * cdalp1 - salp1 * sdalp1
+                    with np.errstate(invalid="ignore", divide="ignore"):
+                        nsalp1, ncalp1 = _norm(nsalp1, ncalp1)
+            bsalp1, bcalp1 = _norm((salp1a + salp1b) / 2, (calp1a + calp1b) / 2)
+            tripb = ~newton & ((np.abs(salp1a - bsalp1) + (calp1a - bcalp1) < _TOLB)
+                               | (np.abs(bsalp1 - salp1b) + (bcalp1 - calp1b) < _TOLB))
+            tripn = newton & (np.abs(v) <= 16 * _TOL0)
+            if newton.any():
+                salp1 = np.where(newton, nsalp1, bsalp1)
+                calp1 = np.where(newton, ncalp1, bcalp1)
+            else:
+                salp1, calp1 = bsalp1, bcalp1
+        return out
+
+    def inverse(self, lat1, lon1, lat2, lon2):
+        """
+        Shortest geodesics between point 1 and point 2 (degrees).
+        Returns: (s12 meters, azi1, azi2 degrees) arrays
+        """
+        arrays = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (lat1, lon1, lat2, lon2)))
+        shape = arrays[0].shape
+        lat1, lon1, lat2, lon2 = (x.ravel() for x in arrays)
+        f1, ep2 = self._f1, self._ep2
+
+        # Canonical configuration: lon12 >= 0, |lat1| >= |lat2|, lat1 <= 0
+        lon12, lon12s = _ang_diff(lon1, lon2)
+        lonsign = np.copysign(1.0, lon12)
+        lon12 = lonsign * lon12
+        lon12s = lonsign * lon12s
+        lam12 = np.radians(lon12)
+        slam12, clam12 = _sincosde(lon12, lon12s)
+        lon12s = (180 - lon12) - lon12s
+        lat1 = _ang_round(_lat_fix(lat1))
+        lat2 = _ang_round(_lat_fix(lat2))
+        swapp = np.where((np.abs(lat1) < np.abs(lat2)) | np.isnan(lat2), -1.0, 1.0)
+        lonsign = np.where(swapp < 0, -lonsign, lonsign)
+        lat1, lat2 = np.where(swapp < 0, lat2, lat1), np.where(swapp < 0, lat1, lat2)
+        latsign = np.copysign(1.0, -lat1)
+        lat1 = lat1 * latsign
+        lat2 = lat2 * latsign
+
+        sbet1, cbet1 = _sincosd(lat1)
+        sbet1, cbet1 = _norm(sbet1 * f1, cbet1)
+        cbet1 = np.maximum(_TINY, cbet1)
+        sbet2, cbet2 = _sincosd(lat2)
+        sbet2, cbet2 = _norm(sbet2 * f1, cbet2)
+        cbet2 = np.maximum(_TINY, cbet2)
+        south = cbet1 < -sbet1
+        sbet2 = np.where(south & (cbet2 == cbet1), np.copysign(sbet1, sbet2), sbet2)
+        cbet2 = np.where(~south & (np.abs(sbet2) == -sbet1), cbet1, cbet2)
+        dn1 = np.sqrt(1 + ep2 * (sbet1 * sbet1))
+        dn2 = np.sqrt(1 + ep2 * (sbet2 * sbet2))
+
+        size = lat1.size
+        s12x = np.full(size, np.nan)
+        salp1 = np.full(size, np.nan)
+        calp1 = np.full(size, np.nan)
+        salp2 = np.full(size, np.nan)
+        calp2 = np.full(size, np.nan)
+
+        # Meridional geodesics (or from a pole): closed form in sigma
+        meridian = (lat1 == -90) | (slam12 == 0)
+        i = np.flatnonzero(meridian)
+        if i.size:
+            ca1, sa1 = clam12[i], slam12[i]
+            ssig1, csig1 = sbet1[i], ca1 * cbet1[i]
+            ssig2, csig2 = sbet2[i], cbet2[i]
+            sig12 = np.arctan2(np.maximum(0.0, csig1 * ssig2 - ssig1 * csig2) + 0.0, csig1 * csig2 + ssig1 * ssig2)
+            s, m12 = self._lengths(np.full(i.size, self._n), sig12, ssig1, csig1, dn1[i], ssig2, csig2, dn2[i],
+                                   reduced=True)
+            ok = (sig12 < _TOL2) | (m12 >= 0)
+            zero = (sig12 < 3 * _TINY) | ((sig12 < _TOL0) & ((s < 0) | (m12 < 0)))
+            s = np.where(zero, 0.0, s) * self._b
+            meridian[i[~ok]] = False
+            i, ok = i[ok], ok
+            s12x[i] = s[ok]
+            salp1[i], calp1[i] = sa1[ok], ca1[ok]
+            salp2[i], calp2[i] = 0.0, 1.0
+
+        # Equatorial geodesics (unless nearly antipodal): distance along the equator
+        equator = ~meridian & (sbet1 == 0) & ((self.f <= 0) | (lon12s >= self.f * 180))
+        s12x[equator] = self.a * lam12[equator]
+        salp1[equator] = salp2[equator] = 1.0
+        calp1[equator] = calp2[equator] = 0.0
+
+        rest = np.flatnonzero(~meridian & ~equator)
+        if rest.size:
+            sb1, cb1, d1, sb2, cb2, d2 = (x[rest] for x in (sbet1, cbet1, dn1, sbet2, cbet2, dn2))
+            sl, cl = slam12[rest], clam12[rest]
+            sig12, sa1, ca1, sa2, ca2, dnm = self._inverse_start(sb1, cb1, sb2, cb2, lam12[rest], sl, cl)
+            s = sig12 * self._b * dnm
+            solved = sig12 >= 0
+            j = np.flatnonzero(~solved)
+            if j.size:
+                s12b, sa1[j], ca1[j], sa2[j], ca2[j] = self._newton(
+                    sb1[j], cb1[j], d1[j], sb2[j], cb2[j], d2[j], sa1[j], ca1[j], sl[j], cl[j])
+                s[j] = s12b * self._b
+            s12x[rest], salp1[rest], calp1[rest], salp2[rest], calp2[rest] = s, sa1, ca1, sa2, ca2
+
+        s12 = 0.0 + s12x
+        swap = swapp < 0
+        salp1, salp2 = np.where(swap, salp2, salp1), np.where(swap, salp1, salp2)
+        calp1, calp2 = np.where(swap, calp2, calp1), np.where(swap, calp1, calp2)
+        salp1 = salp1 * (swapp * lonsign)
+        calp1 = calp1 * (swapp * latsign)
+        salp2 = salp2 * (swapp * lonsign)
+        calp2 = calp2 * (swapp * latsign)
+        return (s12.reshape(shape), _atan2d(salp1, calp1).reshape(shape),
+                _atan2d(salp2, calp2).reshape(shape))
+
+    # =========================
+    # Direct problem
+    # =========================
+    def _line(self, lat1, azi1):
+        """
+        The geodesics leaving latitude lat1 on azimuth azi1 (flat arrays): the great
+        circles on the auxiliary sphere (azimuth alp0 at the equator crossing, arc
+        sigma1 from it) and the distance and longitude series along them.
+        Returns: _Line
+        """
+        f1 = self._f1
+        lat1 = _lat_fix(lat1)
+        salp1, calp1 = _sincosd(_ang_round(azi1))
+        sbet1, cbet1 = _sincosd(_ang_round(lat1))
+        sbet1, cbet1 = _norm(sbet1 * f1, cbet1)
+        cbet1 = np.maximum(_TINY, cbet1)
+
+        salp0 = salp1 * cbet1
+        calp0 = np.hypot(calp1, salp1 * sbet1)
+        somg1 = salp0 * sbet1
+        csig1 = comg1 = np.where((sbet1 != 0) | (calp1 != 0), cbet1 * calp1, 1.0)
+        ssig1, csig1 = _norm(sbet1, csig1)
+        k2 = calp0 * calp0 * self._ep2
+        eps = self._eps(k2)
+        C1a = _eps_series(_C1, eps)
+        C3a = self._C3f(eps)
+        return _Line(salp0, calp0, ssig1, csig1, somg1, comg1, k2, eps, self._A1m1f(eps), C1a,
+                     _sin_series(ssig1, csig1, C1a), C3a, -self.f * salp0 * self._A3f(eps),
+                     _sin_series(ssig1, csig1, C3a))
+
+    def _arc_position(self, line, sig12, ssig12, csig12, unroll=False):
+        """
+        Point at arc sig12 (radians, with its sine and cosine) along line.
+        Returns: (lat2, lam12 radians, azi2 degrees, s12 meters); lam12 follows the
+        line across the antimeridian (unrolled) if unroll, else is reduced to [-pi, pi]
+        """
+        salp0, calp0, ssig1, csig1, somg1, comg1 = line[:6]
+        ssig2 = ssig1 * csig12 + csig1 * ssig12
+        csig2 = csig1 * csig12 - ssig1 * ssig12
+        sbet2 = calp0 * ssig2
+        cbet2 = np.hypot(salp0, calp0 * csig2)
+        pole = cbet2 == 0
+        cbet2 = np.where(pole, _TINY, cbet2)
+        csig2 = np.where(pole, _TINY, csig2)
+        salp2, calp2 = salp0, calp0 * csig2
+
+        somg2, comg2 = salp0 * ssig2, csig2
+        if unroll:
+            e = np.copysign(1.0, salp0)
+            omg12 = e * (sig12 - (np.arctan2(ssig2, csig2) - np.arctan2(ssig1, csig1))
+                         + (np.arctan2(e * somg2, comg2) - np.arctan2(e * somg1, comg1)))
+        else:
+            omg12 = np.arctan2(somg2 * comg1 - comg2 * somg1, comg2 * comg1 + somg2 * somg1)
+        lam12 = omg12 + line.A3c * (sig12 + (_sin_series(ssig2, csig2, line.C3a) - line.B31))
+        s12 = self._b * (1 + line.A1m1) * (sig12 + (_sin_series(ssig2, csig2, line.C1a) - line.B11))
+        return _atan2d(sbet2, self._f1 * cbet2), lam12, _atan2d(salp2, calp2), s12
+
+    def direct(self, lat1, lon1, azi1, s12):
+        """
+        End of the geodesic of length s12 (meters) leaving point 1 on azimuth azi1.
+        Returns: (lat2, lon2 in [-180°, 180°], azi2) arrays, degrees
+        """
+        arrays = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (lat1, lon1, azi1, s12)))
+        shape = arrays[0].shape
+        lat1, lon1, azi1, s12 = (x.ravel() for x in arrays)
+        line = self._line(lat1, azi1)
+        ssig1, csig1, k2, eps, A1m1, B11 = line.ssig1, line.csig1, line.k2, line.eps, line.A1m1, line.B11
+
+        # Distance -> arc length sigma12 by reverting the distance series
+        s, c = np.sin(B11), np.cos(B11)
+        stau1 = ssig1 * c + csig1 * s
+        ctau1 = csig1 * c - ssig1 * s
+        C1pa = _eps_series(_C1P, eps)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            tau12 = s12 / (self._b * (1 + A1m1))
+        tau12 = np.where(np.isfinite(tau12), tau12, np.nan)
+        s, c = np.sin(tau12), np.cos(tau12)
+        B12 = -_sin_series(stau1 * c + ctau1 * s, ctau1 * c - stau1 * s, C1pa)
+        sig12 = tau12 - (B12 - B11)
+        ssig12, csig12 = np.sin(sig12), np.cos(sig12)
+        if abs(self.f) > 0.01:
+            ssig2 = ssig1 * csig12 + csig1 * ssig12
+            csig2 = csig1 * csig12 - ssig1 * ssig12
+            B12 = _sin_series(ssig2, csig2, line.C1a)
+            serr = (1 + A1m1) * (sig12 + (B12 - B11)) - s12 / self._b
+            sig12 = sig12 - serr / np.sqrt(1 + k2 * (ssig2 * ssig2))
+            ssig12, csig12 = np.sin(sig12), np.cos(sig12)
+
+        lat2, lam12, azi2, _ = self._arc_position(line, sig12, ssig12, csig12)
+        lon2 = _ang_normalize(_ang_normalize(lon1) + _ang_normalize(np.degrees(lam12)))
+        return lat2.reshape(shape), lon2.reshape(shape), azi2.reshape(shape)
+
+    def arc_direct(self, lat1, lon1, azi1, a12, unroll=False):
+        """
+        Point at arc a12 (degrees on the auxiliary sphere) along the geodesic leaving
+        point 1 on azimuth azi1, as GeographicLib's ArcDirect. With unroll, lon2 is
+        lon1 plus the longitude actually travelled instead of being reduced.
+        Returns: (lat2, lon2, azi2, s12 meters) arrays
+        """
+        arrays = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (lat1, lon1, azi1, a12)))
+        shape = arrays[0].shape
+        lat1, lon1, azi1, a12 = (x.ravel() for x in arrays)
+        ssig12, csig12 = _sincosd(a12)
+        lat2, lam12, azi2, s12 = self._arc_position(self._line(lat1, azi1), np.radians(a12),
+                                                     ssig12, csig12, unroll)
+        if unroll:
+            lon2 = lon1 + np.degrees(lam12)
+        else:
+            lon2 = _ang_normalize(_ang_normalize(lon1) + _ang_normalize(np.degrees(lam12)))
+        return tuple(x.reshape(shape) for x in (lat2, lon2, azi2, s12))
+
+    def vertex(self, lat1, lon1, azi1):
+        """
+        First vertex ahead of point 1 (farthest from the equator, heading due east or
+        west) of the geodesic leaving on azimuth azi1: on the auxiliary sphere it is at
+        arc pi/2 - sigma1 (mod pi) from the start.
+        Returns: (lat2, lon2, azi2, s12 meters) arrays
+        """
+        arrays = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (lat1, lon1, azi1)))
+        line = self._line(arrays[0].ravel(), arrays[2].ravel())
+        arc = np.degrees(np.remainder(np.pi / 2 - np.arctan2(line.ssig1, line.csig1), np.pi))
+        return self.arc_direct(*arrays, arc.reshape(arrays[0].shape))
+
+    def meridian_crossings(self, lat1, lon1, azi1, lon):
+        """
+        Where the geodesic leaving point 1 on azimuth azi1 reaches longitude lon, counted
+        unrolled from lon1 (lon - lon1 is the longitude travelled, of the sign of the
+        course's east component). Solved by Newton's method on the auxiliary longitude
+        omega, all elements at once: longitude is omega minus f sin(alpha0) times the A3 /
+        C3 series in sigma, so d(longitude)/d(omega) = 1 - f A3 cos^2(beta) (1 + C3 series')
+        is close to 1 and two or three steps reach round-off. The latitude then follows
+        in closed form from sigma. Meridional geodesics (which cross no meridian) give nan.
+        Returns: (lat2, a12 degrees on the auxiliary sphere) arrays
+        """
+        arrays = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (lat1, lon1, azi1, lon)))
+        shape = arrays[0].shape
+        lat1, lon1, azi1, lon = (x.ravel() for x in arrays)
+        line = self._line(lat1, azi1)
+        salp0, calp0 = line.salp0, line.calp0
+        c = np.abs(salp0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sig1 = np.arctan2(line.ssig1, line.csig1)
+            u1 = np.arctan2(c * line.ssig1, line.csig1)  # |omega1|, increasing with sigma
+            target = np.copysign(1.0, salp0) * np.radians(lon - lon1)
+            fa3 = -self.f * self._A3f(line.eps)
+            u = u1 + target
+            for _ in range(_MAXIT1):
+                t = np.arctan2(np.sin(u), c * np.cos(u))
+                sig = t + 2 * np.pi * np.round((u - t) / (2 * np.pi))  # Same branch as u
+                ssig, csig = np.sin(sig), np.cos(sig)
+                g = (u - u1) + c * fa3 * (sig - sig1 + (_sin_series(ssig, csig, line.C3a) - line.B31)) - target
+                dc3 = sum(2 * l * line.C3a[l] * np.cos(2 * l * sig) for l in range(1, ORDER))
+                u = u - g / (1 + fa3 * (1 - (calp0 * ssig) ** 2) * (1 + dc3))
+                if not (np.abs(g) > _TOL1).any():
+                    break
+            t = np.arctan2(np.sin(u), c * np.cos(u))
+            sig = t + 2 * np.pi * np.round((u - t) / (2 * np.pi))
+        lat2 = _atan2d(calp0 * np.sin(sig), self._f1 * np.hypot(salp0, calp0 * np.cos(sig)))
+        a12 = np.where(c > 0, np.degrees(sig - sig1), np.nan)
+        return np.where(c > 0, lat2, np.nan).reshape(shape), a12.reshape(shape)
@@ -0,0 +1,104 @@
+# geodesic_parallel_v0_1.py
+# Process-pool parallel executor for batches of geodesic calculations
+# GeographicLib's Geodesic is pure Python and CPU-bound, so large batches are
+# split into chunks across worker processes; arrays travel through shared memory.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from rhumb_v0_2 import GeodesicDirectResult, GeodesicInverseResult, Rhumb
+
+# Per-process solver, created once by the pool initializer and reused for every chunk
+_worker_rhumb = None
+
+
+def _init_worker():
+    global _worker_rhumb
+    _worker_rhumb = Rhumb()
+
+
+def _run_chunk(shm_name, n, start, stop, kind):
+    """Solve rows [start, stop) of the shared block in place (runs in a worker)."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        block = np.ndarray((7, n), dtype=np.float64, buffer=shm.buf)
+        solve = _worker_rhumb.geodesic_inverse if kind == "inverse" else _worker_rhumb.geodesic_direct
+        a, b, c, d = block[0], block[1], block[2], block[3]
+        out0, out1, out2 = block[4], block[5], block[6]
+        for i in range(start, stop):
+            out0[i], out1[i], out2[i] = solve(a[i], b[i], c[i], d[i])
+        del block, a, b, c, d, out0, out1, out2
+    finally:
+        shm.close()
+    return stop - start
+
+
+class ParallelGeodesic:
+    """
+    Parallel batch facade for Rhumb.geodesic_inverse / geodesic_direct.
+    Inputs are split into chunks of chunk_size rows and solved across a pool of
+    worker processes, which set up once and are reused until close().
+    Inputs and outputs share one shared-memory block; results come back in input order.
+    """
+
+    def __init__(self, workers=None, chunk_size=10000):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Shut down the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _run(self, kind, args, result_type):
+        arrays = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64) for x in args])
+        shape = arrays[0].shape
+        n = arrays[0].size
+        if n == 0:
+            return result_type(*(np.empty(shape) for _ in range(3)))
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+
+        shm = shared_memory.SharedMemory(create=True, size=7 * n * 8)
+        try:
+            block = np.ndarray((7, n), dtype=np.float64, buffer=shm.buf)
+            for row, values in zip(block[:4], arrays):
+                row[:] = values.ravel()
+            futures = [
+                self._pool.submit(_run_chunk, shm.name, n, start, min(start + self.chunk_size, n), kind)
+                for start in range(0, n, self.chunk_size)
+            ]
+            for future in futures:
+                future.result()
+            result = result_type(*(block[4 + k].reshape(shape).copy() for k in range(3)))
+            del block
+        finally:
+            shm.close()
+            shm.unlink()
+        return result
+
+    def inverse(self, lat1, lon1, lat2, lon2):
+        """
+        Geodesic inverse over arrays of positions (degrees, broadcast together).
+        Returns: GeodesicInverseResult with s12 (meters), azi1 and azi2 ([0°, 360°)) arrays.
+        """
+        return self._run("inverse", (lat1, lon1, lat2, lon2), GeodesicInverseResult)
+
+    def direct(self, lat1, lon1, azi1, s12):
+        """
+        Geodesic direct over arrays of start points, azimuths (degrees) and distances (meters).
+        Returns: GeodesicDirectResult with lat2, lon2 and azi2 ([0°, 360°)) arrays.
+        """
+        return self._run("direct", (lat1, lon1, azi1, s12), GeodesicDirectResult)
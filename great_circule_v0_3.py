@@ -3,39 +3,36 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import math
+from array import array
 from rhumb_v0_2 import Rhumb
+from coordinates_v0_1 import ddm_to_decimal, decimal_to_ddm, validate_inputs
+from gui_worker_v0_1 import BackgroundTask
+from virtual_text_v0_1 import VirtualText
+
+MAX_SEGMENTS = 1000000
+
+def result_header(alpha1, alpha2, segment_nm, distance_nm):
+    """Lines of the result box above the waypoint rows."""
+    return [
+        "--- Great Circle Calculation Result (WGS84 Orthodrome) ---",
+        "",
+        f"Initial Azimuth : {alpha1:6.2f}°",
+        f"Final Azimuth   : {alpha2:6.2f}°",
+        f"Segment Distance: {segment_nm:,.2f} NM",
+        f"Total Distance  : {distance_nm:,.2f} NM",
+        "",
+        "---------------- Waypoints ----------------",
+        "",
+        "    Azimuth   Latitude       Longitude",
+    ]
+
+def format_waypoint(i, az, lat, lon):
+    """One waypoint row of the result box (i counts from 0)."""
+    lat_ddm = decimal_to_ddm(lat, "N", "S", deg_digits=2)
+    lon_ddm = decimal_to_ddm(lon, "E", "W", deg_digits=3)
+    return f"{i+1:02d}: {az:6.2f}°   {lat_ddm}   {lon_ddm}"
 
 def build_gui(parent):
-    def ddm_to_decimal(degrees, minutes, hemi):
-        """Convert Degrees Decimal Minutes to decimal degrees."""
-        degrees = float(degrees)
-        minutes = float(minutes)
-        value = degrees + minutes / 60
-        if hemi in ("S", "W"):
-            value = -value
-        return value
-
-    def decimal_to_ddm(val, hemi_pos, hemi_neg, deg_digits=2):
-        """Convert decimal degrees to Degrees Decimal Minutes string."""
-        hemi = hemi_pos if val >= 0 else hemi_neg
-        abs_val = abs(val)
-        degrees = int(abs_val)
-        minutes = (abs_val - degrees) * 60
-        deg_str = str(degrees).zfill(deg_digits)
-        min_str = f"{minutes:05.2f}"
-        return f"{deg_str}° {min_str}' {hemi}"
-
-    def validate_inputs(deg_str, min_str, max_deg, label):
-        deg = float(deg_str)
-        mins = float(min_str)
-
-        if not (0 <= deg <= max_deg):
-            raise ValueError(f"{label}: Degrees must be between 0 and {max_deg}.")
-        if not (0 <= mins < 60):
-            raise ValueError(f"{label}: Minutes must be between 0 and 59.99.")
-        if deg == max_deg and mins > 0:
-            raise ValueError(f"{label}: When degrees = {max_deg}, minutes must be 0.")
-
     # Store latest calculation results for graph
     latest_azimuths = {"alpha1": None, "alpha2": None, "distance_nm": None}
 
@@ -97,14 +94,18 @@ def build_gui(parent):
     seg_frame.pack(pady=(0, 8), anchor="center")
     ttk.Label(seg_frame, text="Number of Segments:").pack(side="left", padx=(0, 8))
     segments_var = tk.StringVar(value="10")
-    segments_choices = [str(x) for x in range(10, 101, 10)]
-    segments_dropdown = ttk.Combobox(seg_frame, textvariable=segments_var, values=segments_choices, width=4, state="readonly")
+    segments_choices = [str(x) for x in range(10, 101, 10)] + ["500", "1000", "5000", "10000"]
+    segments_dropdown = ttk.Combobox(seg_frame, textvariable=segments_var, values=segments_choices, width=6)
     segments_dropdown.pack(side="left")
 
     # --- Buttons Frame ---
     btn_frame = ttk.Frame(parent)
     btn_frame.pack(pady=(5, 0))
 
+    # Progress bar and Cancel button, shown only while waypoints are being computed
+    progress = ttk.Progressbar(btn_frame, orient="horizontal", length=110, mode="determinate")
+    cancel_button = ttk.Button(btn_frame, text="Cancel")
+
     # --- Result Text with Scrollbar ---
     result_frame = ttk.Frame(parent)
     result_frame.pack(pady=10, fill="both", expand=True)
@@ -125,8 +126,71 @@ def build_gui(parent):
     result_frame.rowconfigure(0, weight=1)
     result_frame.columnconfigure(0, weight=1)
 
+    # Waypoint table of the last result; only the rows in view are formatted
+    table = {"view": None}
+
+    def show_text(message):
+        """Replace the result box with a plain message."""
+        if table["view"] is not None:
+            table["view"].detach()
+            table["view"] = None
+        result_text.config(state="normal")
+        result_text.delete("1.0", tk.END)
+        result_text.insert(tk.END, message)
+        result_text.config(state="disabled")
+
+    def compute(task, lat1, lon1, lat2, lon2, segs):
+        """Great circle solution and waypoint table (runs on the worker thread)."""
+        r = Rhumb()
+        s, alpha1, alpha2 = r.geodesic_inverse(lat1, lon1, lat2, lon2)
+
+        alpha1 = (alpha1 + 360) % 360
+        alpha2 = (alpha2 + 360) % 360
+
+        distance_nm = s / 1852.0
+        segment_len = s / segs
+        segment_nm = segment_len / 1852.0
+
+        # Compact float arrays; the rows are formatted only when scrolled into view
+        lats, lons, azs = array("d"), array("d"), array("d")
+        for i, (lat, lon, az) in enumerate(r.geodesic_waypoints(lat1, lon1, lat2, lon2, segs)):
+            if i % 256 == 0:
+                task.check()
+                task.progress(i, segs + 1)
+            lats.append(lat)
+            lons.append(lon)
+            azs.append(az)
+
+        header = result_header(alpha1, alpha2, segment_nm, distance_nm)
+        return header, (azs, lats, lons), alpha1, alpha2, distance_nm
+
+    def show_result(result):
+        """Display a finished calculation (main thread)."""
+        header, (azs, lats, lons), alpha1, alpha2, distance_nm = result
+        show_text("")
+        table["view"] = VirtualText(result_text, vscroll, header, len(azs),
+                                    lambda i: format_waypoint(i, azs[i], lats[i], lons[i]))
+
+        latest_azimuths["alpha1"] = alpha1
+        latest_azimuths["alpha2"] = alpha2
+        latest_azimuths["distance_nm"] = distance_nm
+
+    def show_error(e):
+        messagebox.showerror("Error", str(e), parent=parent)
+
+    def show_progress(done, total):
+        progress.configure(maximum=total, value=done)
+
+    def hide_progress():
+        progress.grid_remove()
+        cancel_button.grid_remove()
+
+    task = BackgroundTask(parent, show_result, on_error=show_error,
+                          on_progress=show_progress, on_finish=hide_progress)
+    cancel_button.configure(command=task.cancel)
+
     def calculate():
-        """Perform great circle calculations and update result box."""
+        """Validate inputs and start the great circle calculation on the worker thread."""
         try:
             # Validate departing
             validate_inputs(dep_lat_deg.get(), dep_lat_min.get(), 90, "Departure Latitude")
@@ -135,56 +199,29 @@ def build_gui(parent):
             validate_inputs(arr_lat_deg.get(), arr_lat_min.get(), 90, "Arrival Latitude")
             validate_inputs(arr_lon_deg.get(), arr_lon_min.get(), 180, "Arrival Longitude")
 
-            r = Rhumb()
             lat1 = ddm_to_decimal(dep_lat_deg.get(), dep_lat_min.get(), dep_lat_hemi.get())
             lon1 = ddm_to_decimal(dep_lon_deg.get(), dep_lon_min.get(), dep_lon_hemi.get())
             lat2 = ddm_to_decimal(arr_lat_deg.get(), arr_lat_min.get(), arr_lat_hemi.get())
             lon2 = ddm_to_decimal(arr_lon_deg.get(), arr_lon_min.get(), arr_lon_hemi.get())
-            segs = int(segments_var.get())
-
-            s, alpha1, alpha2 = r.geodesic_inverse(lat1, lon1, lat2, lon2)
-
-            alpha1 = (alpha1 + 360) % 360
-            alpha2 = (alpha2 + 360) % 360
-
-            distance_nm = s / 1852.0
-            segment_len = s / segs
-            segment_nm = segment_len / 1852.0
-
-            waypoints = []
-            for i in range(segs + 1):
-                d = segment_len * i
-                phi, lam, az = r.geodesic_direct(lat1, lon1, alpha1, d)
-                az = (az + 360) % 360
-                lat_ddm = decimal_to_ddm(phi, "N", "S", deg_digits=2)
-                lon_ddm = decimal_to_ddm(lam, "E", "W", deg_digits=3)
-                az_str = f"{az:6.2f}°"
-                waypoints.append(f"{i+1:02d}: {az_str}   {lat_ddm}   {lon_ddm}")
-
-            result_str = (
-                f"--- Great Circle Calculation Result (WGS84 Orthodrome) ---\n\n"
-                f"Initial Azimuth : {alpha1:6.2f}°\n"
-                f"Final Azimuth   : {alpha2:6.2f}°\n"
-                f"Segment Distance: {segment_nm:,.2f} NM\n"
-                f"Total Distance  : {distance_nm:,.2f} NM\n\n"
-                f"---------------- Waypoints ----------------\n\n"
-                f"    Azimuth   Latitude       Longitude\n"
-            )
-            result_str += "\n".join(waypoints)
-
-            result_text.config(state="normal")
-            result_text.delete("1.0", tk.END)
-            result_text.insert(tk.END, result_str)
-            result_text.config(state="disabled")
-
-            latest_azimuths["alpha1"] = alpha1
-            latest_azimuths["alpha2"] = alpha2
-            latest_azimuths["distance_nm"] = distance_nm
+            try:
+                segs = int(segments_var.get())
+            except ValueError:
+                raise ValueError("Number of segments must be a whole number.")
+            if not (1 <= segs <= MAX_SEGMENTS):
+                raise ValueError(f"Number of segments must be between 1 and {MAX_SEGMENTS:,}.")
         except Exception as e:
-            messagebox.showerror("Error", str(e), parent=parent)
+            show_error(e)
+            return
+
+        # A new click supersedes a calculation still running; its result is dropped
+        progress.configure(value=0)
+        progress.grid(row=0, column=3, padx=(10, 4))
+        cancel_button.grid(row=0, column=4)
+        task.start(compute, lat1, lon1, lat2, lon2, segs)
 
     def clear():
         """Clear inputs and reset explanation text."""
+        task.cancel()
         for e in [dep_lat_deg, dep_lat_min, dep_lon_deg, dep_lon_min,
                   arr_lat_deg, arr_lat_min, arr_lon_deg, arr_lon_min]:
             e.delete(0, tk.END)
@@ -193,10 +230,7 @@ def build_gui(parent):
         arr_lat_hemi.set("N")
         arr_lon_hemi.set("W")
         segments_var.set("10")
-        result_text.config(state="normal")
-        result_text.delete("1.0", tk.END)
-        result_text.insert(tk.END, EXPLANATION_MESSAGE)
-        result_text.config(state="disabled")
+        show_text(EXPLANATION_MESSAGE)
         latest_azimuths["alpha1"] = None
         latest_azimuths["alpha2"] = None
         latest_azimuths["distance_nm"] = None
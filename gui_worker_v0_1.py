@@ -0,0 +1,136 @@
+# gui_worker_v0_1.py
+# Runs the GUI tabs' calculations on a worker thread
+# Results come back to the Tk main thread through a queue polled with after()
+
+import queue
+import threading
+from tkinter import TclError
+
+
+class TaskCancelled(Exception):
+    """Raised by TaskContext.check() once the calculation has been cancelled or superseded."""
+
+
+class TaskContext:
+    """
+    Handed to the task function as its first argument: reports progress and
+    tells the task when it has been cancelled or superseded by a newer run.
+    """
+
+    __slots__ = ('_queue', '_generation', '_cancel')
+
+    def __init__(self, results, generation, cancel):
+        self._queue = results
+        self._generation = generation
+        self._cancel = cancel
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def check(self):
+        """Raise TaskCancelled if the run was cancelled; call it regularly in long loops."""
+        if self._cancel.is_set():
+            raise TaskCancelled()
+
+    def progress(self, done, total):
+        """Report done out of total units of work (shown by the on_progress callback)."""
+        self._queue.put((self._generation, 'progress', (done, total)))
+
+
+class BackgroundTask:
+    """
+    One calculation at a time for a GUI tab, run on a daemon worker thread.
+    start() supersedes the current run; cancel() abandons it. Every run gets a new
+    generation number and messages from older generations are dropped, so a
+    superseded or cancelled run never updates the window.
+    The callbacks run on the Tk main thread:
+    on_result(result), on_error(exception), on_progress(done, total) and
+    on_finish(), called whenever the current run ends (result, error or cancel).
+    """
+
+    def __init__(self, widget, on_result, on_error=None, on_progress=None, on_finish=None, poll_ms=50):
+        self.widget = widget
+        self.on_result = on_result
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_finish = on_finish
+        self.poll_ms = poll_ms
+        self._queue = queue.Queue()
+        self._generation = 0
+        self._cancel = None
+        self._polling = False
+
+    @property
+    def running(self):
+        return self._cancel is not None
+
+    def start(self, func, *args):
+        """
+        Run func(context, *args) on a worker thread, superseding any current run.
+        func must not touch Tk widgets; its return value goes to on_result.
+        """
+        if self._cancel is not None:
+            self._cancel.set()
+        self._generation += 1
+        self._cancel = threading.Event()
+        context = TaskContext(self._queue, self._generation, self._cancel)
+        threading.Thread(target=self._run, args=(context, func, args), daemon=True).start()
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.poll_ms, self._poll)
+
+    def cancel(self):
+        """Abandon the current run (its result is dropped) and call on_finish."""
+        if self._cancel is None:
+            return
+        self._cancel.set()
+        self._cancel = None
+        self._generation += 1
+        if self.on_finish is not None:
+            self.on_finish()
+
+    @staticmethod
+    def _run(context, func, args):
+        try:
+            message = ('result', func(context, *args))
+        except TaskCancelled:
+            message = ('cancelled', None)
+        except Exception as e:
+            message = ('error', e)
+        context._queue.put((context._generation,) + message)
+
+    def _poll(self):
+        progress = None
+        finished = None
+        while True:
+            try:
+                generation, kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._generation or self._cancel is None:
+                continue  # Stale: from a superseded or cancelled run
+            if kind == 'progress':
+                progress = payload
+            else:
+                finished = (kind, payload)
+                self._cancel = None
+
+        if finished is not None:
+            kind, payload = finished
+            if self.on_finish is not None:
+                self.on_finish()
+            if kind == 'result':
+                self.on_result(payload)
+            elif kind == 'error' and self.on_error is not None:
+                self.on_error(payload)
+        elif progress is not None and self.on_progress is not None:
+            self.on_progress(*progress)
+
+        if self._cancel is None:
+            self._polling = False
+            return
+        try:
+            self.widget.after(self.poll_ms, self._poll)
+        except TclError:  # Window closed while a run was in progress
+            self._polling = False
@@ -3,6 +3,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from rhumb_v0_2 import Rhumb
+from coordinates_v0_1 import ddm_to_decimal, decimal_to_ddm, validate_inputs
+from gui_worker_v0_1 import BackgroundTask
 import math
 
 def build_gui(parent):
@@ -78,48 +80,6 @@ def build_gui(parent):
     result_text.pack(pady=5)
 
     # ========== Utility Functions ==========
-    def ddm_to_decimal(degrees, minutes, hemi):
-        degrees = float(degrees)
-        minutes = float(minutes)
-        value = degrees + minutes / 60
-        if hemi in ("S", "W"):
-            value = -value
-        return value
-
-    def decimal_to_ddm(val, hemi_pos, hemi_neg, deg_digits=2):
-        hemi = hemi_pos if val >= 0 else hemi_neg
-        abs_val = abs(val)
-        degrees = int(abs_val)
-        minutes = (abs_val - degrees) * 60
-        deg_str = str(degrees).zfill(deg_digits)
-        min_str = f"{minutes:05.2f}"
-        return f"{deg_str}° {min_str}' {hemi}"
-
-    def validate_inputs(deg_str, min_str, max_deg, label):
-        """
-        Validate degree and minute inputs for latitude or longitude.
-
-        - Degrees must be numeric and between 0 and max_deg.
-        - Minutes must be numeric and between 0 and 60.
-        - If degrees == max_deg, minutes must be exactly 0.
-        """
-        try:
-            deg = float(deg_str)
-            mins = float(min_str)
-        except ValueError:
-            raise ValueError(f"{label}: Degrees and minutes must be numeric.")
-
-        if not (0 <= deg <= max_deg):
-            raise ValueError(f"{label}: Degrees must be between 0 and {max_deg}.")
-
-        if not (0 <= mins < 60):
-            raise ValueError(f"{label}: Minutes must be between 0 and 59,99.")
-
-        if deg == max_deg and mins != 0:
-            raise ValueError(f"{label}: If degrees are {max_deg}, minutes must be 0.")
-
-        return deg, mins
-
     def get_decimal(deg_entry, min_entry, hemi_var, max_deg, label):
         """
         Get decimal degrees after validating entries.
@@ -143,18 +103,15 @@ def build_gui(parent):
     latest_results = {"azimuth": None, "distance_nm": None}
 
     # ========== Calculate ==========
-    def calculate():
-        try:
-            # Validate and convert coordinates
-            lat1 = get_decimal(dep_lat_deg, dep_lat_min, dep_lat_hemi, 90, "Departing Latitude")
-            lon1 = get_decimal(dep_lon_deg, dep_lon_min, dep_lon_hemi, 180, "Departing Longitude")
-            lat2 = get_decimal(arr_lat_deg, arr_lat_min, arr_lat_hemi, 90, "Arriving Latitude")
-            lon2 = get_decimal(arr_lon_deg, arr_lon_min, arr_lon_hemi, 180, "Arriving Longitude")
+    def compute(task, lat1, lon1, lat2, lon2):
+        # Runs on the worker thread
+        r = Rhumb()
+        res = r.Inverse(lat1, lon1, lat2, lon2)
+        return lat1, lon1, lat2, lon2, res['s12'], res['azi12']
 
-            r = Rhumb()
-            res = r.Inverse(lat1, lon1, lat2, lon2)
-            s12 = res['s12']
-            azi12 = res['azi12']
+    def show_result(result):
+        try:
+            lat1, lon1, lat2, lon2, s12, azi12 = result
 
             distance_nm = s12 / 1852.0
             azimuth_rounded = round(azi12, 1)
@@ -185,8 +142,26 @@ def build_gui(parent):
         except Exception as e:
             messagebox.showerror("Input Error", str(e), parent=parent)
 
+    def show_error(e):
+        messagebox.showerror("Input Error", str(e), parent=parent)
+
+    task = BackgroundTask(parent, show_result, on_error=show_error)
+
+    def calculate():
+        try:
+            # Validate and convert coordinates
+            lat1 = get_decimal(dep_lat_deg, dep_lat_min, dep_lat_hemi, 90, "Departing Latitude")
+            lon1 = get_decimal(dep_lon_deg, dep_lon_min, dep_lon_hemi, 180, "Departing Longitude")
+            lat2 = get_decimal(arr_lat_deg, arr_lat_min, arr_lat_hemi, 90, "Arriving Latitude")
+            lon2 = get_decimal(arr_lon_deg, arr_lon_min, arr_lon_hemi, 180, "Arriving Longitude")
+        except Exception as e:
+            show_error(e)
+            return
+        task.start(compute, lat1, lon1, lat2, lon2)
+
     # ========== Clear ==========
     def clear():
+        task.cancel()
         for e in [dep_lat_deg, dep_lat_min, dep_lon_deg, dep_lon_min,
                   arr_lat_deg, arr_lat_min, arr_lon_deg, arr_lon_min]:
             e.delete(0, tk.END)
@@ -0,0 +1,163 @@
+# instrumentation_v0_1.py
+# Opt-in call counters, latency histograms and event counters for Rhumb,
+# with pluggable sinks (logging, in-memory snapshots, Prometheus text file)
+# Enabled per instance with Rhumb.enable_instrumentation() or Rhumb.profile()
+
+import bisect
+import logging
+import math
+import os
+import threading
+from collections import deque
+
+# Latency histogram bucket upper bounds (seconds); a final +Inf bucket is implied
+DEFAULT_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+
+class Instruments:
+    """
+    Thread-safe per-method call counters and latency histograms, plus counters for
+    rare events inside the solvers (e.g. 'dpsi_fallback', 'pole_clamp').
+    flush() hands a snapshot to every sink.
+    """
+
+    __slots__ = ('buckets', 'sinks', '_methods', '_events', '_lock')
+
+    def __init__(self, sinks=(), buckets=DEFAULT_BUCKETS):
+        buckets = tuple(float(b) for b in buckets)
+        if not buckets or any(b <= a for a, b in zip(buckets, buckets[1:])):
+            raise ValueError("Buckets must be a non-empty increasing sequence.")
+        self.buckets = buckets
+        self.sinks = list(sinks)
+        self._methods = {}
+        self._events = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method, seconds):
+        """Count one call of method that took seconds."""
+        i = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            entry = self._methods.get(method)
+            if entry is None:
+                entry = self._methods[method] = [0, 0.0, [0] * (len(self.buckets) + 1)]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2][i] += 1
+
+    def note(self, event, count=1):
+        """Count count occurrences of event."""
+        with self._lock:
+            self._events[event] = self._events.get(event, 0) + count
+
+    def reset(self):
+        """Zero all counters and histograms."""
+        with self._lock:
+            self._methods.clear()
+            self._events.clear()
+
+    def snapshot(self):
+        """
+        Return a copy of the counters:
+        {'methods': {name: {'count', 'total_seconds', 'buckets'}}, 'events': {name: count}},
+        where 'buckets' lists (upper bound in seconds, cumulative count) pairs ending at +inf.
+        """
+        bounds = self.buckets + (math.inf,)
+        with self._lock:
+            methods = {}
+            for name, (count, total, hist) in self._methods.items():
+                cumulative = []
+                running = 0
+                for bound, n in zip(bounds, hist):
+                    running += n
+                    cumulative.append((bound, running))
+                methods[name] = {'count': count, 'total_seconds': total, 'buckets': cumulative}
+            return {'methods': methods, 'events': dict(self._events)}
+
+    def flush(self):
+        """Send a snapshot to every sink. Returns: the snapshot"""
+        snap = self.snapshot()
+        for sink in self.sinks:
+            sink.emit(snap)
+        return snap
+
+
+def bucket_quantile(stats, q):
+    """
+    Upper bound (seconds) of the histogram bucket holding quantile q (0..1) of one
+    method's snapshot entry; None when it has no calls.
+    """
+    target = q * stats['count']
+    for bound, cumulative in stats['buckets']:
+        if cumulative >= target and cumulative > 0:
+            return bound
+    return None
+
+
+# =========================
+# Sinks (anything with an emit(snapshot) method)
+# =========================
+class LoggingSink:
+    """Log one line per method (calls, mean, p50 / p99 bucket) and one for the events."""
+
+    def __init__(self, logger="rhumb", level=logging.INFO):
+        self.logger = logging.getLogger(logger) if isinstance(logger, str) else logger
+        self.level = level
+
+    def emit(self, snapshot):
+        for name, stats in sorted(snapshot['methods'].items()):
+            mean = stats['total_seconds'] / stats['count']
+            self.logger.log(self.level, "%s: %d calls, mean %.3g s, p50 <= %.3g s, p99 <= %.3g s",
+                            name, stats['count'], mean,
+                            bucket_quantile(stats, 0.5), bucket_quantile(stats, 0.99))
+        if snapshot['events']:
+            events = ", ".join(f"{k}={v}" for k, v in sorted(snapshot['events'].items()))
+            self.logger.log(self.level, "events: %s", events)
+
+
+class MemorySink:
+    """Keep the emitted snapshots in memory (the most recent keep, or all if keep is None)."""
+
+    def __init__(self, keep=None):
+        self.snapshots = deque(maxlen=keep)
+
+    def emit(self, snapshot):
+        self.snapshots.append(snapshot)
+
+    @property
+    def latest(self):
+        """The last snapshot emitted, or None."""
+        return self.snapshots[-1] if self.snapshots else None
+
+
+def format_prometheus(snapshot, prefix="rhumb"):
+    """Render a snapshot in the Prometheus text exposition format."""
+    lines = [f"# HELP {prefix}_call_duration_seconds Rhumb method call latency.",
+             f"# TYPE {prefix}_call_duration_seconds histogram"]
+    for name, stats in sorted(snapshot['methods'].items()):
+        for bound, cumulative in stats['buckets']:
+            le = "+Inf" if bound == math.inf else repr(bound)
+            lines.append(f'{prefix}_call_duration_seconds_bucket{{method="{name}",le="{le}"}} {cumulative}')
+        lines.append(f'{prefix}_call_duration_seconds_sum{{method="{name}"}} {stats["total_seconds"]!r}')
+        lines.append(f'{prefix}_call_duration_seconds_count{{method="{name}"}} {stats["count"]}')
+    lines.append(f"# HELP {prefix}_events_total Rare solver branches taken.")
+    lines.append(f"# TYPE {prefix}_events_total counter")
+    for event, count in sorted(snapshot['events'].items()):
+        lines.append(f'{prefix}_events_total{{event="{event}"}} {count}')
+    return "\n".join(lines) + "\n"
+
+
+class PrometheusFileSink:
+    """
+    Write each snapshot to path in the Prometheus text format (e.g. for the node
+    exporter's textfile collector). The file is replaced atomically.
+    """
+
+    def __init__(self, path, prefix="rhumb"):
+        self.path = path
+        self.prefix = prefix
+
+    def emit(self, snapshot):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(format_prometheus(snapshot, self.prefix))
+        os.replace(tmp, self.path)
@@ -0,0 +1,145 @@
+# matrix_v0_1.py
+# Origin x destination distance / azimuth matrices, computed in tiles
+# Results go straight to a memory-mapped .npy file, so matrices larger than RAM
+# work, and a progress sidecar lets an interrupted build resume where it stopped.
+
+import hashlib
+import json
+import os
+
+import numpy as np
+from rhumb_v0_2 import Rhumb
+
+KINDS = ("rhumb", "geodesic")
+
+
+def progress_path(path):
+    """Sidecar file recording how far the build of the matrix at path has got."""
+    return f"{path}.progress.json"
+
+
+def _tiles(n, m, tile, symmetric):
+    """Tile (row, column) start pairs in build order; upper triangle only if symmetric."""
+    if symmetric:
+        return [(i, j) for i in range(0, n, tile) for j in range(i, m, tile)]
+    return [(i, j) for i in range(0, n, tile) for j in range(0, m, tile)]
+
+
+def _fingerprint(kind, tile, arrays):
+    h = hashlib.sha1(f"{kind}:{tile}".encode())
+    for a in arrays:
+        h.update(a.tobytes())
+    return h.hexdigest()
+
+
+def _save_progress(path, state):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def _solve(rhumb, kind, lat1, lon1, lat2, lon2, pool):
+    """
+    Distance, initial azimuth and final azimuth for flat arrays of pairs.
+    Rhumb lines keep one azimuth along the whole leg, so it is returned twice.
+    """
+    if kind == "rhumb":
+        s12, azi12 = rhumb.inverse_batch(lat1, lon1, lat2, lon2)
+        return s12, azi12, azi12
+    if pool is not None:
+        return pool.inverse(lat1, lon1, lat2, lon2)
+    return rhumb.geodesic_inverse_batch(lat1, lon1, lat2, lon2)
+
+
+def _reverse(s12, azi1, azi2):
+    """Azimuth of the reverse legs: the far-end azimuth turned by 180° (kept for coincident points)."""
+    return np.where(s12 == 0, azi1, (azi2 + 180) % 360)
+
+
+def build_matrix(path, lat1, lon1, lat2=None, lon2=None, kind="rhumb", tile=1024,
+                 rhumb=None, pool=None, progress=None):
+    """
+    Write the distance and azimuth matrix from every origin (lat1, lon1) to every
+    destination (lat2, lon2) to the .npy file at path, with shape (2, N, M):
+    [0] distances (meters), [1] initial azimuths (degrees, [0°, 360°)).
+    kind is "rhumb" (Rhumb.inverse_batch, same values as Rhumb.Inverse) or "geodesic"
+    (Rhumb.geodesic_inverse_batch, or pool.inverse when a ParallelGeodesic pool is given).
+    Without destinations the matrix is square over the origins and only the upper
+    triangle of tiles is solved: s(j, i) = s(i, j), and the azimuth back is the
+    reverse of the azimuth at the far end (rhumb: azi12 + 180°, geodesic: azi2 + 180°).
+    Work is done tile x tile pairs at a time; after each tile the file is flushed and
+    the sidecar progress_path(path) updated. Calling again with the same inputs
+    resumes an interrupted build; the sidecar is removed once the matrix is complete.
+    progress(done, total) is called after each tile.
+    Returns: the matrix, memory-mapped read-only
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {', '.join(KINDS)}.")
+    if tile < 1:
+        raise ValueError("Tile size must be at least 1.")
+    symmetric = lat2 is None and lon2 is None
+    lat1 = np.ascontiguousarray(lat1, dtype=np.float64).ravel()
+    lon1 = np.ascontiguousarray(lon1, dtype=np.float64).ravel()
+    if symmetric:
+        lat2, lon2 = lat1, lon1
+    elif lat2 is None or lon2 is None:
+        raise ValueError("Give both lat2 and lon2, or neither for a square matrix.")
+    else:
+        lat2 = np.ascontiguousarray(lat2, dtype=np.float64).ravel()
+        lon2 = np.ascontiguousarray(lon2, dtype=np.float64).ravel()
+    if lat1.shape != lon1.shape or lat2.shape != lon2.shape:
+        raise ValueError("Latitude and longitude arrays must have the same length.")
+    rhumb = rhumb or Rhumb()
+
+    n, m = lat1.size, lat2.size
+    tiles = _tiles(n, m, tile, symmetric)
+    sidecar = progress_path(path)
+    fingerprint = _fingerprint(kind, tile, (lat1, lon1) if symmetric else (lat1, lon1, lat2, lon2))
+    state = {"kind": kind, "tile": tile, "shape": [2, n, m], "symmetric": symmetric,
+             "fingerprint": fingerprint, "next": 0}
+
+    if os.path.exists(sidecar) and os.path.exists(path):
+        with open(sidecar, encoding="utf-8") as f:
+            saved = json.load(f)
+        if {k: v for k, v in saved.items() if k != "next"} != {k: v for k, v in state.items() if k != "next"}:
+            raise ValueError(f"{sidecar} belongs to a build with different inputs; delete it to start over.")
+        state["next"] = saved["next"]
+        out = np.lib.format.open_memmap(path, mode="r+")
+    else:
+        out = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(2, n, m))
+        _save_progress(sidecar, state)
+
+    dist, azi = out[0], out[1]
+    for k in range(state["next"], len(tiles)):
+        i0, j0 = tiles[k]
+        i1, j1 = min(i0 + tile, n), min(j0 + tile, m)
+        if symmetric and i0 == j0:
+            # Diagonal tile: solve i <= j only, mirror the rest
+            ii, jj = np.triu_indices(i1 - i0)
+            ii += i0
+            jj += j0
+            s12, azi1, azi2 = _solve(rhumb, kind, lat1[ii], lon1[ii], lat2[jj], lon2[jj], pool)
+            dist[jj, ii] = s12
+            azi[jj, ii] = _reverse(s12, azi1, azi2)
+            dist[ii, jj] = s12
+            azi[ii, jj] = azi1
+        else:
+            ii, jj = np.meshgrid(np.arange(i0, i1), np.arange(j0, j1), indexing="ij")
+            s12, azi1, azi2 = _solve(rhumb, kind, lat1[ii].ravel(), lon1[ii].ravel(),
+                                     lat2[jj].ravel(), lon2[jj].ravel(), pool)
+            shape = ii.shape
+            dist[i0:i1, j0:j1] = s12.reshape(shape)
+            azi[i0:i1, j0:j1] = azi1.reshape(shape)
+            if symmetric:
+                dist[j0:j1, i0:i1] = s12.reshape(shape).T
+                azi[j0:j1, i0:i1] = _reverse(s12, azi1, azi2).reshape(shape).T
+        out.flush()
+        state["next"] = k + 1
+        _save_progress(sidecar, state)
+        if progress is not None:
+            progress(k + 1, len(tiles))
+
+    del dist, azi, out
+    os.remove(sidecar)
+    return np.load(path, mmap_mode="r")
@@ -1,10 +1,16 @@
+import sys
+import time
+
+_start = time.perf_counter()
+
+import importlib
 import tkinter as tk
 from tkinter import ttk
 
-# Import each GUI as a function from your modules
-from heading_distance_v0_4 import build_gui as build_heading_distance_gui
-from arrival_point_calculator_v0_5 import build_gui as build_arrival_point_gui
-from great_circule_v0_3 import build_gui as build_great_circle_gui
+_imported = time.perf_counter()
+
+# Each tab's GUI module; imported and built the first time its tab is shown
+TAB_MODULES = {}
 
 root = tk.Tk()
 root.iconbitmap("compass256.ico")
@@ -27,10 +33,20 @@ notebook.add(tab1, text="| Heading & Distance Calculations |")
 notebook.add(tab2, text="| Arrival Point Calculations |")
 notebook.add(tab3, text="| Great Circle Calculations |")
 
-# Each module is responsible for populating its tab's widgets
-build_heading_distance_gui(tab1)
-build_arrival_point_gui(tab2)
-build_great_circle_gui(tab3)
+TAB_MODULES[str(tab1)] = "heading_distance_v0_4"
+TAB_MODULES[str(tab2)] = "arrival_point_calculator_v0_5"
+TAB_MODULES[str(tab3)] = "great_circule_v0_3"
+
+
+def build_tab(tab):
+    """Populate a tab from its module's build_gui the first time it is selected."""
+    module_name = TAB_MODULES.pop(str(tab), None)
+    if module_name is not None:
+        importlib.import_module(module_name).build_gui(root.nametowidget(tab))
+
+
+notebook.bind("<<NotebookTabChanged>>", lambda event: build_tab(notebook.select()))
+build_tab(notebook.select())
 
 # Author Footnote
 footer = ttk.Label(
@@ -40,4 +56,17 @@ footer = ttk.Label(
 )
 footer.pack(side="bottom", pady=(0, 5))
 
+# python navigational_suite.py --startup-time
+# prints the import time and the time until the window is first mapped, then exits
+if "--startup-time" in sys.argv[1:]:
+    def report_startup(event):
+        if event.widget is root:
+            shown = time.perf_counter()
+            print(f"imports: {(_imported - _start) * 1000:.1f} ms, "
+                  f"first window: {(shown - _start) * 1000:.1f} ms", file=sys.stderr)
+            root.unbind("<Map>")
+            root.after_idle(root.destroy)
+
+    root.bind("<Map>", report_startup)
+
 root.mainloop()
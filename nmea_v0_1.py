@@ -0,0 +1,287 @@
+# nmea_v0_1.py
+# Vectorised NMEA 0183 parser for live feeds: RMC / GGA sentences straight from
+# bytes buffers to a preallocated array of fixes, without decoding or splitting
+# Same rules and results as track_reader_v0_1.read_nmea, many sentences at a time
+
+import numpy as np
+
+# One parsed fix: POSIX time (seconds) and position (degrees)
+FIX_DTYPE = np.dtype([('time', 'f8'), ('lat', 'f8'), ('lon', 'f8')])
+
+_LF, _CR, _DOLLAR, _STAR, _COMMA, _DOT = b"\n\r$*,."
+_RMC = int.from_bytes(b"RMC", "big")
+_GGA = int.from_bytes(b"GGA", "big")
+_WIDTH = 16  # Longest numeric field looked at (ddmm.mmmm needs 9)
+_MAX_TAIL = 4096  # NMEA sentences are at most 82 characters; drop runaway garbage
+
+_HEX = np.full(256, -1, dtype=np.int16)
+for _i, _c in enumerate(b"0123456789ABCDEF"):
+    _HEX[_c] = _i
+for _i, _c in enumerate(b"abcdef"):
+    _HEX[_c] = 10 + _i
+_POW10 = 10.0 ** np.arange(_WIDTH + 1)
+
+
+# =========================
+# Field helpers (all on arrays of field bounds [b, e) into the buffer a)
+# =========================
+def _split_number(a, b, e, lead):
+    """
+    Fixed-width integer head and decimal tail of numeric fields, as
+    int(field[:lead]) and float(field[lead:]) would give them.
+    Returns: (head int64, tail float, ok bool) arrays
+    """
+    length = e - b
+    k = np.arange(_WIDTH)
+    inside = k < length[:, None]
+    ch = a[np.minimum(b[:, None] + k, a.size - 1)]
+    digit = (ch >= 48) & (ch <= 57) & inside
+    dot = (ch == _DOT) & inside
+    ok = ((length > lead) & (length <= _WIDTH) & (digit | dot | ~inside).all(axis=1)
+          & (dot.sum(axis=1) <= 1) & ~dot[:, :lead].any(axis=1))
+    value = (ch.astype(np.int64) - 48) * digit
+    head = np.zeros(b.size, dtype=np.int64)
+    for col in range(lead):
+        head = head * 10 + value[:, col]
+    mantissa = np.zeros(b.size, dtype=np.int64)
+    for col in range(lead, _WIDTH):
+        mantissa = np.where(digit[:, col], mantissa * 10 + value[:, col], mantissa)
+    has_dot = dot.any(axis=1)
+    frac = np.where(has_dot, length - 1 - np.argmax(dot, axis=1), 0)
+    ok &= digit[:, lead:].any(axis=1)
+    # Exact mantissa / exact power of ten rounds once, just like float(text)
+    tail = mantissa / _POW10[frac]
+    return head, tail, ok
+
+
+def _single(a, b, e, char):
+    """True where the field is exactly the one character char."""
+    return (e - b == 1) & (a[np.minimum(b, a.size - 1)] == char)
+
+
+def _angle(a, b, e, hb, he, deg_digits):
+    """ddmm.mmmm / dddmm.mmmm fields plus hemisphere fields to degrees. Returns: (angle, ok)"""
+    degrees, minutes, ok = _split_number(a, b, e, deg_digits)
+    ok &= minutes < 60
+    angle = degrees + minutes / 60
+    south_west = _single(a, hb, he, ord("S")) | _single(a, hb, he, ord("W"))
+    return np.where(south_west, -angle, angle), ok
+
+
+def _seconds_of_day(a, b, e):
+    hhmm, seconds, ok = _split_number(a, b, e, 4)
+    return (hhmm // 100) * 3600 + (hhmm % 100) * 60 + seconds, ok
+
+
+def _posix_day(a, b, e):
+    """POSIX time of 00:00 UTC of ddmmyy date fields (20yy). Returns: (time, ok)"""
+    ch = a[np.minimum(b[:, None] + np.arange(6), a.size - 1)].astype(np.int64) - 48
+    ok = (e - b >= 6) & ((ch >= 0) & (ch <= 9)).all(axis=1)
+    day = ch[:, 0] * 10 + ch[:, 1]
+    month = ch[:, 2] * 10 + ch[:, 3]
+    year = 2000 + ch[:, 4] * 10 + ch[:, 5]
+    ok &= (month >= 1) & (month <= 12) & (day >= 1)
+    first = (year - 1970).astype('datetime64[Y]').astype('datetime64[M]') + np.where(ok, month - 1, 0)
+    first_day = first.astype('datetime64[D]')
+    ok &= day <= ((first + 1).astype('datetime64[D]') - first_day).astype(np.int64)
+    midnight = first_day + np.where(ok, day - 1, 0)
+    return midnight.astype('datetime64[s]').astype(np.float64), ok
+
+
+# =========================
+# Parser
+# =========================
+class NmeaParser:
+    """
+    Incremental parser for a stream of NMEA 0183 bytes.
+
+    feed(data) takes any bytes-like buffer (bytes, bytearray, memoryview, mmap) and
+    works on it in place through np.frombuffer. Every complete line is handled at
+    once with array operations: sentence and field bounds come from the positions
+    of '$', '*', ',' and line ends; checksums are one bitwise_xor.reduceat over all
+    sentence bodies; ddmm.mmmm fields become degrees through an exact integer
+    mantissa, so the values are identical to float() parsing.
+
+    Accepted are RMC sentences with status A and GGA sentences with a fix, from any
+    talker. Sentences without '*' are taken unchecked. GGA carries no date, so it
+    takes the date of the last RMC and moves to the next day when the time of day
+    jumps back by more than 12 hours; a fix equal to the previous one is dropped.
+
+    Fixes are written to the preallocated self.fixes (FIX_DTYPE), which only grows
+    if one call yields more fixes than it holds. An incomplete last line is kept
+    (copied, at most one sentence) until the next feed or flush. Each call costs a
+    fixed ~100 array operations, so feed reads of a few kilobytes, not single lines.
+    """
+
+    def __init__(self, capacity=65536):
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+        self.fixes = np.empty(capacity, dtype=FIX_DTYPE)
+        self.sentences = 0  # Lines seen that start with '$'
+        self.rejected = 0  # Of those: bad checksum, malformed or unsupported
+        self._tail = b""
+        self._day = 0.0  # POSIX time of 00:00 UTC of the current date, from RMC
+        self._last_sod = np.nan
+        self._last = None
+
+    def reset(self):
+        """Forget the partial line, the current date and the last fix."""
+        self._tail = b""
+        self._day = 0.0
+        self._last_sod = np.nan
+        self._last = None
+
+    def feed(self, data):
+        """
+        Parse every complete line of data (plus any line left over from before).
+        Returns: view of self.fixes with this call's fixes, valid until the next call
+        """
+        a = np.frombuffer(data, dtype=np.uint8)
+        newlines = np.flatnonzero(a == _LF)
+        if newlines.size == 0:
+            self._keep(self._tail + a.tobytes())
+            return self.fixes[:0]
+        n = 0
+        start = 0
+        if self._tail:
+            head = np.frombuffer(self._tail + a[:newlines[0] + 1].tobytes(), dtype=np.uint8)
+            n = self._parse(head, np.flatnonzero(head == _LF), n)
+            start = newlines[0] + 1
+            newlines = newlines[1:]
+        if newlines.size:
+            n = self._parse(a[start:newlines[-1] + 1], newlines - start, n)
+        self._keep(a[newlines[-1] + 1 if newlines.size else start:].tobytes())
+        return self.fixes[:n]
+
+    def flush(self):
+        """Parse a leftover line that had no line end. Returns: view of the fixes"""
+        tail, self._tail = self._tail, b""
+        if not tail:
+            return self.fixes[:0]
+        return self.feed(tail + b"\n")
+
+    def _keep(self, tail):
+        self._tail = tail if len(tail) <= _MAX_TAIL else b""
+
+    def _parse(self, a, newlines, n):
+        """Parse the complete lines of a (ending at newlines) into self.fixes[n:]."""
+        starts = np.concatenate(([0], newlines[:-1] + 1))
+        ends = newlines - (a[np.maximum(newlines - 1, 0)] == _CR)
+        sentence = (ends > starts) & (a[np.minimum(starts, a.size - 1)] == _DOLLAR)
+        starts, ends = starts[sentence], ends[sentence]
+        count = starts.size
+        self.sentences += count
+        if count == 0:
+            return n
+
+        # Checksums: body between '$' and '*', two hex digits after '*'
+        stars = np.flatnonzero(a == _STAR)
+        j = np.searchsorted(stars, starts)
+        star = stars[np.minimum(j, stars.size - 1)] if stars.size else ends
+        has_star = (j < stars.size) & (star < ends)
+        body_end = np.where(has_star, star, ends)
+        ok = ends - starts >= 7
+        bounds = np.empty(2 * count, dtype=np.int64)
+        bounds[0::2] = np.minimum(starts + 1, body_end)
+        bounds[1::2] = body_end
+        xor = np.bitwise_xor.reduceat(a, bounds)[0::2]
+        hi = _HEX[a[np.minimum(body_end + 1, a.size - 1)]]
+        lo = _HEX[a[np.minimum(body_end + 2, a.size - 1)]]
+        two = body_end + 2 < ends
+        given = np.where(two, hi * 16 + lo, hi)
+        valid = (body_end + 1 < ends) & (hi >= 0) & (~two | (lo >= 0))
+        ok &= (body_end > starts + 1) & (~has_star | (valid & (given == xor)))
+
+        # Sentence type and field bounds: field k runs from comma k-1 to comma k
+        code = np.zeros(count, dtype=np.int64)
+        for k in (3, 4, 5):
+            code = code * 256 + a[np.minimum(starts + k, a.size - 1)]
+        commas = np.flatnonzero(a == _COMMA)
+        first = np.searchsorted(commas, starts)
+        n_commas = np.searchsorted(commas, body_end) - first
+        last = commas.size - 1
+        if commas.size:
+            ok &= commas[np.minimum(first, last)] == starts + 6  # Talker + 3-letter type
+        else:
+            ok[:] = False
+
+        def field(k, rows):
+            c = first[rows] + k
+            b = commas[np.minimum(c - 1, last)] + 1
+            e = np.where(k < n_commas[rows], commas[np.minimum(c, last)], body_end[rows])
+            return b, e
+
+        is_rmc = np.flatnonzero(ok & (code == _RMC) & (n_commas >= 9))
+        is_gga = np.flatnonzero(ok & (code == _GGA) & (n_commas >= 6))
+        rows = np.concatenate((is_rmc, is_gga))
+        sod = np.empty(rows.size)
+        lat = np.empty(rows.size)
+        lon = np.empty(rows.size)
+        date = np.full(rows.size, np.nan)
+        good = np.empty(rows.size, dtype=bool)
+
+        r = slice(0, is_rmc.size)
+        if is_rmc.size:
+            good[r] = _single(a, *field(2, is_rmc), ord("A"))
+            sod[r], t_ok = _seconds_of_day(a, *field(1, is_rmc))
+            date[r], d_ok = _posix_day(a, *field(9, is_rmc))
+            lat[r], la_ok = _angle(a, *field(3, is_rmc), *field(4, is_rmc), 2)
+            lon[r], lo_ok = _angle(a, *field(5, is_rmc), *field(6, is_rmc), 3)
+            good[r] &= t_ok & d_ok & la_ok & lo_ok
+        g = slice(is_rmc.size, rows.size)
+        if is_gga.size:
+            qb, qe = field(6, is_gga)
+            good[g] = (qe > qb) & ~_single(a, qb, qe, ord("0"))
+            sod[g], t_ok = _seconds_of_day(a, *field(1, is_gga))
+            lat[g], la_ok = _angle(a, *field(2, is_gga), *field(3, is_gga), 2)
+            lon[g], lo_ok = _angle(a, *field(4, is_gga), *field(5, is_gga), 3)
+            good[g] &= t_ok & la_ok & lo_ok
+
+        # Back to feed order, valid fixes only
+        order = np.argsort(rows, kind="stable")
+        keep = order[good[order]]
+        self.rejected += count - keep.size
+        if keep.size == 0:
+            return n
+        sod, lat, lon, date = sod[keep], lat[keep], lon[keep], date[keep]
+        rmc = ~np.isnan(date)
+
+        # Date: the last RMC's, plus a day for each backward jump of a GGA since
+        prev = np.concatenate(([self._last_sod], sod[:-1]))
+        jumps = np.cumsum(~rmc & (sod < prev - 43200))
+        source = np.maximum.accumulate(np.where(rmc, np.arange(keep.size), -1))
+        base = np.where(source >= 0, date[np.maximum(source, 0)], self._day)
+        jumps = jumps - np.where(source >= 0, jumps[np.maximum(source, 0)], 0)
+        day = base + 86400.0 * jumps
+        time = day + sod
+
+        # Drop fixes repeating the one before
+        previous = self._last if self._last is not None else (np.nan, np.nan, np.nan)
+        same = ((time == np.concatenate(([previous[0]], time[:-1])))
+                & (lat == np.concatenate(([previous[1]], lat[:-1])))
+                & (lon == np.concatenate(([previous[2]], lon[:-1]))))
+        self._day = day[-1]
+        self._last_sod = sod[-1]
+        self._last = (time[-1], lat[-1], lon[-1])
+
+        m = int(keep.size - same.sum())
+        if n + m > self.fixes.size:
+            grown = np.empty(max(n + m, 2 * self.fixes.size), dtype=FIX_DTYPE)
+            grown[:n] = self.fixes[:n]
+            self.fixes = grown
+        out = self.fixes[n:n + m]
+        out['time'] = time[~same]
+        out['lat'] = lat[~same]
+        out['lon'] = lon[~same]
+        return n + m
+
+
+def parse_nmea(data):
+    """
+    Parse a whole NMEA log held in one bytes-like buffer (e.g. a memory-mapped file).
+    Returns: new FIX_DTYPE array of the fixes
+    """
+    parser = NmeaParser(capacity=max(1, len(data) // 60))
+    fixes = parser.feed(data).copy()
+    rest = parser.flush()
+    return np.concatenate((fixes, rest)) if rest.size else fixes
@@ -0,0 +1,250 @@
+# passage_plan_v0_1.py
+# Multi-leg passage plans: chains of rhumb line legs where each leg starts where
+# the previous one ended. Legs are either dead reckoning (course and distance)
+# or waypoint legs (steer for a given position).
+
+from collections import namedtuple
+
+import numpy as np
+from rhumb_v0_2 import Rhumb
+
+COURSE, WAYPOINT = 0, 1
+
+# Solved plan, one entry per leg: end position (degrees), course (degrees),
+# leg distance and cumulative distance from the start (meters)
+PlanResult = namedtuple('PlanResult', 'lat lon course distance cumulative')
+
+
+class PassagePlan:
+    """
+    Ordered rhumb line legs from a start position, solved in vectorised runs.
+
+    A run of consecutive course legs is dead-reckoned in one pass: latitudes are
+    the cumulative sum of s * cos(course) / a (as in Rhumb.Direct), isometric
+    latitudes come from Rhumb.isometric_lat_batch, and longitude steps are summed.
+    If the chain would cross a pole, the legs up to it are kept, the clamped leg is
+    solved on its own and the run continues from there. A run of waypoint legs is
+    one Rhumb.inverse_batch call from the previous ends to the waypoints.
+
+    Edits only mark the plan stale from the edited leg; the next read recomputes
+    from there and stops after the first waypoint leg past the last edit, since a
+    waypoint re-anchors everything after it.
+    Distances are in meters, angles in degrees.
+    """
+
+    def __init__(self, lat0, lon0, rhumb=None):
+        self.rhumb = rhumb or Rhumb()
+        self._start = (float(lat0), float(lon0))
+        self._kind = []
+        self._a = []  # Course (course legs) or latitude (waypoint legs)
+        self._b = []  # Distance (course legs) or longitude (waypoint legs)
+        self._lat = np.empty(0)
+        self._lon = np.empty(0)
+        self._course = np.empty(0)
+        self._dist = np.empty(0)
+        self._cum = np.empty(0)
+        self._stale_from = None
+        self._edited_max = -1
+        self.recomputed = 0  # Legs solved by the last update (for diagnostics)
+
+    def __len__(self):
+        return len(self._kind)
+
+    # =========================
+    # Building and editing
+    # =========================
+    def _mark(self, i):
+        self._stale_from = i if self._stale_from is None else min(self._stale_from, i)
+        self._edited_max = max(self._edited_max, i)
+
+    def _insert_leg(self, i, kind, a, b):
+        n = len(self._kind)
+        if not 0 <= i <= n:
+            raise IndexError("Leg index out of range.")
+        if kind == COURSE and b < 0:
+            raise ValueError("Distance must be non-negative.")
+        self._kind.insert(i, kind)
+        self._a.insert(i, float(a))
+        self._b.insert(i, float(b))
+        for name in ('_lat', '_lon', '_course', '_dist', '_cum'):
+            setattr(self, name, np.insert(getattr(self, name), i, np.nan))
+        if self._edited_max >= i:
+            self._edited_max += 1
+        self._mark(i)
+
+    def add_course(self, course, distance):
+        """Append a dead reckoning leg: course (degrees) for distance (meters)."""
+        self._insert_leg(len(self._kind), COURSE, course, distance)
+
+    def add_waypoint(self, lat, lon):
+        """Append a leg steering for the waypoint (lat, lon)."""
+        self._insert_leg(len(self._kind), WAYPOINT, lat, lon)
+
+    def extend_courses(self, courses, distances):
+        """Append many course legs at once."""
+        courses = np.asarray(courses, dtype=float).ravel()
+        distances = np.asarray(distances, dtype=float).ravel()
+        if courses.shape != distances.shape:
+            raise ValueError("courses and distances must have the same length.")
+        if (distances < 0).any():
+            raise ValueError("Distance must be non-negative.")
+        self._extend(COURSE, courses, distances)
+
+    def extend_waypoints(self, lats, lons):
+        """Append many waypoint legs at once."""
+        lats = np.asarray(lats, dtype=float).ravel()
+        lons = np.asarray(lons, dtype=float).ravel()
+        if lats.shape != lons.shape:
+            raise ValueError("lats and lons must have the same length.")
+        self._extend(WAYPOINT, lats, lons)
+
+    def _extend(self, kind, a, b):
+        n = len(self._kind)
+        self._kind.extend([kind] * a.size)
+        self._a.extend(a.tolist())
+        self._b.extend(b.tolist())
+        pad = np.full(a.size, np.nan)
+        for name in ('_lat', '_lon', '_course', '_dist', '_cum'):
+            setattr(self, name, np.concatenate([getattr(self, name), pad]))
+        if a.size:
+            self._mark(n)
+            self._edited_max = n + a.size - 1
+
+    def insert_course(self, i, course, distance):
+        """Insert a course leg before leg i."""
+        self._insert_leg(i, COURSE, course, distance)
+
+    def insert_waypoint(self, i, lat, lon):
+        """Insert a waypoint leg before leg i."""
+        self._insert_leg(i, WAYPOINT, lat, lon)
+
+    def set_course(self, i, course, distance):
+        """Make leg i a course leg with the given course and distance."""
+        if distance < 0:
+            raise ValueError("Distance must be non-negative.")
+        self._kind[i], self._a[i], self._b[i] = COURSE, float(course), float(distance)
+        self._mark(i % len(self._kind))
+
+    def set_waypoint(self, i, lat, lon):
+        """Make leg i a waypoint leg steering for (lat, lon)."""
+        self._kind[i], self._a[i], self._b[i] = WAYPOINT, float(lat), float(lon)
+        self._mark(i % len(self._kind))
+
+    def delete_leg(self, i):
+        """Remove leg i; the next leg then starts where leg i - 1 ended."""
+        n = len(self._kind)
+        i %= n
+        del self._kind[i], self._a[i], self._b[i]
+        for name in ('_lat', '_lon', '_course', '_dist', '_cum'):
+            setattr(self, name, np.delete(getattr(self, name), i))
+        if self._edited_max > i:
+            self._edited_max -= 1
+        if i < n - 1:
+            self._mark(i)
+        elif self._stale_from is not None:
+            self._stale_from = min(self._stale_from, i)
+
+    def set_start(self, lat0, lon0):
+        """Move the departure position."""
+        self._start = (float(lat0), float(lon0))
+        if self._kind:
+            self._mark(0)
+
+    # =========================
+    # Solving
+    # =========================
+    def _solve_courses(self, lat0, lon0, courses, dists):
+        """Dead reckon a chain of course legs. Returns: (lat, lon, course) arrays."""
+        rh = self.rhumb
+        a = rh.a
+        n = courses.size
+        lat = np.empty(n)
+        lon = np.empty(n)
+        alpha = np.radians(courses)
+        sin_a, cos_a = np.sin(alpha), np.cos(alpha)
+        dphi_all = dists * cos_a / a
+        k = 0
+        while k < n:
+            phi = np.cumsum(np.concatenate(([np.radians(lat0)], dphi_all[k:])))
+            over = np.flatnonzero(np.abs(phi[1:]) > np.pi / 2)
+            stop = k + (over[0] if over.size else n - k)
+            if stop > k:
+                m = stop - k
+                phi = phi[:m + 1]
+                dphi = dphi_all[k:stop]
+                # Same E-W fallback and longitude step as Rhumb.Direct
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    dpsi = np.diff(rh.isometric_lat_batch(phi))
+                    ew = np.abs(dpsi) <= 1e-12
+                    q = np.where(ew, np.cos(phi[:-1]), dphi / np.where(ew, 1.0, dpsi))
+                    dlam = np.degrees(dists[k:stop] * sin_a[k:stop] / (a * q))
+                # A leg ending on (or leaving) the south pole has no longitude step; keep the previous lon
+                dlam[~np.isfinite(dlam)] = 0.0
+                lat[k:stop] = np.degrees(phi[1:])
+                lon[k:stop] = (lon0 + np.cumsum(dlam) + 540) % 360 - 180
+                lat0, lon0 = lat[stop - 1], lon[stop - 1]
+            if stop < n:
+                # The leg reaching the pole is clamped there; carry on from its end
+                res = rh.direct_batch(lat0, lon0, courses[stop], dists[stop])
+                lat[stop] = res.lat2
+                # direct_batch gives lon2 = nan at the south pole; keep the previous lon there
+                lon[stop] = res.lon2 if np.isfinite(res.lon2) else lon0
+                lat0, lon0 = lat[stop], lon[stop]
+                stop += 1
+            k = stop
+        return lat, lon, courses % 360
+
+    def _update(self):
+        k = self._stale_from
+        if k is None:
+            return
+        kinds = self._kind
+        n = len(kinds)
+        self.recomputed = 0
+        while k < n:
+            kind = kinds[k]
+            end = k + 1
+            while end < n and kinds[end] == kind:
+                end += 1
+            lat0, lon0 = self._start if k == 0 else (self._lat[k - 1], self._lon[k - 1])
+            a = np.array(self._a[k:end])
+            b = np.array(self._b[k:end])
+            if kind == COURSE:
+                lat, lon, course = self._solve_courses(lat0, lon0, a, b)
+                dist = b
+            else:
+                starts_lat = np.concatenate(([lat0], a[:-1]))
+                starts_lon = np.concatenate(([lon0], b[:-1]))
+                dist, course = self.rhumb.inverse_batch(starts_lat, starts_lon, a, b)
+                lat, lon = a, b
+            self._lat[k:end], self._lon[k:end] = lat, lon
+            self._course[k:end], self._dist[k:end] = course, dist
+            self.recomputed += end - k
+            k = end
+            if kind == WAYPOINT and self._edited_max < k:
+                break  # Everything after is anchored at an unchanged waypoint
+
+        s = self._stale_from
+        base = self._cum[s - 1] if s > 0 else 0.0
+        self._cum[s:] = base + np.cumsum(self._dist[s:])
+        self._stale_from = None
+        self._edited_max = -1
+
+    def solve(self):
+        """
+        Bring the plan up to date (recomputing only stale legs).
+        Returns: PlanResult of read-only arrays, one entry per leg
+        """
+        self._update()
+        arrays = []
+        for a in (self._lat, self._lon, self._course, self._dist, self._cum):
+            view = a.view()
+            view.flags.writeable = False
+            arrays.append(view)
+        return PlanResult(*arrays)
+
+    def positions(self):
+        """Start position followed by every leg's end. Returns: (lats, lons) arrays"""
+        self._update()
+        return (np.concatenate(([self._start[0]], self._lat)),
+                np.concatenate(([self._start[1]], self._lon)))
@@ -0,0 +1,245 @@
+# spatial_index_v0_1.py
+# Spatial index for k-nearest and radius queries over large sets of positions
+# Points are bucketed in a 3D grid over their unit normal vectors; a query prunes
+# whole cells and points by chord length with a conservative bound, and only the
+# survivors get an exact rhumb (Rhumb.inverse_batch) or geodesic distance.
+
+import math
+from collections import namedtuple
+
+import numpy as np
+from rhumb_v0_2 import Rhumb
+
+# A query hit: user key, distance (meters) and course from the query position (degrees)
+Neighbor = namedtuple('Neighbor', 'key s12 azi12')
+
+METRICS = ("rhumb", "geodesic")
+
+
+def unit_vectors(lat, lon):
+    """Unit normals (x, y, z) of the ellipsoid at geodetic lat, lon (degrees), shape (..., 3)."""
+    phi = np.radians(np.asarray(lat, dtype=float))
+    lam = np.radians(np.asarray(lon, dtype=float))
+    c = np.cos(phi)
+    return np.stack([c * np.cos(lam), c * np.sin(lam), np.sin(phi)], axis=-1)
+
+
+class SpatialIndex:
+    """
+    Index of keyed positions for radius and k-nearest queries with exact distances.
+
+    Pruning bound: along any path on the ellipsoid the surface normal turns by at
+    most s / M_min radians, M_min = a(1 - e²) being the smallest radius of curvature
+    (meridian at the equator). A point farther than angle r / M_min (chord
+    2 sin(angle / 2)) from the query normal is therefore more than r meters away
+    by geodesic, and so also by rhumb line, which is never shorter. The bound is
+    widened by 1% to cover the approximate rhumb distance of Rhumb.Inverse.
+
+    Bulk-loaded points live in cells sorted by cell id (CSR layout). Points inserted
+    later are kept in a small unsorted tail that every query scans, and are folded
+    into the cells when the tail grows. Deleted points are masked out and the arrays
+    are compacted once half of them are dead.
+    """
+
+    def __init__(self, metric="rhumb", rhumb=None, cell_km=100.0):
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {', '.join(METRICS)}.")
+        if cell_km <= 0:
+            raise ValueError("Cell size must be positive.")
+        self.metric = metric
+        self.rhumb = rhumb or Rhumb()
+        self._r_min = self.rhumb.a * (1 - self.rhumb._e2)
+        self._cell = cell_km * 1000 / self.rhumb.a  # Cell edge on the unit sphere
+        self._grid = int(math.ceil(2 / self._cell)) + 1
+        self._clear()
+
+    def _clear(self):
+        self._keys = []
+        self._slot_of = {}
+        self._lat = np.empty(0)
+        self._lon = np.empty(0)
+        self._xyz = np.empty((0, 3))
+        self._alive = np.empty(0, dtype=bool)
+        self._size = 0
+        self._dead = 0
+        self._indexed = 0
+        self._order = np.empty(0, dtype=np.int64)
+        self._cell_ids = np.empty(0, dtype=np.int64)
+        self._cell_start = np.zeros(1, dtype=np.int64)
+        self._cell_centers = np.empty((0, 3))
+
+    def __len__(self):
+        return self._size - self._dead
+
+    def __contains__(self, key):
+        return key in self._slot_of
+
+    # =========================
+    # Loading and updates
+    # =========================
+    def bulk_load(self, keys, lats, lons):
+        """Replace the contents with the given keyed positions (degrees) and build the cells."""
+        keys = list(keys)
+        lats = np.asarray(lats, dtype=float).ravel()
+        lons = np.asarray(lons, dtype=float).ravel()
+        if not (len(keys) == lats.size == lons.size):
+            raise ValueError("keys, lats and lons must have the same length.")
+        slot_of = {key: i for i, key in enumerate(keys)}
+        if len(slot_of) != len(keys):
+            raise ValueError("Keys must be unique.")
+        self._clear()
+        self._keys = keys
+        self._slot_of = slot_of
+        self._lat = lats.copy()
+        self._lon = lons.copy()
+        self._xyz = unit_vectors(lats, lons)
+        self._alive = np.ones(len(keys), dtype=bool)
+        self._size = len(keys)
+        self._build()
+
+    def insert(self, key, lat, lon):
+        """Add one position (or move it, if key is already present)."""
+        if key in self._slot_of:
+            self.delete(key)
+        if self._size == self._lat.size:
+            self._grow(max(16, 2 * self._size))
+        i = self._size
+        self._lat[i] = lat
+        self._lon[i] = lon
+        self._xyz[i] = unit_vectors(lat, lon)
+        self._alive[i] = True
+        self._keys.append(key)
+        self._slot_of[key] = i
+        self._size += 1
+        if self._size - self._indexed > max(1024, self._indexed // 4):
+            self._build()
+
+    def delete(self, key):
+        """Remove the position stored under key (KeyError if absent)."""
+        i = self._slot_of.pop(key)
+        self._alive[i] = False
+        self._keys[i] = None
+        self._dead += 1
+        if self._dead > max(1024, self._size // 2):
+            self._compact()
+
+    def _grow(self, capacity):
+        for name in ('_lat', '_lon', '_alive'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+        xyz = np.empty((capacity, 3))
+        xyz[:self._size] = self._xyz[:self._size]
+        self._xyz = xyz
+
+    def _compact(self):
+        live = np.flatnonzero(self._alive[:self._size])
+        keys = [self._keys[i] for i in live]
+        self._keys = keys
+        self._slot_of = {key: i for i, key in enumerate(keys)}
+        self._lat = self._lat[live]
+        self._lon = self._lon[live]
+        self._xyz = self._xyz[live]
+        self._alive = np.ones(live.size, dtype=bool)
+        self._size = live.size
+        self._dead = 0
+        self._build()
+
+    def _cell_of(self, xyz):
+        g = self._grid
+        ijk = np.floor((xyz + 1) / self._cell).astype(np.int64)
+        return (ijk[..., 0] * g + ijk[..., 1]) * g + ijk[..., 2]
+
+    def _build(self):
+        """Sort every stored point into its cell (CSR: cell ids, start offsets, slots)."""
+        n = self._size
+        cells = self._cell_of(self._xyz[:n])
+        order = np.argsort(cells, kind="stable")
+        ids, start = np.unique(cells[order], return_index=True)
+        g = self._grid
+        ijk = np.stack([ids // (g * g), ids // g % g, ids % g], axis=-1)
+        self._order = order
+        self._cell_ids = ids
+        self._cell_start = np.append(start, n).astype(np.int64)
+        self._cell_centers = (ijk + 0.5) * self._cell - 1
+        self._indexed = n
+
+    # =========================
+    # Queries
+    # =========================
+    def _chord_bound(self, radius):
+        """Chord on the unit sphere beyond which points are farther than radius meters."""
+        angle = radius / self._r_min * 1.01 + 1e-12
+        return 2.0 if angle >= math.pi else 2 * math.sin(angle / 2)
+
+    def _candidates(self, q, chord):
+        """Live slots whose normal lies within chord of q (cells pruned first)."""
+        reach = chord + self._cell * math.sqrt(3) / 2
+        near = np.flatnonzero(np.sum((self._cell_centers - q) ** 2, axis=1) <= reach * reach)
+        start = self._cell_start[near]
+        stop = self._cell_start[near + 1]
+        if near.size:
+            counts = stop - start
+            # Concatenate the slot ranges of the selected cells without a Python loop
+            offsets = np.repeat(start - np.cumsum(counts) + counts, counts)
+            slots = self._order[offsets + np.arange(counts.sum())]
+        else:
+            slots = np.empty(0, dtype=np.int64)
+        slots = np.concatenate([slots, np.arange(self._indexed, self._size)])
+        slots = slots[self._alive[slots]]
+        d2 = np.sum((self._xyz[slots] - q) ** 2, axis=1)
+        return slots[d2 <= chord * chord]
+
+    def _measure(self, lat, lon, slots):
+        """Exact distances and courses from (lat, lon) to the given slots."""
+        if self.metric == "rhumb":
+            return self.rhumb.inverse_batch(lat, lon, self._lat[slots], self._lon[slots])
+        s12, azi, _ = self.rhumb.geodesic_inverse_batch(lat, lon, self._lat[slots], self._lon[slots])
+        return s12, azi
+
+    def _hits(self, slots, s12, azi, limit=None):
+        order = np.argsort(s12, kind="stable")[:limit]
+        keys = self._keys
+        return [Neighbor(keys[i], s, a) for i, s, a in
+                zip(slots[order].tolist(), s12[order].tolist(), azi[order].tolist())]
+
+    def radius(self, lat, lon, radius):
+        """
+        Positions within radius meters of (lat, lon), nearest first.
+        Returns: list of Neighbor(key, s12 (meters), azi12 (course to it, degrees))
+        """
+        if radius < 0:
+            raise ValueError("Radius must be non-negative.")
+        slots = self._candidates(unit_vectors(lat, lon), self._chord_bound(radius))
+        s12, azi = self._measure(lat, lon, slots)
+        keep = s12 <= radius
+        return self._hits(slots[keep], s12[keep], azi[keep])
+
+    def nearest(self, lat, lon, k=1):
+        """
+        The k positions nearest to (lat, lon) (fewer if the index holds fewer).
+        Cells are taken in order of distance until they hold k points; the k-th exact
+        distance among those bounds the answer, which one radius query then completes.
+        Returns: list of Neighbor(key, s12 (meters), azi12 (course to it, degrees)), nearest first
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        if len(self) == 0:
+            return []
+        q = unit_vectors(lat, lon)
+        by_distance = np.argsort(np.sum((self._cell_centers - q) ** 2, axis=1))
+        counts = (self._cell_start[1:] - self._cell_start[:-1])[by_distance]
+        enough = int(np.searchsorted(np.cumsum(counts), k)) + 1
+        seeds = [self._order[self._cell_start[c]:self._cell_start[c + 1]] for c in by_distance[:enough]]
+        seeds.append(np.arange(self._indexed, self._size))
+        slots = np.concatenate(seeds)
+        slots = slots[self._alive[slots]]
+        if slots.size < k:  # Deleted points left too few: fall back to every live point
+            slots = np.flatnonzero(self._alive[:self._size])
+        s12, _ = self._measure(lat, lon, slots)
+        bound = np.partition(s12, min(k, s12.size) - 1)[min(k, s12.size) - 1]
+
+        slots = self._candidates(q, self._chord_bound(bound))
+        s12, azi = self._measure(lat, lon, slots)
+        return self._hits(slots, s12, azi, limit=k)
@@ -0,0 +1,64 @@
+# test_batch_calculator_v0_1.py
+import io
+import json
+import subprocess
+import sys
+import unittest
+from batch_calculator_v0_1 import process
+from rhumb_v0_2 import Rhumb
+
+class TestBatchCalculator(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rh = Rhumb()
+        print("\n================== BEGIN BATCH CALCULATOR TEST ==================")
+
+    def test_csv_rhumb_inverse_chunks(self):
+        print("\n--- CSV Rhumb Inverse: Chunked Stream ---")
+        rows = ["lat1,lon1,lat2,lon2"]
+        rows += [f"{i % 80},{i % 170},{(i * 7) % 80},{-(i % 150)}" for i in range(25)]
+        rows.append("38 42.50 N,009 08.40 W,40 36.00 N,074 00.00 W")
+        out = io.StringIO()
+        count = process(io.StringIO("\n".join(rows) + "\n"), out, "rhumb-inverse", "csv", chunk_size=7)
+        self.assertEqual(count, 26)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], "lat1,lon1,lat2,lon2,s12,azi12")
+        self.assertEqual(len(lines), 27)
+        s12 = float(lines[-1].split(",")[4])
+        ref = self.rh.Inverse(38 + 42.5 / 60, -(9 + 8.4 / 60), 40.6, -74.0)
+        self.assertAlmostEqual(s12, ref['s12'], delta=1e-6)
+
+    def test_invalid_row_reported(self):
+        print("\n--- CSV Rhumb Inverse: Invalid Row ---")
+        inp = io.StringIO("lat1,lon1,lat2,lon2\n1,2,3,4\n1,2,38 61.0 N,4\n")
+        with self.assertRaisesRegex(ValueError, "Row 2"):
+            process(inp, io.StringIO(), "rhumb-inverse", "csv")
+        # A non-finite value or a hemisphere of the wrong axis is reported, not solved into nan
+        for row in ("nan,2,3,4", "1,2,3,inf", "38 42.5 E,2,3,4", "1,012 00.0 N,3,4"):
+            inp = io.StringIO(f"lat1,lon1,lat2,lon2\n1,2,3,4\n1,2,3,4\n{row}\n")
+            with self.assertRaisesRegex(ValueError, "Row 3"):
+                process(inp, io.StringIO(), "rhumb-inverse", "csv")
+        inp = io.StringIO("lat1,lon1,azi1,s12\n0,0,45,100\n0,0,45,100\n0,0,45,nan\n")
+        with self.assertRaisesRegex(ValueError, "Row 3: invalid s12"):
+            process(inp, io.StringIO(), "geodesic-direct", "csv")
+
+    def test_ndjson_geodesic_direct_nm(self):
+        print("\n--- NDJSON Geodesic Direct: Nautical Miles ---")
+        inp = io.StringIO(json.dumps({"id": 1, "lat1": 0, "lon1": 0, "azi1": 45, "s12": 100}) + "\n")
+        out = io.StringIO()
+        process(inp, out, "geodesic-direct", "ndjson", nautical_miles=True)
+        row = json.loads(out.getvalue())
+        lat2, lon2, azi2 = self.rh.geodesic_direct(0, 0, 45, 185200)
+        self.assertEqual(row["id"], 1)
+        self.assertAlmostEqual(row["lat2"], lat2, delta=1e-12)
+        self.assertAlmostEqual(row["lon2"], lon2, delta=1e-12)
+
+    def test_no_tkinter_import(self):
+        print("\n--- Command Line: Headless Import ---")
+        code = "import sys, batch_calculator_v0_1; print('tkinter' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "False")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,45 @@
+# test_bench_rhumb_v0_2.py
+import json
+import os
+import tempfile
+import unittest
+from bench_rhumb_v0_2 import compare_results, coordinate_sets, load_results, run_suite, save_results
+from rhumb_v0_2 import Rhumb
+
+class TestBenchSuite(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        print("\n================== BEGIN BENCHMARK SUITE TEST ==================")
+
+    def test_coordinate_sets(self):
+        print("\n--- Benchmark Suite: Seeded Coordinate Sets ---")
+        sets = coordinate_sets(200, seed=3)
+        self.assertEqual(sets, coordinate_sets(200, seed=3))
+        self.assertTrue(all(abs(p[0]) >= 80 and abs(p[2]) >= 80 for p in sets["polar"]["pairs"]))
+        self.assertTrue(all(p[1] >= 170 and p[3] <= -170 for p in sets["antimeridian"]["pairs"]))
+        rh = Rhumb()
+        for data in sets.values():
+            for leg in data["legs"]:
+                self.assertLess(abs(rh.Direct(*leg).lat2), 90)
+
+    def test_json_round_trip_and_compare(self):
+        print("\n--- Benchmark Suite: JSON Results & Comparison ---")
+        records = run_suite(n=20, repeat=1, segments=(10,), routes=1)
+        names = {r["name"] for r in records}
+        self.assertIn("geodesic_waypoints[10]", names)
+        self.assertEqual(len(records), 3 * len(names))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.json")
+            save_results(path, records, n=20)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["settings"], {"n": 20})
+            baseline = load_results(path)
+        self.assertEqual(baseline, records)
+        slower = [dict(r, seconds=r["seconds"] * 2) if r["name"] == "Inverse" else r for r in records]
+        rows = compare_results(baseline, slower, threshold=1.5)
+        self.assertEqual(len(rows), len(records))
+        self.assertEqual({row[0] for row in rows if row[5]}, {"Inverse"})
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,134 @@
+# test_composite_sailing_v0_1.py
+import math
+import time
+import unittest
+import numpy as np
+from rhumb_v0_2 import Rhumb
+from composite_sailing_v0_1 import composite_batch, composite_sailing, composite_waypoints
+
+class TestCompositeSailing(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rh = Rhumb()
+        print("\n================== BEGIN COMPOSITE SAILING TEST ==================")
+
+    def test_geodesic_vertex(self):
+        print("\n--- Composite: Geodesic Vertex ---")
+        for azi in (30, 150, 210, 330):
+            v = self.rh.geodesic_vertex(40, -70, azi)
+            lat, lon, azi2 = self.rh.geodesic_direct(40, -70, azi, v.s12)
+            self.assertAlmostEqual(lat, v.lat2, delta=1e-9)
+            self.assertAlmostEqual(azi2 % 180, 90, delta=1e-9)
+            self.assertAlmostEqual(abs(v.lat2), 67.51413938, delta=1e-6)  # Same |lat| for every azimuth
+        self.assertEqual(self.rh.geodesic_vertex(40, -70, 90).s12, 0.0)
+        self.assertAlmostEqual(self.rh.geodesic_vertex(40, -70, 0).lat2, 90, delta=1e-9)
+        # The vectorized vertex agrees with the scalar one
+        azi = np.array([0.0, 30.0, 90.0, 150.0, 210.0, 270.0, 330.0])
+        res = self.rh.geodesic_vertex_batch(40, -70, azi)
+        for k, a in enumerate(azi.tolist()):
+            v = self.rh.geodesic_vertex(40, -70, a)
+            self.assertAlmostEqual(res.lat2[k], v.lat2, delta=1e-9)
+            if abs(v.lat2) < 90 - 1e-9:  # At the pole the longitude is arbitrary
+                self.assertAlmostEqual(res.lon2[k], v.lon2, delta=1e-9)
+            self.assertAlmostEqual(res.s12[k], v.s12, delta=1e-6)
+
+    def test_plain_great_circle(self):
+        print("\n--- Composite: Limit Not Reached ---")
+        res = composite_sailing(38.7, -9.1, 40.7, -74.0, 50)
+        s12, azi1, azi2 = self.rh.geodesic_inverse(38.7, -9.1, 40.7, -74.0)
+        self.assertFalse(res.composite)
+        self.assertEqual((res.s12, res.s1, res.s2, res.s3, res.azi1, res.azi2), (s12, s12, 0.0, 0.0, azi1, azi2))
+
+    def test_northern_composite(self):
+        print("\n--- Composite: Northern Limit ---")
+        a, b, limit = (49.0, -5.0), (42.0, -140.0), 55.0
+        res = composite_sailing(*a, *b, limit)
+        self.assertTrue(res.composite)
+        self.assertAlmostEqual(res.s12, res.s1 + res.s2 + res.s3, delta=1e-6)
+        self.assertGreater(res.s12, self.rh.geodesic_inverse(*a, *b).s12)
+        # First part: leaves on azi1, touches the limit heading due west
+        lat, lon, azi = self.rh.geodesic_direct(*a, res.azi1, res.s1)
+        self.assertAlmostEqual(lat, limit, delta=1e-9)
+        self.assertAlmostEqual(lon, res.lon_t1, delta=1e-9)
+        self.assertAlmostEqual(azi, 270, delta=1e-7)
+        # Last part: leaves the limit due west and arrives on azi2
+        lat, lon, azi = self.rh.geodesic_direct(res.lat_t2, res.lon_t2, 270, res.s3)
+        self.assertAlmostEqual(lat, b[0], delta=1e-9)
+        self.assertAlmostEqual(lon, b[1], delta=1e-9)
+        self.assertAlmostEqual(azi, res.azi2, delta=1e-7)
+        # Leaving / rejoining the parallel nearer the end points (the other way the
+        # geodesic parts would cross the limit) only makes the route longer
+        radius = self.rh._parallel_radius(math.radians(limit))
+        for d1, d2 in ((0.5, 0), (2, 0), (0, -0.5), (0, -2)):
+            p, q = res.lon_t1 + d1, res.lon_t2 + d2
+            s = (self.rh.geodesic_inverse(*a, limit, p).s12 + radius * math.radians(p - q)
+                 + self.rh.geodesic_inverse(limit, q, *b).s12)
+            self.assertGreater(s, res.s12)
+
+    def test_southern_composite_and_errors(self):
+        print("\n--- Composite: Southern Limit & Errors ---")
+        res = composite_sailing(-34.0, 18.0, -38.0, 145.0, 45)
+        self.assertTrue(res.composite)
+        self.assertEqual((res.lat_t1, res.lat_t2), (-45.0, -45.0))
+        self.assertLess(res.lon_t1, res.lon_t2)
+        self.assertTrue(0 < res.azi1 < 180)
+        self.assertRaises(ValueError, composite_sailing, 60.0, -5.0, 42.0, -140.0, 55)
+        self.assertRaises(ValueError, composite_sailing, 49.0, -5.0, 42.0, -140.0, 90)
+        self.assertRaises(ValueError, composite_sailing, -60.0, 18.0, -38.0, 145.0, 45)
+        self.assertRaises(ValueError, composite_sailing, math.nan, 18.0, -38.0, 145.0, 45)
+
+    def test_batch_and_waypoints(self):
+        print("\n--- Composite: Batch Sweep & Waypoints ---")
+        limits = np.array([50.0, 55.0, 60.0, 70.0, 48.0])
+        res = composite_batch(49.0, -5.0, 42.0, -140.0, limits)
+        for k, limit in enumerate(limits):
+            if limit < 49:
+                self.assertTrue(np.isnan(res.s12[k]))
+                self.assertFalse(res.composite[k])
+                continue
+            expected = composite_sailing(49.0, -5.0, 42.0, -140.0, limit)
+            np.testing.assert_allclose([f[k] for f in res[:-1]], expected[:-1], rtol=1e-12, atol=1e-6)
+            self.assertEqual(res.composite[k], expected.composite)
+        self.assertEqual(res.composite.tolist(), [True, True, True, False, False])
+
+        lats, lons, dists = composite_waypoints(49.0, -5.0, 42.0, -140.0, 55.0, 100000)
+        s12 = composite_sailing(49.0, -5.0, 42.0, -140.0, 55.0).s12
+        self.assertLessEqual(lats.max(), 55.0 + 1e-9)
+        self.assertEqual((lats[0], lons[0], dists[0]), (49.0, -5.0, 0.0))
+        self.assertAlmostEqual(lats[-1], 42.0, delta=1e-9)
+        self.assertAlmostEqual(lons[-1], -140.0, delta=1e-9)
+        self.assertAlmostEqual(dists[-1], s12, delta=1e-6)
+        self.assertLessEqual(np.diff(dists).max(), 100000)
+
+    def test_batch_sweep_matches_scalar(self):
+        print("\n--- Composite: Vectorized Sweep vs Scalar, Errors & Speed ---")
+        rng = np.random.default_rng(22)
+        n = 400
+        lat1, lat2 = rng.uniform(-60, 60, n), rng.uniform(-60, 60, n)
+        lon1, lon2 = rng.uniform(-180, 180, n), rng.uniform(-180, 180, n)
+        limits = rng.uniform(20, 70, n)
+        res = composite_batch(lat1, lon1, lat2, lon2, limits)
+        for k in range(n):
+            try:
+                expected = composite_sailing(lat1[k], lon1[k], lat2[k], lon2[k], limits[k])
+            except ValueError:
+                self.assertTrue(np.isnan(res.s12[k]) and not res.composite[k])
+                continue
+            np.testing.assert_allclose([f[k] for f in res[:-1]], expected[:-1], rtol=1e-12, atol=1e-6)
+            self.assertEqual(res.composite[k], expected.composite)
+        print(f"{res.composite.sum()} composite, {np.isnan(res.s12).sum()} without a route, of {n}")
+        self.assertTrue(res.composite.any() and np.isnan(res.s12).any() and (~res.composite).any())
+
+        # Bad arguments raise as in composite_sailing instead of giving quiet nan rows
+        self.assertRaises(ValueError, composite_batch, 49.0, -5.0, 42.0, -140.0, [55.0, 200.0])
+        self.assertRaises(ValueError, composite_batch, [49.0, np.nan], -5.0, 42.0, -140.0, 55.0)
+
+        start = time.perf_counter()
+        composite_batch(*(np.tile(a, 50) for a in (lat1, lon1, lat2, lon2, limits)))
+        rate = 50 * n / (time.perf_counter() - start)
+        print(f"{rate:.0f} combinations per second")
+        self.assertGreater(rate, 20000)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
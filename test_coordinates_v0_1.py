@@ -0,0 +1,70 @@
+# test_coordinates_v0_1.py
+import unittest
+import numpy as np
+from coordinates_v0_1 import (decimal_to_ddm, format_ddm_batch, parse_coordinate,
+                              parse_ddm_batch, validate_inputs)
+
+class TestCoordinates(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        print("\n================== BEGIN COORDINATES TEST ==================")
+
+    def test_parse_coordinate(self):
+        print("\n--- Coordinate Parsing: DDM & Decimal ---")
+        self.assertAlmostEqual(parse_coordinate("38° 42.50' N"), 38 + 42.5 / 60, delta=1e-12)
+        self.assertAlmostEqual(parse_coordinate("009 08.40 W"), -(9 + 8.4 / 60), delta=1e-12)
+        self.assertAlmostEqual(parse_coordinate("-9.14"), -9.14, delta=1e-12)
+        with self.assertRaises(ValueError):
+            parse_coordinate("38 61.0 N")
+
+    def test_validate_inputs(self):
+        print("\n--- Coordinate Validation: Degrees & Minutes ---")
+        self.assertEqual(validate_inputs("38", "42.5", 90, "Latitude"), (38.0, 42.5))
+        for deg, mins in (("91", "0"), ("10", "60"), ("90", "0.5"), ("x", "1")):
+            with self.assertRaises(ValueError):
+                validate_inputs(deg, mins, 90, "Latitude")
+
+    def test_batch_parse_matches_scalar(self):
+        print("\n--- Batch DDM Parsing: Scalar Agreement ---")
+        rng = np.random.default_rng(5)
+        values = rng.uniform(-180, 180, 1000)
+        texts = format_ddm_batch(values, "E", "W", deg_digits=3)
+        parsed = parse_ddm_batch(texts, max_deg=180)
+        for text, value in zip(texts, parsed):
+            self.assertEqual(value, parse_coordinate(text))
+        # Mixed DDM and decimal entries take the per-entry path
+        mixed = parse_ddm_batch(["38 42.5 N", "-9.5", 12.25])
+        self.assertTrue(np.allclose(mixed, [38 + 42.5 / 60, -9.5, 12.25]))
+
+    def test_batch_parse_validation(self):
+        print("\n--- Batch DDM Parsing: Validation Pass ---")
+        with self.assertRaisesRegex(ValueError, "Latitude 2: minutes"):
+            parse_ddm_batch(["10 00.0 N", "10 60.0 S"], max_deg=90, label="Latitude")
+        with self.assertRaisesRegex(ValueError, "Latitude 1: must be between -90° and 90°"):
+            parse_ddm_batch(["91 00.0 N"], max_deg=90, label="Latitude")
+        # An out-of-range decimal is a range error, not a minutes error
+        with self.assertRaisesRegex(ValueError, "Coordinate 1: must be between -90° and 90°"):
+            parse_ddm_batch(["95.5"], 90)
+        with self.assertRaises(ValueError):
+            parse_ddm_batch(["N 10"])
+        # Non-finite decimal values
+        for bad in ("nan", "inf", float("-inf")):
+            with self.assertRaisesRegex(ValueError, "Longitude 2: not a finite"):
+                parse_ddm_batch(["10.5", bad], max_deg=180, label="Longitude")
+        # Hemisphere of the wrong axis, on both the all-DDM and the mixed path
+        with self.assertRaisesRegex(ValueError, "Latitude 2: hemisphere must be N or S"):
+            parse_ddm_batch(["10 00.0 N", "38 42.5 E"], max_deg=90, label="Latitude")
+        with self.assertRaisesRegex(ValueError, "Longitude 1: hemisphere must be E or W"):
+            parse_ddm_batch(["12 00.0 n", "-9.5"], max_deg=180, label="Longitude")
+        self.assertEqual(parse_ddm_batch(["12 00.0 N", "12 00.0 E"]).tolist(), [12.0, 12.0])  # No axis given
+
+    def test_batch_format_matches_scalar(self):
+        print("\n--- Batch DDM Formatting: Scalar Agreement ---")
+        rng = np.random.default_rng(6)
+        values = np.concatenate([rng.uniform(-90, 90, 1000), [0.0, -0.0, 89.99999999]])
+        expected = [decimal_to_ddm(v, "N", "S", deg_digits=2) for v in values]
+        self.assertEqual(format_ddm_batch(values, "N", "S", deg_digits=2), expected)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
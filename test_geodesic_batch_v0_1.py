@@ -0,0 +1,122 @@
+# test_geodesic_batch_v0_1.py
+import time
+import unittest
+import numpy as np
+from geographiclib.geodesic import Geodesic
+from rhumb_v0_2 import Rhumb
+from geodesic_batch_v0_1 import GeodesicBatch
+
+UAS = 1 / 3.6e9  # One microarcsecond in degrees
+
+
+def angle_error(a, b):
+    """|a - b| in degrees, modulo 360°."""
+    return np.abs((np.asarray(a) - b + 180) % 360 - 180)
+
+
+class TestGeodesicBatch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.g = Geodesic.WGS84
+        cls.kernel = GeodesicBatch()
+        cls.rh = Rhumb()
+        # Generated test set: random pairs, a quarter of them nearly antipodal
+        rng = np.random.default_rng(2024)
+        n = 6000
+        lat1, lon1 = rng.uniform(-90, 90, n), rng.uniform(-180, 180, n)
+        lat2, lon2 = rng.uniform(-90, 90, n), rng.uniform(-180, 180, n)
+        m = n // 4
+        lat2[:m] = np.clip(-lat1[:m] + rng.normal(0, 0.5, m), -90, 90)
+        lon2[:m] = lon1[:m] + 180 + rng.normal(0, 0.5, m)
+        cls.pairs = (lat1, lon1, lat2, lon2)
+        cls.legs = (lat1, lon1, rng.uniform(-180, 180, n), rng.uniform(0, 2.5e7, n))
+        print("\n================== BEGIN GEODESIC BATCH TEST ==================")
+
+    def test_inverse_matches_geographiclib(self):
+        print("\n--- Geodesic Batch: Inverse Against GeographicLib ---")
+        s12, azi1, azi2 = self.kernel.inverse(*self.pairs)
+        ref = [self.g.Inverse(*p) for p in zip(*(a.tolist() for a in self.pairs))]
+        ds = np.abs(s12 - [r['s12'] for r in ref])
+        da1 = angle_error(azi1, [r['azi1'] for r in ref])
+        da2 = angle_error(azi2, [r['azi2'] for r in ref])
+        print(f"Max errors: s12 {ds.max() * 1e9:.2f} nm, azi1 {da1.max() / UAS:.4f} µas, azi2 {da2.max() / UAS:.4f} µas")
+        self.assertLess(ds.max(), 1e-8)  # A few ulps of 2e7 m
+        self.assertLess(da1.max(), UAS)
+        self.assertLess(da2.max(), UAS)
+
+    def test_direct_matches_geographiclib(self):
+        print("\n--- Geodesic Batch: Direct Against GeographicLib ---")
+        lat2, lon2, azi2 = self.kernel.direct(*self.legs)
+        ref = [self.g.Direct(*p) for p in zip(*(a.tolist() for a in self.legs))]
+        dlat = np.abs(lat2 - [r['lat2'] for r in ref])
+        dlon = angle_error(lon2, [r['lon2'] for r in ref])
+        dazi = angle_error(azi2, [r['azi2'] for r in ref])
+        print(f"Max errors: lat2 {dlat.max() / UAS:.4f} µas, lon2 {dlon.max() / UAS:.4f} µas, azi2 {dazi.max() / UAS:.4f} µas")
+        self.assertLess(dlat.max(), UAS)
+        self.assertLess(dlon.max(), UAS)
+        self.assertLess(dazi.max(), UAS)
+
+    def test_special_cases(self):
+        print("\n--- Geodesic Batch: Poles, Equator, Antipodes, Coincident Points ---")
+        cases = [(0, 0, 0, 179.5), (0, 0, 0, 180), (0, 0, 0.5, 179.7), (-30, 0, 30, 180),
+                 (90, 0, -90, 0), (-90, 10, 90, 50), (10, 20, 10, 20), (0, 0, 0, 0), (45, 0, 45, 180),
+                 (0, 0, 1e-12, 179.99999999), (0, 10, 0, 10.000001), (0, 720, 0, -540.5), (91, 0, 0, 0)]
+        s12, azi1, azi2 = self.kernel.inverse(*np.array(cases, dtype=float).T)
+        for k, case in enumerate(cases):
+            r = self.g.Inverse(*case)
+            np.testing.assert_allclose([s12[k], azi1[k], azi2[k]], [r['s12'], r['azi1'], r['azi2']],
+                                       rtol=1e-15, atol=1e-9, err_msg=str(case))
+        # Shapes broadcast; empty input gives empty output
+        res = self.kernel.direct([[0], [90]], 0, [0, 90, 180], 1e7)
+        self.assertEqual([a.shape for a in res], [(2, 3)] * 3)
+        self.assertEqual(self.kernel.inverse(1, 2, np.empty(0), np.empty(0))[0].shape, (0,))
+        self.assertRaises(ValueError, GeodesicBatch, 6378137, -0.01)
+
+    def test_arc_direct_and_meridian_crossings(self):
+        print("\n--- Geodesic Batch: Arc Positions & Meridian Crossings ---")
+        lat1, lon1, azi1 = (a[:2000] for a in self.legs[:3])
+        arcs = np.random.default_rng(7).uniform(0, 179, lat1.size)
+        mask = Geodesic.STANDARD | Geodesic.LONG_UNROLL
+        ref = np.array([[r['lat2'], r['lon2'], r['s12']] for r in (
+            self.g.ArcDirect(*p, mask) for p in zip(lat1.tolist(), lon1.tolist(), azi1.tolist(), arcs.tolist()))])
+        lat2, lon2, _, s12 = self.kernel.arc_direct(lat1, lon1, azi1, arcs, unroll=True)
+        self.assertLess(np.abs(lat2 - ref[:, 0]).max(), UAS)
+        self.assertLess(np.abs(lon2 - ref[:, 1]).max(), UAS)
+        self.assertLess(np.abs(s12 - ref[:, 2]).max(), 1e-7)
+        # Back from the (unrolled) longitudes to the arcs and latitudes
+        lat, a12 = self.kernel.meridian_crossings(lat1, lon1, azi1, ref[:, 1])
+        print(f"Max errors: lat {np.abs(lat - ref[:, 0]).max() / UAS:.4f} µas, arc {np.abs(a12 - arcs).max():.2e}°")
+        self.assertLess(np.abs(lat - ref[:, 0]).max(), 100 * UAS)
+        self.assertTrue(np.isnan(self.kernel.meridian_crossings(10, 0, 0, 5)[0]))  # Meridional: never crossed
+
+    def test_rhumb_batch_methods(self):
+        print("\n--- Geodesic Batch: Rhumb Wrappers And Speed ---")
+        n = 300
+        lat1, lon1, lat2, lon2 = (a[:n] for a in self.pairs)
+        res = self.rh.geodesic_inverse_batch(lat1, lon1, lat2, lon2)
+        scalar = np.array([self.rh.geodesic_inverse(*p) for p in zip(lat1.tolist(), lon1.tolist(),
+                                                                         lat2.tolist(), lon2.tolist())])
+        np.testing.assert_allclose(res.s12, scalar[:, 0], rtol=0, atol=1e-8)
+        self.assertTrue(((res.azi1 >= 0) & (res.azi1 < 360)).all())
+        self.assertLess(angle_error(res.azi1, scalar[:, 1]).max(), UAS)
+        res = self.rh.geodesic_direct_batch(*(a[:n] for a in self.legs))
+        scalar = np.array([self.rh.geodesic_direct(*p) for p in zip(*(a[:n].tolist() for a in self.legs))])
+        self.assertLess(np.abs(res.lat2 - scalar[:, 0]).max(), UAS)
+        self.assertLess(angle_error(res.azi2, scalar[:, 2]).max(), UAS)
+
+        # Per-pair cost on a batch of 10^5 against the scalar wrapper
+        big = [np.tile(a, 17)[:100000] for a in self.pairs]
+        start = time.perf_counter()
+        self.rh.geodesic_inverse_batch(*big)
+        batch = (time.perf_counter() - start) / big[0].size
+        start = time.perf_counter()
+        for p in zip(*(a[:2000].tolist() for a in big)):
+            self.rh.geodesic_inverse(*p)
+        scalar = (time.perf_counter() - start) / 2000
+        print(f"Per pair: batch {batch * 1e6:.2f} µs, scalar {scalar * 1e6:.2f} µs ({scalar / batch:.0f}x)")
+        self.assertLess(batch * 10, scalar)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
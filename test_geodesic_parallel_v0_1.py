@@ -0,0 +1,41 @@
+# test_geodesic_parallel_v0_1.py
+import unittest
+import numpy as np
+from geodesic_parallel_v0_1 import ParallelGeodesic
+from rhumb_v0_2 import Rhumb
+
+class TestParallelGeodesic(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rh = Rhumb()
+        print("\n================== BEGIN PARALLEL GEODESIC TEST ==================")
+
+    def test_inverse_and_direct_in_order(self):
+        print("\n--- Parallel Geodesic: Results in Input Order ---")
+        rng = np.random.default_rng(7)
+        n = 257
+        lat1 = rng.uniform(-80, 80, n)
+        lon1 = rng.uniform(-180, 180, n)
+        lat2 = rng.uniform(-80, 80, n)
+        lon2 = rng.uniform(-180, 180, n)
+        with ParallelGeodesic(workers=2, chunk_size=40) as pg:
+            inv = pg.inverse(lat1, lon1, lat2, lon2)
+            dirs = pg.direct(lat1, lon1, inv['azi1'], inv['s12'])
+        for i in range(n):
+            s12, azi1, azi2 = self.rh.geodesic_inverse(lat1[i], lon1[i], lat2[i], lon2[i])
+            self.assertEqual(inv['s12'][i], s12)
+            self.assertEqual(inv['azi1'][i], azi1)
+            self.assertEqual(inv['azi2'][i], azi2)
+            self.assertAlmostEqual(dirs['lat2'][i], lat2[i], delta=1e-9)
+
+    def test_empty_and_broadcast(self):
+        print("\n--- Parallel Geodesic: Empty & Broadcast Inputs ---")
+        with ParallelGeodesic(workers=1, chunk_size=2) as pg:
+            self.assertEqual(pg.inverse([], [], [], [])['s12'].shape, (0,))
+            res = pg.direct(0, 0, [0, 90, 180], 1000)
+        self.assertEqual(res['lat2'].shape, (3,))
+        self.assertAlmostEqual(res['lat2'][1], 0.0, delta=1e-9)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,42 @@
+# test_great_circule_v0_3.py
+import unittest
+from coordinates_v0_1 import format_ddm_batch
+from great_circule_v0_3 import format_waypoint, result_header
+from rhumb_v0_2 import Rhumb
+
+class TestGreatCircleTable(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rh = Rhumb()
+        print("\n================== BEGIN GREAT CIRCLE TABLE TEST ==================")
+
+    def test_rows_match_text_layout(self):
+        print("\n--- Great Circle Table: Same Layout as Joined Text ---")
+        lat1, lon1, lat2, lon2, segs = 38.7, -9.14, -33.9, 18.4, 100
+        s, alpha1, alpha2 = self.rh.geodesic_inverse(lat1, lon1, lat2, lon2)
+        lats, lons, azs = zip(*self.rh.geodesic_waypoints(lat1, lon1, lat2, lon2, segs))
+
+        # The result box as it was built before the table was virtualised
+        lat_ddms = format_ddm_batch(lats, "N", "S", deg_digits=2)
+        lon_ddms = format_ddm_batch(lons, "E", "W", deg_digits=3)
+        expected = (
+            f"--- Great Circle Calculation Result (WGS84 Orthodrome) ---\n\n"
+            f"Initial Azimuth : {alpha1:6.2f}°\n"
+            f"Final Azimuth   : {alpha2:6.2f}°\n"
+            f"Segment Distance: {s / segs / 1852.0:,.2f} NM\n"
+            f"Total Distance  : {s / 1852.0:,.2f} NM\n\n"
+            f"---------------- Waypoints ----------------\n\n"
+            f"    Azimuth   Latitude       Longitude\n"
+        ) + "\n".join(
+            f"{i+1:02d}: {az:6.2f}°   {lat_ddm}   {lon_ddm}"
+            for i, (az, lat_ddm, lon_ddm) in enumerate(zip(azs, lat_ddms, lon_ddms))
+        )
+
+        lines = result_header(alpha1, alpha2, s / segs / 1852.0, s / 1852.0)
+        lines += [format_waypoint(i, azs[i], lats[i], lons[i]) for i in range(len(azs))]
+        self.assertEqual("\n".join(lines), expected)
+        self.assertEqual(format_waypoint(9999, 90.0, 0.5, -0.5), "10000:  90.00°   00° 30.00' N   000° 30.00' W")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,100 @@
+# test_gui_worker_v0_1.py
+import threading
+import time
+import unittest
+from gui_worker_v0_1 import BackgroundTask
+
+class ManualScheduler:
+    """Stands in for a Tk widget: after() callbacks run when pump() is called."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, func):
+        self.pending.append(func)
+
+    def pump(self, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while self.pending and time.monotonic() < deadline:
+            func = self.pending.pop(0)
+            func()
+            time.sleep(0.005)
+
+class TestBackgroundTask(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        print("\n================== BEGIN GUI WORKER TEST ==================")
+
+    def make_task(self, **kwargs):
+        self.events = []
+        widget = ManualScheduler()
+        task = BackgroundTask(widget, lambda r: self.events.append(("result", r)),
+                              on_error=lambda e: self.events.append(("error", str(e))),
+                              on_progress=lambda d, t: self.events.append(("progress", d, t)),
+                              on_finish=lambda: self.events.append(("finish",)), **kwargs)
+        return widget, task
+
+    def test_result_and_progress(self):
+        print("\n--- GUI Worker: Result & Progress ---")
+        widget, task = self.make_task()
+        main = threading.get_ident()
+
+        def work(ctx, n):
+            for i in range(n):
+                ctx.check()
+                ctx.progress(i, n)
+            return threading.get_ident()
+
+        task.start(work, 1000)
+        widget.pump()
+        self.assertFalse(task.running)
+        self.assertEqual(self.events[-2], ("finish",))
+        kind, thread_id = self.events[-1]
+        self.assertEqual(kind, "result")
+        self.assertNotEqual(thread_id, main)
+
+    def test_error(self):
+        print("\n--- GUI Worker: Error ---")
+        widget, task = self.make_task()
+
+        def work(ctx):
+            raise ValueError("bad input")
+
+        task.start(work)
+        widget.pump()
+        self.assertEqual(self.events, [("finish",), ("error", "bad input")])
+
+    def test_superseded_and_cancelled_results_dropped(self):
+        print("\n--- GUI Worker: Stale Results Dropped ---")
+        widget, task = self.make_task()
+        release = threading.Event()
+
+        def slow(ctx, value):
+            release.wait(5)
+            return value
+
+        def fast(ctx, value):
+            return value
+
+        task.start(slow, "stale")
+        task.start(fast, "fresh")
+        widget.pump()
+        release.set()
+        time.sleep(0.05)
+        widget.pump()
+        self.assertEqual([e for e in self.events if e[0] == "result"], [("result", "fresh")])
+
+        self.events.clear()
+        release.clear()
+        task.start(slow, "cancelled")
+        task.cancel()
+        self.assertEqual(self.events, [("finish",)])
+        release.set()
+        time.sleep(0.05)
+        task.start(fast, "after")
+        widget.pump()
+        self.assertEqual([e for e in self.events if e[0] == "result"], [("result", "after")])
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,116 @@
+# test_instrumentation_v0_1.py
+import logging
+import math
+import os
+import tempfile
+import threading
+import unittest
+from instrumentation_v0_1 import Instruments, LoggingSink, MemorySink, PrometheusFileSink, bucket_quantile
+from rhumb_v0_2 import Rhumb
+
+class _BlockingRhumb(Rhumb):
+    """Rhumb whose Inverse waits until released, to disable instrumentation mid-call."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def Inverse(self, *args):
+        self.entered.set()
+        self.release.wait(5)
+        return super().Inverse(*args)
+
+class TestInstrumentation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        print("\n================== BEGIN INSTRUMENTATION TEST ==================")
+
+    def test_disabled_runs_plain_methods(self):
+        print("\n--- Instrumentation: Plain Methods When Disabled ---")
+        rh = Rhumb()
+        self.assertIs(type(rh), Rhumb)
+        self.assertIsNone(rh.instrumentation_snapshot())
+        rh.enable_instrumentation()
+        self.assertIsNot(type(rh), Rhumb)
+        self.assertEqual(rh.Inverse(0, 0, 1, 1), Rhumb().Inverse(0, 0, 1, 1))
+        snap = rh.disable_instrumentation()
+        self.assertIs(type(rh), Rhumb)
+        self.assertEqual(snap['methods']['Inverse']['count'], 1)
+        self.assertIsNone(rh.disable_instrumentation())
+
+    def test_counters_histograms_and_events(self):
+        print("\n--- Instrumentation: Counters, Histograms & Events ---")
+        rh = Rhumb()
+        inst = rh.enable_instrumentation()
+        for i in range(50):
+            rh.Inverse(10, 0, 11, i)
+        rh.Inverse(10, 0, 10, 5)            # E-W course: dpsi fallback
+        rh.Direct(89.5, 0, 0, 1e6)          # Pole clamp
+        rh.exact_direct(-89.5, 0, 180, 1e6)  # Pole clamp
+        rh.direct_batch([89.5, 0, 0], [0, 0, 0], [0, 90, 0], [1e6, 1e3, 1e3])
+        snap = inst.snapshot()
+        inv = snap['methods']['Inverse']
+        self.assertEqual(inv['count'], 51)
+        self.assertEqual(inv['buckets'][-1], (math.inf, 51))
+        self.assertGreater(inv['total_seconds'], 0)
+        self.assertIsNotNone(bucket_quantile(inv, 0.99))
+        self.assertEqual(snap['methods']['direct_batch']['count'], 1)
+        self.assertEqual(snap['events'], {'dpsi_fallback': 2, 'pole_clamp': 3})
+        rh.disable_instrumentation()
+
+    def test_profile_block_and_sinks(self):
+        print("\n--- Instrumentation: Profile Block & Sinks ---")
+        rh = Rhumb()
+        memory = MemorySink()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "rhumb.prom")
+            with self.assertLogs("rhumb", logging.INFO) as logs:
+                with rh.profile([memory, LoggingSink(), PrometheusFileSink(path)]):
+                    rh.geodesic_inverse(0, 0, 1, 1)
+                    rh.Direct(0, 0, 90, 1000)
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        self.assertIs(type(rh), Rhumb)
+        self.assertEqual(memory.latest['methods']['geodesic_inverse']['count'], 1)
+        self.assertIn('rhumb_call_duration_seconds_count{method="Direct"} 1', text)
+        self.assertIn('rhumb_call_duration_seconds_bucket{method="Direct",le="+Inf"} 1', text)
+        self.assertTrue(any("geodesic_inverse: 1 calls" in line for line in logs.output))
+
+    def test_nested_profile_restores_previous(self):
+        print("\n--- Instrumentation: Nested Profile ---")
+        rh = Rhumb()
+        outer = rh.enable_instrumentation()
+        rh.Inverse(0, 0, 1, 1)
+        with rh.profile() as inner:
+            rh.Inverse(0, 0, 2, 2)
+        rh.Inverse(0, 0, 3, 3)
+        self.assertEqual(inner.snapshot()['methods']['Inverse']['count'], 1)
+        self.assertEqual(outer.snapshot()['methods']['Inverse']['count'], 2)
+        rh.disable_instrumentation()
+        with self.assertRaises(ValueError):
+            Instruments(buckets=(1e-3, 1e-4))
+
+    def test_disable_during_call(self):
+        print("\n--- Instrumentation: Disable During Call ---")
+        rh = _BlockingRhumb()
+        inst = rh.enable_instrumentation()
+        errors = []
+        def call():
+            try:
+                rh.Inverse(10, 0, 10, 5)    # E-W course: notes dpsi_fallback after disable
+            except Exception as exc:
+                errors.append(exc)
+        worker = threading.Thread(target=call)
+        worker.start()
+        self.assertTrue(rh.entered.wait(5))
+        rh.disable_instrumentation()
+        rh.release.set()
+        worker.join(5)
+        self.assertEqual(errors, [])
+        self.assertIs(type(rh), _BlockingRhumb)
+        self.assertEqual(inst.snapshot()['methods']['Inverse']['count'], 1)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,69 @@
+# test_matrix_v0_1.py
+import os
+import tempfile
+import unittest
+import numpy as np
+from matrix_v0_1 import build_matrix, progress_path
+from rhumb_v0_2 import Rhumb
+
+class Interrupt(Exception):
+    pass
+
+class TestMatrix(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rh = Rhumb()
+        rng = np.random.default_rng(11)
+        cls.lat = rng.uniform(-80, 80, 45)
+        cls.lon = rng.uniform(-180, 180, 45)
+        cls.lat[3], cls.lon[3] = cls.lat[4], cls.lon[4]  # Coincident points
+        print("\n================== BEGIN MATRIX TEST ==================")
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "matrix.npy")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assert_matches(self, m, solve, lat1, lon1, lat2, lon2):
+        for i in range(len(lat1)):
+            for j in range(len(lat2)):
+                res = solve(lat1[i], lon1[i], lat2[j], lon2[j])
+                self.assertAlmostEqual(m[0, i, j], res[0], delta=1e-6)
+                self.assertAlmostEqual((m[1, i, j] - res[1] + 180) % 360 - 180, 0, delta=1e-9)
+
+    def test_square_rhumb_matches_inverse(self):
+        print("\n--- Matrix: Square Rhumb (Symmetry) vs Inverse ---")
+        m = build_matrix(self.path, self.lat, self.lon, tile=16)
+        self.assertEqual(m.shape, (2, 45, 45))
+        self.assert_matches(m, self.rh.Inverse, self.lat, self.lon, self.lat, self.lon)
+        self.assertFalse(os.path.exists(progress_path(self.path)))
+
+    def test_rectangular_and_geodesic(self):
+        print("\n--- Matrix: Rectangular Rhumb & Square Geodesic ---")
+        m = build_matrix(self.path, self.lat[:7], self.lon[:7], self.lat[10:30], self.lon[10:30], tile=6)
+        self.assert_matches(m, self.rh.Inverse, self.lat[:7], self.lon[:7], self.lat[10:30], self.lon[10:30])
+        m = build_matrix(self.path, self.lat[:12], self.lon[:12], kind="geodesic", tile=5)
+        self.assert_matches(m, self.rh.geodesic_inverse, self.lat[:12], self.lon[:12], self.lat[:12], self.lon[:12])
+
+    def test_resume_after_interruption(self):
+        print("\n--- Matrix: Resume an Interrupted Build ---")
+        def stop_after_three(done, total):
+            if done == 3:
+                raise Interrupt()
+        with self.assertRaises(Interrupt):
+            build_matrix(self.path, self.lat, self.lon, tile=10, progress=stop_after_three)
+        self.assertTrue(os.path.exists(progress_path(self.path)))
+
+        with self.assertRaises(ValueError):
+            build_matrix(self.path, self.lat, self.lon, tile=8)
+
+        calls = []
+        m = build_matrix(self.path, self.lat, self.lon, tile=10, progress=lambda d, t: calls.append(d))
+        self.assertEqual(calls, [4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15])
+        self.assert_matches(m, self.rh.Inverse, self.lat, self.lon, self.lat, self.lon)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
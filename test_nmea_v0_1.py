@@ -0,0 +1,100 @@
+# test_nmea_v0_1.py
+import random
+import unittest
+import numpy as np
+from nmea_v0_1 import FIX_DTYPE, NmeaParser, parse_nmea
+from track_reader_v0_1 import read_nmea
+
+def with_checksum(body):
+    value = 0
+    for ch in body.encode("ascii"):
+        value ^= ch
+    return f"${body}*{value:02X}"
+
+def random_log(n, seed=7):
+    """Mixed RMC / GGA log with some corrupted and truncated sentences."""
+    rng = random.Random(seed)
+    lines = []
+    t = 86000
+    for _ in range(n):
+        t = (t + 1) % 86400
+        hhmmss = f"{t // 3600:02d}{t // 60 % 60:02d}{t % 60:02d}"
+        lat = f"{rng.randint(0, 89):02d}{rng.uniform(0, 59.9999):07.4f},{rng.choice('NS')}"
+        lon = f"{rng.randint(0, 179):03d}{rng.uniform(0, 59.9999):07.4f},{rng.choice('EW')}"
+        if rng.random() < 0.3:
+            body = f"GPRMC,{hhmmss}.00,{rng.choice('AAV')},{lat},{lon},5.0,45.0,{rng.randint(1, 28):02d}0524,,,A"
+        else:
+            body = f"GNGGA,{hhmmss}.50,{lat},{lon},{rng.choice('0111')},08,0.9,10.0,M,50.0,M,,"
+        line = with_checksum(body)
+        r = rng.random()
+        if r < 0.02:
+            line = line[:-2] + "00"
+        elif r < 0.04:
+            line = line[:rng.randint(1, len(line) - 1)]
+        lines.append(line)
+    return "\r\n".join(lines).encode("ascii")
+
+class TestNmea(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.log = random_log(5000)
+        cls.expected = np.array([tuple(f) for f in read_nmea(cls.log.splitlines())], dtype=FIX_DTYPE)
+        print("\n================== BEGIN NMEA PARSER TEST ==================")
+
+    def test_matches_track_reader(self):
+        print("\n--- NMEA: Same Fixes as read_nmea ---")
+        fixes = parse_nmea(self.log)
+        self.assertGreater(fixes.size, 3000)
+        self.assertTrue(np.array_equal(fixes, self.expected))
+
+    def test_streaming_chunks(self):
+        print("\n--- NMEA: Streaming in Arbitrary Chunks ---")
+        parser = NmeaParser(capacity=16)
+        view = memoryview(self.log)
+        parts = []
+        for k in range(0, len(view), 997):
+            parts.append(parser.feed(view[k:k + 997]).copy())
+        parts.append(parser.flush().copy())
+        self.assertTrue(np.array_equal(np.concatenate(parts), self.expected))
+        self.assertEqual(parser.sentences, 5000)
+        self.assertLessEqual(parser.rejected, 5000 - self.expected.size)
+
+    def test_sentence_rules(self):
+        print("\n--- NMEA: Checksums, Fields and Dates ---")
+        lines = [
+            with_checksum("GPRMC,235950.00,A,3842.5000,N,00908.4000,W,5.0,45.0,290224,,,A"),
+            with_checksum("GPGGA,235950.00,3842.5000,N,00908.4000,W,1,08,0.9,10.0,M,50.0,M,,"),  # Same fix
+            with_checksum("GNGGA,000010.00,3842.5100,N,00908.3900,W,1,08,0.9,10.0,M,50.0,M,,"),  # Past midnight
+            "$GPGGA,000020.00,3842.5200,N,00908.3800,W,1,08,0.9,10.0,M,50.0,M,,*00",  # Bad checksum
+            "$GPGGA,000020.00,3842.5200,N,00908.3800,W,1,08,0.9,10.0,M,50.0,M,,*",  # Empty checksum
+            with_checksum("GPRMC,000030.00,A,3842.5200,N,00908.3800,W,5.0,45.0,300224,,,A"),  # No such date
+            with_checksum("GPRMC,000030.00,A,3862.5200,N,00908.3800,W,5.0,45.0,010324,,,A"),  # 62 minutes
+            with_checksum("GPRMCX,000030.00,A,3842.5200,N,00908.3800,W,5.0,45.0,010324,,,A"),
+            "$GPRMC,000050.00,A,3842.5400,S,00908.3600,E,5.0,45.0,010324,,,A",  # No checksum
+            "",
+            "garbage",
+        ]
+        fixes = parse_nmea("\n".join(lines).encode())
+        self.assertEqual(fixes.size, 3)
+        self.assertEqual(fixes['lat'][0], 38 + 42.5 / 60)
+        self.assertEqual(fixes['lon'][0], -(9 + 8.4 / 60))
+        self.assertEqual(fixes['time'][0], 1709251190.0)  # 2024-02-29 23:59:50 UTC
+        self.assertEqual(list(fixes['time'] - fixes['time'][0]), [0.0, 20.0, 60.0])
+        self.assertEqual((fixes['lat'][2] > 0, fixes['lon'][2] > 0), (False, True))
+
+    def test_preallocated_output(self):
+        print("\n--- NMEA: Preallocated Output ---")
+        parser = NmeaParser(capacity=4)
+        buffer = parser.fixes
+        line = with_checksum("GPGGA,120000.00,3842.5000,N,00908.4000,W,1,08,0.9,10.0,M,50.0,M,,") + "\r\n"
+        out = parser.feed(line.encode())
+        self.assertEqual(out.size, 1)
+        self.assertIs(out.base, buffer)
+        out = parser.feed(self.log)  # More fixes than capacity: the buffer grows
+        self.assertGreater(out.size, 4)
+        self.assertEqual(parser.feed(b"$GPGGA,1200").size, 0)
+        self.assertRaises(ValueError, NmeaParser, 0)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,116 @@
+# test_passage_plan_v0_1.py
+import unittest
+import numpy as np
+from passage_plan_v0_1 import PassagePlan
+from rhumb_v0_2 import Rhumb
+
+class TestPassagePlan(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rh = Rhumb()
+        print("\n================== BEGIN PASSAGE PLAN TEST ==================")
+
+    def sequential(self, legs, lat, lon):
+        """Leg by leg with the scalar solvers: (lat, lon, course, distance) per leg."""
+        out = []
+        for kind, a, b in legs:
+            if kind == "course":
+                lat, lon, course = self.rh.Direct(lat, lon, a, b)
+                out.append((lat, lon, course, b))
+            else:
+                s12, azi12 = self.rh.Inverse(lat, lon, a, b)
+                lat, lon = a, b
+                out.append((lat, lon, azi12, s12))
+        return np.array(out)
+
+    def assert_plan(self, plan, legs, start):
+        res = plan.solve()
+        expected = self.sequential(legs, *start)
+        self.assertTrue(np.allclose(res.lat, expected[:, 0], atol=1e-9))
+        self.assertTrue(np.allclose((res.lon - expected[:, 1] + 180) % 360 - 180, 0, atol=1e-9))
+        self.assertTrue(np.allclose((res.course - expected[:, 2] + 180) % 360 - 180, 0, atol=1e-9))
+        self.assertTrue(np.allclose(res.distance, expected[:, 3], atol=1e-5))
+        self.assertTrue(np.allclose(res.cumulative, np.cumsum(expected[:, 3]), atol=1e-4))
+
+    def random_legs(self, n, seed):
+        rng = np.random.default_rng(seed)
+        legs = []
+        for _ in range(n):
+            if rng.random() < 0.2:
+                legs.append(("waypoint", rng.uniform(-60, 60), rng.uniform(-180, 180)))
+            else:
+                legs.append(("course", rng.uniform(0, 360), rng.uniform(0, 3e5)))
+        return legs
+
+    def build(self, legs, start):
+        plan = PassagePlan(*start)
+        for kind, a, b in legs:
+            (plan.add_course if kind == "course" else plan.add_waypoint)(a, b)
+        return plan
+
+    def test_matches_sequential_legs(self):
+        print("\n--- Passage Plan: Vectorised vs Leg-by-Leg ---")
+        legs = self.random_legs(400, 1)
+        plan = self.build(legs, (38.7, -9.1))
+        self.assert_plan(plan, legs, (38.7, -9.1))
+        self.assertEqual(plan.recomputed, 400)
+        lats, lons = plan.positions()
+        self.assertEqual((lats[0], lons[0], lats.size), (38.7, -9.1, 401))
+
+    def test_bulk_courses_and_pole_clamp(self):
+        print("\n--- Passage Plan: Bulk Courses & Pole Clamp ---")
+        legs = [("course", 0, 2e5)] * 3 + [("course", 10, 1e6), ("course", 180, 3e5), ("course", 200, 1e5)]
+        plan = PassagePlan(85, 0)
+        plan.extend_courses([c for _, c, _ in legs], [s for _, _, s in legs])
+        res = plan.solve()
+        self.assertEqual(res.lat[2], 90.0)
+        self.assertEqual(res.lat[3], 90.0)
+        self.assertAlmostEqual(res.lat[4], 90 - np.degrees(3e5 / self.rh.a), delta=1e-9)
+        self.assert_plan(plan, legs, (85, 0))
+
+    def test_south_pole_keeps_longitude(self):
+        print("\n--- Passage Plan: Leg Through the South Pole ---")
+        plan = PassagePlan(-89.9, 10)
+        plan.add_course(180, 50000)             # Overshoots and is clamped to the pole
+        plan.add_course(0, 1000)
+        plan.extend_courses([180, 0], [1000, 1000])  # Back onto the pole, then away from it
+        plan.add_course(90, 1000)
+        res = plan.solve()
+        self.assertTrue(np.isfinite(res.lon).all())
+        self.assertEqual((res.lat[0], res.lat[2]), (-90.0, -90.0))
+        self.assertEqual(list(res.lon[:4]), [10.0] * 4)
+        lat, lon, _ = self.rh.Direct(res.lat[3], res.lon[3], 90, 1000)
+        self.assertAlmostEqual(res.lon[4], lon, delta=1e-9)
+
+    def test_edits_recompute_downstream_only(self):
+        print("\n--- Passage Plan: Edits Recompute Downstream Only ---")
+        legs = [("course", 45, 1e4)] * 50 + [("waypoint", 10.0, 10.0)] + [("course", 90, 1e4)] * 49
+        plan = self.build(legs, (0, 0))
+        plan.solve()
+
+        plan.set_course(40, 50, 2e4)
+        legs[40] = ("course", 50, 2e4)
+        self.assert_plan(plan, legs, (0, 0))
+        self.assertEqual(plan.recomputed, 11)  # Legs 40..49 and the waypoint leg
+
+        plan.set_course(60, 0, 5e3)
+        legs[60] = ("course", 0, 5e3)
+        self.assert_plan(plan, legs, (0, 0))
+        self.assertEqual(plan.recomputed, 40)
+
+        plan.insert_waypoint(10, 1.0, 1.0)
+        legs.insert(10, ("waypoint", 1.0, 1.0))
+        plan.delete_leg(30)
+        del legs[30]
+        self.assert_plan(plan, legs, (0, 0))
+        self.assertEqual(plan.recomputed, 41)  # Legs 10..50
+
+        plan.set_start(1, 1)
+        self.assert_plan(plan, legs, (1, 1))
+        self.assertEqual(plan.recomputed, 11)
+        plan.solve()
+        self.assertEqual(plan.recomputed, 11)  # Up to date: nothing recomputed
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,6 +1,11 @@
 # test_rhumb_v0_3.py
+import math
+import subprocess
+import sys
+import threading
 import unittest
-from rhumb_v0_2 import Rhumb
+import numpy as np
+from rhumb_v0_2 import TIERS, Rhumb
 
 class TestRhumb(unittest.TestCase):
 
@@ -46,6 +51,56 @@ class TestRhumb(unittest.TestCase):
         self.assertAlmostEqual(distance_nm, 0.0, delta=0.01)
         self.assertAlmostEqual(azimuth, 0.0, delta=0.1)
 
+    def test_rhumb_inverse_batch_matches_scalar(self):
+        print("\n--- Rhumb Inverse Batch Test: Scalar Agreement ---")
+        rng = np.random.default_rng(12345)
+        n = 2000
+        lat1 = rng.uniform(-89.9, 89.9, n)
+        lon1 = rng.uniform(-180, 180, n)
+        lat2 = rng.uniform(-89.9, 89.9, n)
+        lon2 = rng.uniform(-180, 180, n)
+        # Edge cases: identical points, E-W courses, antimeridian, meridian, north pole
+        lat2[:10] = lat1[:10]; lon2[:10] = lon1[:10]
+        lat2[10:20] = lat1[10:20]
+        lon1[20:30] = 179.5; lon2[20:30] = -179.5
+        lon2[30:40] = lon1[30:40]
+        lat2[40:45] = 90.0
+        res = self.rh.inverse_batch(lat1, lon1, lat2, lon2)
+        for i in range(n):
+            ref = self.rh.Inverse(lat1[i], lon1[i], lat2[i], lon2[i])
+            self.assertAlmostEqual(res['s12'][i], ref['s12'], delta=1e-6)
+            self.assertAlmostEqual(res['azi12'][i], ref['azi12'], delta=1e-9)
+        print(f"Checked {n} pairs against scalar Inverse\n")
+
+    def test_rhumb_inverse_batch_buffers(self):
+        print("\n--- Rhumb Inverse Batch Test: Lists & Scalars ---")
+        res = self.rh.inverse_batch([0, 10], [0, 20], [0, 10], [90, 20])
+        self.assertAlmostEqual(res['s12'][0], self.rh.Inverse(0, 0, 0, 90)['s12'], delta=1e-6)
+        self.assertEqual(res['s12'][1], 0.0)
+        self.assertEqual(res['azi12'][1], 0.0)
+
+    def test_rhumb_direct_batch_matches_scalar(self):
+        print("\n--- Rhumb Direct Batch Test: Scalar Agreement ---")
+        rng = np.random.default_rng(54321)
+        n = 2000
+        lat1 = rng.uniform(-60.0, 89.0, n)
+        lon1 = rng.uniform(-180, 180, n)
+        azi12 = rng.uniform(0, 360, n)
+        s12 = rng.uniform(0, 3e6, n)
+        # Edge cases: E-W courses, zero distance, pole overshoot, antimeridian
+        azi12[:10] = 90.0; azi12[10:20] = 270.0
+        s12[20:30] = 0.0
+        lat1[30:40] = 85.0; azi12[30:40] = 10.0; s12[30:40] = 2e6
+        lon1[40:50] = 179.9; azi12[40:50] = 80.0
+        res = self.rh.direct_batch(lat1, lon1, azi12, s12)
+        for i in range(n):
+            ref = self.rh.Direct(lat1[i], lon1[i], azi12[i], s12[i])
+            self.assertAlmostEqual(res['lat2'][i], ref['lat2'], delta=1e-9)
+            dlon = (res['lon2'][i] - ref['lon2'] + 180) % 360 - 180
+            self.assertAlmostEqual(dlon, 0.0, delta=1e-9)
+            self.assertAlmostEqual(res['azi12'][i], ref['azi12'], delta=1e-12)
+        print(f"Checked {n} legs against scalar Direct\n")
+
     def test_geodesic_inverse_equator(self):
         print("\n--- Geodesic Inverse Test: Equator ---")
         s12, a1, a2 = self.rh.geodesic_inverse(0, 0, 0, 90)
@@ -95,5 +150,242 @@ class TestRhumb(unittest.TestCase):
         self.print_comparison("Final Latitude", lat2, 6.4, "°")
         self.assertAlmostEqual(lat2, 6.4, delta=0.5)
 
+    def test_geodesic_waypoints_match_direct(self):
+        print("\n--- Geodesic Waypoints Test: Single Line vs Direct ---")
+        lat1, lon1, lat2, lon2 = 38.7, -9.1, 40.6, -74.0
+        s12, azi1, _ = self.rh.geodesic_inverse(lat1, lon1, lat2, lon2)
+        waypoints = list(self.rh.geodesic_waypoints(lat1, lon1, lat2, lon2, 20))
+        self.assertEqual(len(waypoints), 21)
+        for i, (lat, lon, azi) in enumerate(waypoints):
+            ref_lat, ref_lon, ref_azi = self.rh.geodesic_direct(lat1, lon1, azi1, s12 * i / 20)
+            self.assertAlmostEqual(lat, ref_lat, delta=1e-9)
+            self.assertAlmostEqual(lon, ref_lon, delta=1e-9)
+            self.assertAlmostEqual(azi, ref_azi, delta=1e-9)
+        self.assertAlmostEqual(waypoints[-1][0], lat2, delta=1e-9)
+        self.assertAlmostEqual(waypoints[-1][1], lon2, delta=1e-9)
+
+    def test_geodesic_waypoints_lazy(self):
+        print("\n--- Geodesic Waypoints Test: Lazy Generation ---")
+        gen = self.rh.geodesic_waypoints(0, 0, 10, 20, 10**9)
+        first = next(gen)
+        self.assertAlmostEqual(first[0], 0.0, delta=1e-12)
+        self.assertAlmostEqual(first[1], 0.0, delta=1e-12)
+        with self.assertRaises(ValueError):
+            next(self.rh.geodesic_waypoints(0, 0, 10, 20, 0))
+
+    def test_cache_hits_misses_evictions(self):
+        print("\n--- Result Cache Test: Counters & Eviction ---")
+        rh = Rhumb()
+        self.assertIsNone(rh.cache_info())
+        rh.enable_cache(maxsize=2, quantum=1e-6)
+        ref = self.rh.Inverse(38.7, -9.1, 40.6, -74.0)
+        self.assertEqual(rh.Inverse(38.7, -9.1, 40.6, -74.0), ref)
+        # Within the quantum of a cached query: served from the cache
+        self.assertEqual(rh.Inverse(38.7 + 1e-8, -9.1, 40.6, -74.0), ref)
+        rh.geodesic_inverse(38.7, -9.1, 40.6, -74.0)
+        rh.geodesic_inverse(0, 0, 10, 20)
+        info = rh.cache_info()
+        self.assertEqual(info['results']['hits'], 1)
+        self.assertEqual(info['results']['misses'], 3)
+        self.assertEqual(info['results']['evictions'], 1)
+        self.assertEqual(info['results']['size'], 2)
+        # isometric_lat is cached per latitude: 38.7 and 40.6 computed once each
+        self.assertEqual(info['isometric']['misses'], 2)
+        rh.Direct(38.7, -9.1, 45, 1000)
+        self.assertEqual(rh.cache_info()['isometric']['hits'], 1)
+        rh.disable_cache()
+        self.assertIsNone(rh.cache_info())
+
+    def test_cache_thread_safety(self):
+        print("\n--- Result Cache Test: Shared Across Threads ---")
+        rh = Rhumb()
+        rh.enable_cache(maxsize=16)
+        points = [(i, i, i + 1, i + 2) for i in range(32)]
+
+        def worker():
+            for _ in range(20):
+                for p in points:
+                    self.assertEqual(rh.Inverse(*p), self.rh.Inverse(*p))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        info = rh.cache_info()['results']
+        self.assertEqual(info['hits'] + info['misses'], 4 * 20 * 32)
+        self.assertLessEqual(info['size'], 16)
+
+    def test_fast_isometric_mode(self):
+        print("\n--- Fast Isometric Latitude Test: Agreement & Inverse ---")
+        fast = Rhumb(isometric="fast")
+        for lat in np.linspace(-89.99, 89.99, 721):
+            phi = math.radians(lat)
+            psi = fast.isometric_lat(phi)
+            self.assertAlmostEqual(psi, self.rh.isometric_lat(phi), delta=1e-10)
+            self.assertAlmostEqual(fast.latitude_from_isometric(psi), phi, delta=1e-14)
+            self.assertAlmostEqual(self.rh.latitude_from_isometric(psi), phi, delta=1e-14)
+        res = fast.Inverse(38.7, -9.1, 40.6, -74.0)
+        ref = self.rh.Inverse(38.7, -9.1, 40.6, -74.0)
+        self.assertAlmostEqual(res['s12'], ref['s12'], delta=1e-3)
+        batch = fast.inverse_batch([38.7], [-9.1], [40.6], [-74.0])
+        self.assertAlmostEqual(batch['s12'][0], res['s12'], delta=1e-6)
+        with self.assertRaises(ValueError):
+            Rhumb(isometric="table")
+
+    def test_exact_rhumb_meridian_and_equator(self):
+        print("\n--- Exact Rhumb Test: Meridian & Equator ---")
+        res = self.rh.exact_inverse(0, 0, 90, 0)
+        s12, _, _ = self.rh.geodesic_inverse(0, 0, 90, 0)
+        self.print_comparison("Distance", res['s12'] * self.m_to_nm, s12 * self.m_to_nm, "NM")
+        self.assertAlmostEqual(res['s12'], s12, delta=1e-6)
+        res = self.rh.exact_inverse(0, 0, 0, 90)
+        self.assertAlmostEqual(res['s12'], self.rh.a * math.pi / 2, delta=1e-6)
+        self.assertAlmostEqual(res['azi12'], 90.0, delta=1e-12)
+        res = self.rh.exact_inverse(10, 20, 10, 20)
+        self.assertEqual((res['s12'], res['azi12']), (0.0, 0.0))
+
+    def test_exact_rhumb_short_legs_match_geodesic(self):
+        print("\n--- Exact Rhumb Test: Short Legs vs Geodesic ---")
+        rng = np.random.default_rng(99)
+        for lat1, lon1, azi, d in zip(rng.uniform(-60, 60, 500), rng.uniform(-180, 180, 500),
+                                      rng.uniform(0, 360, 500), rng.uniform(0, 1000, 500)):
+            lat2, lon2, _ = self.rh.geodesic_direct(lat1, lon1, azi, d)
+            self.assertAlmostEqual(self.rh.exact_inverse(lat1, lon1, lat2, lon2)['s12'], d, delta=1e-4)
+
+    def test_exact_rhumb_round_trip(self):
+        print("\n--- Exact Rhumb Test: Direct/Inverse Round Trip ---")
+        rng = np.random.default_rng(100)
+        for lat1, lon1, azi, d in zip(rng.uniform(-60, 60, 500), rng.uniform(-180, 180, 500),
+                                      rng.uniform(0, 360, 500), rng.uniform(0, 3e6, 500)):
+            res = self.rh.exact_direct(lat1, lon1, azi, d)
+            inv = self.rh.exact_inverse(lat1, lon1, res['lat2'], res['lon2'])
+            self.assertAlmostEqual(inv['s12'], d, delta=1e-3)
+            if d > 1:
+                self.assertAlmostEqual(inv['azi12'], azi % 360, delta=1e-6)
+        # Pole overshoot is clamped like Direct
+        self.assertEqual(self.rh.exact_direct(80, 0, 0, 2e6)['lat2'], 90.0)
+
+    def test_result_types(self):
+        print("\n--- Result Types Test: Named, Keyed & Positional Access ---")
+        res = self.rh.Inverse(0, 0, 10, 20)
+        self.assertEqual(res['s12'], res.s12)
+        self.assertEqual(res[1], res.azi12)
+        self.assertEqual(list(res.keys()), ['s12', 'azi12'])
+        lat2, lon2, azi12 = self.rh.Direct(0, 0, 45, 1000000)
+        self.assertEqual(self.rh.Direct(0, 0, 45, 1000000)['lat2'], lat2)
+        s12, azi1, azi2 = self.rh.geodesic_inverse(0, 0, 10, 20)
+        self.assertEqual(self.rh.geodesic_inverse(0, 0, 10, 20).azi2, azi2)
+        with self.assertRaises(AttributeError):
+            self.rh.extra = 1
+
+    def test_batch_out_parameters(self):
+        print("\n--- Batch Out Parameters Test: Preallocated Arrays ---")
+        lat = np.array([0.0, 10.0, 45.0])
+        s12, azi12 = np.empty(3), np.empty(3)
+        res = self.rh.inverse_batch(lat, 0, 50, 30, out=(s12, azi12))
+        self.assertIs(res.s12, s12)
+        self.assertAlmostEqual(s12[1], self.rh.Inverse(10, 0, 50, 30).s12, delta=1e-6)
+        lat2, lon2, azi = np.empty(3), np.empty(3), np.empty(3)
+        res = self.rh.direct_batch(lat, 0, 405, 1e6, out=(lat2, lon2, azi))
+        self.assertIs(res['lon2'], lon2)
+        self.assertAlmostEqual(lat2[2], self.rh.Direct(45, 0, 45, 1e6).lat2, delta=1e-9)
+        self.assertEqual(azi[0], 45.0)
+
+    def test_geodesic_meridian_waypoints(self):
+        print("\n--- Geodesic Waypoints at Meridian Crossings ---")
+        from geographiclib.geodesic import Geodesic
+        g = Geodesic.WGS84
+        mask = Geodesic.STANDARD | Geodesic.LONG_UNROLL
+        # Ordinary, high-latitude, antimeridian-crossing, near-polar, near-meridional
+        # and nearly antipodal routes
+        for lat1, lon1, lat2, lon2 in ((49, -5, 42, -140), (-34, 18, -38, 145),
+                                       (10, 170, 20, -170), (60, 10, 60, -170.5),
+                                       (-70, 3, 80, 11), (30, 0, -29.8, 179.7)):
+            res = self.rh.geodesic_meridian_waypoints(lat1, lon1, lat2, lon2, step=5)
+            line = g.InverseLine(lat1, lon1, lat2, lon2, mask)
+            self.assertEqual((res.lat[0], res.lon[0], res.lat[-1], res.lon[-1]), (lat1, lon1, lat2, lon2))
+            self.assertTrue(np.all(res.lon[1:-1] % 5 == 0))
+            self.assertEqual(res.s12.size, res.lat.size - 1)
+            d = 1 if line.ArcPosition(line.a13, mask)['lon2'] > line.lon1 else -1
+            for lat, lon in zip(res.lat[1:-1].tolist(), res.lon[1:-1].tolist()):
+                # Reference: bisect the arc at which the line reaches the meridian
+                target = d * (lon - lon1) % 360
+                lo, hi = 0.0, line.a13
+                for _ in range(60):
+                    mid = (lo + hi) / 2
+                    if d * (line.ArcPosition(mid, mask)['lon2'] - line.lon1) < target:
+                        lo = mid
+                    else:
+                        hi = mid
+                self.assertAlmostEqual(lat, line.ArcPosition(lo, mask)['lat2'], delta=1e-9)
+            s12, azi12 = self.rh.inverse_batch(res.lat[:-1], res.lon[:-1], res.lat[1:], res.lon[1:])
+            self.assertTrue(np.array_equal(res.s12, s12) and np.array_equal(res.azi12, azi12))
+        res = self.rh.geodesic_meridian_waypoints(49, -5, 42, -140, step=10)
+        self.assertEqual(res.lon.tolist(), [-5, -10, -20, -30, -40, -50, -60, -70, -80, -90, -100, -110, -120, -130, -140])
+        vertex = self.rh.geodesic_vertex(49, -5, self.rh.geodesic_inverse(49, -5, 42, -140).azi1)
+        for got, expected in zip(res.vertex, vertex):
+            self.assertAlmostEqual(got, expected, delta=1e-6)
+        self.assertEqual(self.rh.geodesic_meridian_waypoints(0, 10, 50, 10).lat.tolist(), [0, 50])
+        self.assertRaises(ValueError, self.rh.geodesic_meridian_waypoints, 0, 0, 1, 1, 0)
+        # Identical end points (also at a pole) have no route, hence no vertex
+        self.assertRaises(ValueError, self.rh.geodesic_meridian_waypoints, 10, 20, 10, 20)
+        self.assertRaises(ValueError, self.rh.geodesic_meridian_waypoints, 90, 0, 90, 45)
+
+    def test_tiered_inverse_within_budget(self):
+        print("\n--- Tiered Precision Test: Error Within Budget ---")
+        rng = np.random.default_rng(25)
+        n = 4000
+        lat1, lon1 = rng.uniform(-89, 89, n), rng.uniform(-180, 180, n)
+        lat2 = np.clip(lat1 + rng.normal(0, 3, n), -90, 90)
+        lon2 = lon1 + rng.normal(0, 3, n)
+        budget = 10 ** rng.uniform(-3, 3, n)
+        exact = {"rhumb": self.rh.exact_inverse_batch(lat1, lon1, lat2, lon2),
+                 "geodesic": self.rh.geodesic_inverse_batch(lat1, lon1, lat2, lon2)}
+        for metric, (s_ref, azi_ref) in (("rhumb", exact["rhumb"]), ("geodesic", exact["geodesic"][:2])):
+            res = self.rh.tiered_inverse_batch(lat1, lon1, lat2, lon2, budget, metric)
+            dazi = np.radians((res.azi1 - azi_ref + 180) % 360 - 180)
+            err = np.hypot(res.s12 - s_ref, s_ref * np.sin(dazi))
+            counts = np.bincount(res.tier, minlength=3)
+            print(f"{metric}: tiers {dict(zip(TIERS, counts.tolist()))}, max error / budget {(err / budget).max():.3f}")
+            self.assertTrue((err <= budget).all())
+            self.assertTrue(counts[0] > 0 and counts[2] > 0)
+            # The scalar solver picks the same tier
+            for k in range(0, n, 40):
+                scalar = self.rh.tiered_inverse(lat1[k], lon1[k], lat2[k], lon2[k], budget[k], metric)
+                self.assertEqual(scalar.tier, TIERS[res.tier[k]])
+                self.assertAlmostEqual(scalar.s12, res.s12[k], delta=1e-6)
+
+    def test_tiered_inverse_tiers(self):
+        print("\n--- Tiered Precision Test: Tier Choice & Exact Batch ---")
+        # A short coastal leg is spherical within a metre; a tiny budget forces the exact model
+        res = self.rh.tiered_inverse(50.1, -1.3, 50.3, -1.0, 1.0)
+        self.assertEqual(res.tier, "spherical")
+        self.assertAlmostEqual(res.s12, self.rh.exact_inverse(50.1, -1.3, 50.3, -1.0).s12, delta=1.0)
+        res = self.rh.tiered_inverse(50.1, -1.3, 50.3, -1.0, 1e-6, "geodesic")
+        self.assertEqual(res.tier, "exact")
+        self.assertEqual(tuple(res[:3]), tuple(self.rh.geodesic_inverse(50.1, -1.3, 50.3, -1.0)))
+        self.assertEqual(self.rh.tiered_inverse(20, 0, 40, 20, 3e4).tier, "approximate")
+        # exact_inverse_batch agrees with exact_inverse, including E-W legs and coincident points
+        lat1, lon1 = np.array([0.0, 45.0, 10.0, -70.0, 30.0]), np.array([0.0, 10.0, 20.0, 170.0, 5.0])
+        lat2, lon2 = np.array([60.0, 45.0, 10.0, -65.0, 30.0 + 1e-9]), np.array([80.0, 50.0, 20.0, -170.0, 6.0])
+        s12, azi12 = self.rh.exact_inverse_batch(lat1, lon1, lat2, lon2)
+        for k in range(lat1.size):
+            ref = self.rh.exact_inverse(lat1[k], lon1[k], lat2[k], lon2[k])
+            self.assertAlmostEqual(s12[k], ref.s12, delta=1e-6)
+            self.assertAlmostEqual(azi12[k], ref.azi12, delta=1e-9)
+        self.assertRaises(ValueError, self.rh.tiered_inverse, 0, 0, 1, 1, 0)
+        self.assertRaises(ValueError, self.rh.tiered_inverse, 0, 0, 1, 1, 1.0, "loxodrome")
+        self.assertRaises(ValueError, self.rh.tiered_inverse_batch, [0], [0], [1], [1], [-1.0])
+
+    def test_import_defers_numpy_and_geographiclib(self):
+        print("\n--- Startup: numpy & GeographicLib Imported on First Use ---")
+        code = ("import sys, rhumb_v0_2, coordinates_v0_1\n"
+                "print('numpy' in sys.modules, 'geographiclib.geodesic' in sys.modules)\n"
+                "rh = rhumb_v0_2.Rhumb()\n"
+                "print(round(rh.geodesic_inverse(0, 0, 0, 1).s12, 3), len(rh.inverse_batch([0], [0], [1], [1]).s12))")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.split("\n")[:2], ["False False", "111319.491 1"])
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
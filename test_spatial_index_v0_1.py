@@ -0,0 +1,79 @@
+# test_spatial_index_v0_1.py
+import unittest
+import numpy as np
+from rhumb_v0_2 import Rhumb
+from spatial_index_v0_1 import SpatialIndex
+
+class TestSpatialIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rh = Rhumb()
+        rng = np.random.default_rng(21)
+        n = 20000
+        cls.lat = np.degrees(np.arcsin(rng.uniform(-1, 1, n)))
+        cls.lon = rng.uniform(-180, 180, n)
+        # Polar and antimeridian queries included
+        cls.queries = [(89.9, 10.0), (-88.0, -170.0), (10.0, 179.99), (-5.0, -179.9), (38.7, -9.1), (0.0, 0.0)]
+        cls.queries += [(float(a), float(b)) for a, b in zip(rng.uniform(-90, 90, 20), rng.uniform(-180, 180, 20))]
+        print("\n================== BEGIN SPATIAL INDEX TEST ==================")
+
+    def brute(self, lat, lon, lats, lons):
+        s12, _ = self.rh.inverse_batch(lat, lon, lats, lons)
+        return s12
+
+    def test_radius_and_nearest_match_brute_force(self):
+        print("\n--- Spatial Index: Radius & kNN vs Brute Force ---")
+        idx = SpatialIndex()
+        idx.bulk_load(range(self.lat.size), self.lat, self.lon)
+        for lat, lon in self.queries:
+            s12 = self.brute(lat, lon, self.lat, self.lon)
+            for radius in (5e4, 3e5, 1.5e6):
+                hits = idx.radius(lat, lon, radius)
+                self.assertEqual({h.key for h in hits}, set(np.flatnonzero(s12 <= radius).tolist()))
+                self.assertEqual([h.s12 for h in hits], sorted(h.s12 for h in hits))
+            nearest = idx.nearest(lat, lon, 7)
+            self.assertEqual([h.key for h in nearest], np.argsort(s12, kind="stable")[:7].tolist())
+            first = nearest[0]
+            s, azi = self.rh.Inverse(lat, lon, self.lat[first.key], self.lon[first.key])
+            self.assertAlmostEqual(first.s12, s, delta=1e-6)
+            self.assertAlmostEqual(first.azi12, azi, delta=1e-9)
+
+    def test_insert_and_delete(self):
+        print("\n--- Spatial Index: Incremental Insert & Delete ---")
+        idx = SpatialIndex(cell_km=200)
+        idx.bulk_load(range(5000), self.lat[:5000], self.lon[:5000])
+        for i in range(5000, 7000):
+            idx.insert(i, self.lat[i], self.lon[i])
+        for i in range(0, 7000, 3):
+            idx.delete(i)
+        idx.insert(1, 0.0, 0.0)  # Moves key 1
+        keys = np.array([i for i in range(7000) if i % 3 and i != 1])
+        self.assertEqual(len(idx), keys.size + 1)
+        self.assertNotIn(0, idx)
+        with self.assertRaises(KeyError):
+            idx.delete(0)
+        lats = np.append(self.lat[keys], 0.0)
+        lons = np.append(self.lon[keys], 0.0)
+        keys = np.append(keys, 1)
+        for lat, lon in self.queries[:10]:
+            s12 = self.brute(lat, lon, lats, lons)
+            expected = set(keys[s12 <= 8e5].tolist())
+            self.assertEqual({h.key for h in idx.radius(lat, lon, 8e5)}, expected)
+            self.assertEqual([h.key for h in idx.nearest(lat, lon, 3)],
+                             keys[np.argsort(s12, kind="stable")[:3]].tolist())
+        self.assertEqual(idx.nearest(0.0, 0.0, 1)[0].key, 1)
+
+    def test_geodesic_metric(self):
+        print("\n--- Spatial Index: Geodesic Metric ---")
+        idx = SpatialIndex(metric="geodesic")
+        idx.bulk_load(range(2000), self.lat[:2000], self.lon[:2000])
+        for lat, lon in self.queries[:4]:
+            s12 = np.array([self.rh.geodesic_inverse(lat, lon, a, b).s12
+                            for a, b in zip(self.lat[:2000], self.lon[:2000])])
+            self.assertEqual({h.key for h in idx.radius(lat, lon, 1e6)}, set(np.flatnonzero(s12 <= 1e6).tolist()))
+            self.assertEqual([h.key for h in idx.nearest(lat, lon, 2)], np.argsort(s12)[:2].tolist())
+        self.assertEqual(SpatialIndex().nearest(0, 0, 3), [])
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,131 @@
+# test_track_reader_v0_1.py
+import io
+import os
+import tempfile
+import tracemalloc
+import unittest
+import numpy as np
+from rhumb_v0_2 import Rhumb
+from nmea_v0_1 import parse_nmea
+from track_reader_v0_1 import Fix, leg_chunks, main, read_gpx, read_nmea, summarize
+
+def with_checksum(body):
+    value = 0
+    for ch in body.encode("ascii"):
+        value ^= ch
+    return f"${body}*{value:02X}"
+
+GPX = """<?xml version="1.0"?>
+<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">
+  <trk><trkseg>
+    <trkpt lat="38.70" lon="-9.14"><time>2024-05-01T12:00:00Z</time></trkpt>
+    <trkpt lat="38.71" lon="-9.13"><ele>3</ele><time>2024-05-01T12:06:00Z</time></trkpt>
+    <trkpt lat="38.72" lon="-9.11"><time>2024-05-01T12:12:00Z</time></trkpt>
+    <trkpt lat="38.74" lon="-9.10"><time>2024-05-01T12:18:00Z</time></trkpt>
+    <trkpt lat="38.75" lon="-9.08"><time>2024-05-01T12:24:00Z</time></trkpt>
+  </trkseg></trk>
+</gpx>"""
+
+class TestTrackReader(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rh = Rhumb()
+        print("\n================== BEGIN TRACK READER TEST ==================")
+
+    def test_gpx_fixes_and_legs(self):
+        print("\n--- Track Reader: GPX Fixes & Legs ---")
+        fixes = list(read_gpx(io.BytesIO(GPX.encode())))
+        self.assertEqual(len(fixes), 5)
+        self.assertEqual(fixes[1].time - fixes[0].time, 360.0)
+        legs = list(leg_chunks(iter(fixes), chunk_size=2))
+        self.assertEqual([c.s12.size for c in legs], [2, 2])
+        s12 = np.concatenate([c.s12 for c in legs])
+        sog = np.concatenate([c.sog for c in legs])
+        for i in range(4):
+            s, azi = self.rh.Inverse(fixes[i].lat, fixes[i].lon, fixes[i + 1].lat, fixes[i + 1].lon)
+            self.assertAlmostEqual(s12[i], s, delta=1e-6)
+            self.assertAlmostEqual(sog[i], s / 360 * 3600 / 1852, delta=1e-9)
+
+    def test_gpx_memory_stays_flat(self):
+        print("\n--- Track Reader: GPX Memory With Waypoints & Extensions ---")
+        n = 20000
+        wpt = "".join(f'<wpt lat="1.{i}" lon="2.{i}"><name>W{i}</name><extensions><x>{i}</x></extensions></wpt>'
+                      for i in range(n))
+        seg = "".join(f'<trkseg><trkpt lat="3.{i}" lon="4.{i}"><time>2024-05-01T12:00:00Z</time>'
+                      f'<extensions><hr>1</hr></extensions></trkpt></trkseg>' for i in range(n))
+        data = io.BytesIO(f'<gpx><metadata><name>M</name></metadata>{wpt}<trk>{seg}</trk></gpx>'.encode())
+        tracemalloc.start()
+        try:
+            fixes = sum(1 for _ in read_gpx(data))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        print(f"{fixes} fixes, peak {peak / 1e6:.2f} MB")
+        self.assertEqual(fixes, n)
+        self.assertLess(peak, 2e6)  # Some 20 MB if the parsed elements were kept
+
+    def test_summary_matches_single_chunk(self):
+        print("\n--- Track Reader: Summary Independent of Chunking ---")
+        fixes = list(read_gpx(io.BytesIO(GPX.encode())))
+        small = summarize(iter(fixes), chunk_size=1)
+        large = summarize(iter(fixes), chunk_size=100)
+        self.assertEqual(small["legs"], 4)
+        self.assertEqual(small["fixes"], 5)
+        self.assertAlmostEqual(small["distance_m"], large["distance_m"], delta=1e-6)
+        self.assertEqual(small["max_sog_kn"], large["max_sog_kn"])
+        made_good, course = self.rh.Inverse(38.70, -9.14, 38.75, -9.08)
+        self.assertEqual((small["made_good_m"], small["made_good_course"]), (made_good, course))
+        self.assertEqual(small["elapsed_s"], 1440.0)
+        geo = summarize(iter(fixes), metric="geodesic")
+        self.assertAlmostEqual(geo["distance_m"], small["distance_m"], delta=small["distance_m"] * 0.01)
+        self.assertEqual(summarize(iter([]))["fixes"], 0)
+        one = summarize(iter([Fix(0.0, 10.0, 20.0)]))
+        self.assertEqual((one["fixes"], one["legs"], one["distance_m"], one["made_good_m"]), (1, 0, 0.0, None))
+
+    def test_nmea_sentences(self):
+        print("\n--- Track Reader: NMEA RMC/GGA ---")
+        lines = [
+            with_checksum("GPRMC,235950.00,A,3842.5000,N,00908.4000,W,5.0,45.0,010524,,,A"),
+            with_checksum("GPGGA,235950.00,3842.5000,N,00908.4000,W,1,08,0.9,10.0,M,50.0,M,,"),  # Same fix
+            with_checksum("GNGGA,000010.00,3842.5100,N,00908.3900,W,1,08,0.9,10.0,M,50.0,M,,"),  # Past midnight
+            "$GPGGA,000020.00,3842.5200,N,00908.3800,W,1,08,0.9,10.0,M,50.0,M,,*00",  # Bad checksum
+            with_checksum("GPRMC,000030.00,V,3842.5200,N,00908.3800,W,5.0,45.0,020524,,,A"),  # Void
+            with_checksum("GPGGA,000040.00,3842.5300,S,00908.3700,E,0,00,,,M,,M,,"),  # No fix
+            "$GPRMC,000050.00,A,3842.5400,N,00908.3600,W,5.0,45.0,020524,,,A",  # No checksum
+        ]
+        fixes = list(read_nmea(line + "\r\n" for line in lines))
+        self.assertEqual(len(fixes), 3)
+        self.assertAlmostEqual(fixes[0].lat, 38 + 42.5 / 60, delta=1e-12)
+        self.assertAlmostEqual(fixes[0].lon, -(9 + 8.4 / 60), delta=1e-12)
+        self.assertEqual([f.time - fixes[0].time for f in fixes], [0.0, 20.0, 60.0])
+
+    def test_nmea_rejected_sentence_keeps_date(self):
+        print("\n--- Track Reader: Rejected RMC Leaves the Date ---")
+        lines = [
+            with_checksum("GPRMC,120000.00,A,3842.5000,N,00908.4000,W,5.0,45.0,010124,,,A"),
+            with_checksum("GPRMC,120001.00,A,3899.0000,N,00908.4000,W,5.0,45.0,050124,,,A"),  # Bad latitude
+            with_checksum("GPGGA,120002.00,3842.5100,N,00908.3900,W,1,08,0.9,10.0,M,50.0,M,,"),
+            with_checksum("GPGGA,000003.00,38x2.5200,N,00908.3800,W,1,08,0.9,10.0,M,50.0,M,,"),  # Bad latitude
+            with_checksum("GPGGA,120004.00,3842.5300,N,00908.3700,W,1,08,0.9,10.0,M,50.0,M,,"),
+        ]
+        fixes = list(read_nmea(lines))
+        self.assertEqual([f.time for f in fixes], [1704110400.0, 1704110402.0, 1704110404.0])
+        parsed = parse_nmea("\r\n".join(lines).encode())
+        self.assertEqual(parsed["time"].tolist(), [f.time for f in fixes])
+
+    def test_command_line(self):
+        print("\n--- Track Reader: Command Line ---")
+        with tempfile.TemporaryDirectory() as tmp:
+            track = os.path.join(tmp, "track.gpx")
+            legs = os.path.join(tmp, "legs.csv")
+            with open(track, "w", encoding="utf-8") as f:
+                f.write(GPX)
+            self.assertEqual(main([track, "--legs", legs, "--nm"]), 0)
+            with open(legs, encoding="utf-8") as f:
+                rows = f.read().splitlines()
+        self.assertEqual(len(rows), 5)
+        self.assertTrue(rows[0].startswith("time1,time2,lat1,lon1,lat2,lon2,s12_nm"))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
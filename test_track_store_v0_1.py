@@ -0,0 +1,141 @@
+# test_track_store_v0_1.py
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import numpy as np
+from rhumb_v0_2 import Rhumb
+from track_reader_v0_1 import Fix, summarize
+from nmea_v0_1 import parse_nmea
+from track_store_v0_1 import TrackStore, import_track, main
+
+def with_checksum(body):
+    value = 0
+    for ch in body.encode("ascii"):
+        value ^= ch
+    return f"${body}*{value:02X}"
+
+class TestTrackStore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rh = Rhumb()
+        rng = np.random.default_rng(3)
+        n = 2000
+        cls.time = 1.7e9 + np.cumsum(rng.uniform(1, 10, n))
+        cls.lat = 38.7 + np.cumsum(rng.normal(0, 1e-3, n))
+        cls.lon = -9.1 + np.cumsum(rng.normal(0, 1e-3, n))
+        print("\n================== BEGIN TRACK STORE TEST ==================")
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "store")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_append_and_views(self):
+        print("\n--- Track Store: Append & Zero-Copy Views ---")
+        store = TrackStore(self.path, create=True)
+        store.append("a", self.time[:500], self.lat[:500], self.lon[:500])
+        store.append("a", self.time[500:1200], self.lat[500:1200], self.lon[500:1200])
+        store.append("b", self.time[1200:], self.lat[1200:], self.lon[1200:])
+        self.assertEqual(store.voyages, ["a", "b"])
+        self.assertEqual(len(store), 2000)
+
+        reopened = TrackStore(self.path)
+        track = reopened.track("a")
+        self.assertIsInstance(track.lat.base, np.memmap)
+        self.assertFalse(track.lat.flags.writeable)
+        self.assertTrue(np.array_equal(track.time, self.time[:1200]))
+        self.assertTrue(np.array_equal(reopened.track("b").lon, self.lon[1200:]))
+        self.assertRaises(ValueError, reopened.track, "c")
+
+    def test_time_window_and_legs(self):
+        print("\n--- Track Store: Time Window & Legs ---")
+        store = TrackStore(self.path, create=True)
+        store.append("a", self.time, self.lat, self.lon)
+        t0, t1 = self.time[100], self.time[300]
+        self.assertEqual(store.rows("a", t0, t1), (100, 301))
+        self.assertEqual(store.rows("a", end_time=self.time[0] - 1), (0, 0))
+        legs = store.legs("a", t0, t1)
+        s12, azi = self.rh.inverse_batch(self.lat[100:300], self.lon[100:300], self.lat[101:301], self.lon[101:301])
+        self.assertTrue(np.array_equal(legs.s12, s12))
+        self.assertTrue(np.array_equal(legs.azi, azi))
+
+        fixes = (Fix(*f) for f in zip(self.time[100:301], self.lat[100:301], self.lon[100:301]))
+        expected = summarize(fixes)
+        got = store.summary("a", t0, t1)
+        self.assertEqual(got["legs"], expected["legs"])
+        self.assertAlmostEqual(got["distance_m"], expected["distance_m"], delta=1e-6)
+        self.assertEqual(got["made_good_m"], expected["made_good_m"])
+        # Chunked over the maps: the same summary, whatever the chunk size
+        chunked = store.summary("a", t0, t1, chunk_size=7)
+        self.assertEqual((chunked["fixes"], chunked["legs"]), (201, 200))
+        self.assertAlmostEqual(chunked["distance_m"], got["distance_m"], delta=1e-6)
+        self.assertEqual(chunked["max_sog_kn"], got["max_sog_kn"])
+        # A single fix is one fix and no leg
+        one = store.summary("a", t0, t0)
+        self.assertEqual((one["fixes"], one["legs"], one["distance_m"]), (1, 0, 0.0))
+        self.assertEqual(store.summary("a", end_time=self.time[0] - 1)["fixes"], 0)
+
+    def test_append_rules(self):
+        print("\n--- Track Store: Append Rules & Recovery ---")
+        store = TrackStore(self.path, create=True)
+        store.append("a", self.time[:10], self.lat[:10], self.lon[:10])
+        store.append("b", self.time[10:20], self.lat[10:20], self.lon[10:20])
+        self.assertRaises(ValueError, store.append, "a", self.time[20:30], self.lat[20:30], self.lon[20:30])
+        self.assertRaises(ValueError, store.append, "b", self.time[:5], self.lat[:5], self.lon[:5])
+        self.assertRaises(ValueError, store.append, "c", self.time[:5], self.lat[:4], self.lon[:5])
+        self.assertRaises(ValueError, TrackStore, os.path.join(self.tmp.name, "missing"))
+
+        # An interrupted append leaves rows past the header's count: ignored, then cut off
+        with open(os.path.join(self.path, "lat.f8"), "ab") as f:
+            f.write(b"\0" * 24)
+        store = TrackStore(self.path)
+        self.assertEqual(len(store), 20)
+        store.append("b", self.time[20:30], self.lat[20:30], self.lon[20:30])
+        self.assertTrue(np.array_equal(store.track("b").lat, self.lat[10:30]))
+        self.assertEqual(os.path.getsize(os.path.join(self.path, "lat.f8")), 30 * 8)
+
+    def test_import_nmea_in_chunks(self):
+        print("\n--- Track Store: NMEA Import in Chunks ---")
+        nmea = os.path.join(self.tmp.name, "log.nmea")
+        with open(nmea, "w", encoding="ascii") as f:
+            for k in range(600):
+                lat, lon = 38 + k / 1000, 9 + k / 1000
+                f.write(with_checksum(f"GPRMC,{12 + k // 3600:02d}{k // 60 % 60:02d}{k % 60:02d}.00,A,"
+                                      f"{int(lat):02d}{(lat % 1) * 60:07.4f},N,{int(lon):03d}{(lon % 1) * 60:07.4f},W,"
+                                      f"5.0,45.0,010524,,,A") + "\r\n")
+        with open(nmea, "rb") as f:
+            data = f.read()
+        expected = parse_nmea(data)
+        self.assertEqual(expected.size, 600)
+        store = TrackStore(self.path, create=True)
+        # Chunks much smaller than the file, cutting sentences anywhere
+        self.assertEqual(import_track(store, "v", nmea, chunk_bytes=1000), 600)
+        self.assertGreater(len(data), 1000 * 40)
+        track = store.track("v")
+        for name in ("time", "lat", "lon"):
+            self.assertTrue(np.array_equal(getattr(track, name), expected[name]))
+        self.assertRaises(ValueError, import_track, store, "w", nmea, 0)
+
+    def test_command_line(self):
+        print("\n--- Track Store: Command Line ---")
+        nmea = os.path.join(self.tmp.name, "log.nmea")
+        with open(nmea, "w", encoding="ascii") as f:
+            f.write("$GPRMC,120000.00,A,3842.5000,N,00908.4000,W,5.0,45.0,010524,,,A\r\n"
+                    "$GPRMC,120100.00,A,3842.6000,N,00908.3000,W,5.0,45.0,010524,,,A\r\n")
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertEqual(main([self.path, "import", "v1", nmea]), 0)
+            self.assertEqual(main([self.path, "list"]), 0)
+            self.assertEqual(main([self.path, "stats", "v1", "--nm"]), 0)
+        self.assertIn("2 fixes appended to v1", out.getvalue())
+        self.assertIn('"legs": 1', out.getvalue())
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main([self.path, "stats", "nope"]), 1)
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,80 @@
+# test_virtual_text_v0_1.py
+import tkinter as tk
+import unittest
+from virtual_text_v0_1 import LineWindow, VirtualText
+
+class TestLineWindow(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        print("\n================== BEGIN VIRTUAL TEXT TEST ==================")
+
+    def test_scrolling(self):
+        print("\n--- Line Window: Scrolling & Clamping ---")
+        w = LineWindow(10010, 12)
+        self.assertEqual(w.span(), (0, 12))
+        w.scroll(5)
+        self.assertEqual(w.span(), (5, 17))
+        w.scroll(1, "pages")
+        self.assertEqual(w.top, 16)
+        w.scroll(-100)
+        self.assertEqual(w.top, 0)
+        w.moveto(1.0)
+        self.assertEqual(w.span(), (9998, 10010))
+        first, last = w.fractions()
+        self.assertAlmostEqual(last, 1.0)
+        w.moveto("0.5")
+        self.assertEqual(w.top, 5005)
+
+    def test_short_list_and_resize(self):
+        print("\n--- Line Window: Short List & Resize ---")
+        w = LineWindow(5, 12)
+        w.scroll(3)
+        self.assertEqual(w.span(), (0, 5))
+        self.assertEqual(w.fractions(), (0.0, 1.0))
+        w = LineWindow(100, 12)
+        w.moveto(1.0)
+        w.resize(20)
+        self.assertEqual(w.span(), (80, 100))
+        self.assertEqual(LineWindow(0, 12).fractions(), (0.0, 1.0))
+
+class TestVirtualText(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.root = tk.Tk()
+        except tk.TclError as e:
+            raise unittest.SkipTest(f"No display: {e}")
+        cls.root.withdraw()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+
+    def test_copy_all_rows_and_no_wrap(self):
+        print("\n--- Virtual Text: Copy Every Row & No Wrapping ---")
+        text = tk.Text(self.root, height=5, width=20, wrap="word")
+        scrollbar = tk.Scrollbar(self.root)
+        view = VirtualText(text, scrollbar, ["Header", ""], 1000, lambda i: f"Row {i:04d} " + "x" * 30)
+        self.assertEqual(text.cget("wrap"), "none")
+        self.assertEqual(text.get("1.0", "end-1c").count("\n"), view.window.page - 1)
+
+        # Select All then Copy: every row, not only the ones in view
+        text.tag_add("sel", "1.0", "end-1c")
+        text.event_generate("<<Copy>>")
+        copied = self.root.clipboard_get()
+        self.assertEqual(copied, view.all_text())
+        self.assertEqual(len(copied.split("\n")), 1002)
+        self.assertEqual(copied.split("\n")[-1], "Row 0999 " + "x" * 30)
+        # A partial selection is copied as it is
+        text.tag_remove("sel", "1.0", "end")
+        text.tag_add("sel", "1.0", "1.3")
+        text.event_generate("<<Copy>>")
+        self.assertEqual(self.root.clipboard_get(), "Hea")
+
+        view.detach()
+        self.assertEqual(text.cget("wrap"), "word")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
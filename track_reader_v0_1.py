@@ -0,0 +1,325 @@
+# track_reader_v0_1.py
+# Streaming GPX / NMEA track reader with per-leg distance, course and speed
+# Usage: python track_reader_v0_1.py track.gpx [--legs legs.csv] [--metric geodesic] [--nm]
+
+import argparse
+import csv
+import json
+import math
+import sys
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from datetime import datetime, timezone
+from itertools import chain, islice
+
+import numpy as np
+from rhumb_v0_2 import Rhumb
+
+# One position fix: POSIX time (seconds, nan if unknown) and position (degrees)
+Fix = namedtuple('Fix', 'time lat lon')
+
+# Consecutive-fix legs of one chunk, as arrays: start / end times and positions,
+# distance s12 (meters), course azi (degrees) and speed over ground sog (knots)
+Legs = namedtuple('Legs', 'time1 time2 lat1 lon1 lat2 lon2 s12 azi sog')
+
+METRICS = ("rhumb", "geodesic")
+
+# =========================
+# GPX
+# =========================
+def _gpx_time(text):
+    if not text:
+        return math.nan
+    dt = datetime.fromisoformat(text.strip().replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def read_gpx(source):
+    """
+    Yield a Fix for every <trkpt> (and <rtept>) of a GPX file or binary stream, in
+    document order. Every element (points, waypoints, metadata, extensions, closed
+    segments) is cleared and detached from its parent at its end tag, the children
+    of a point once the point has been read, so memory stays flat however long the
+    track is.
+    """
+    points = ("trkpt", "rtept")
+    stack = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+        stack.pop()
+        tag = elem.tag.rsplit("}", 1)[-1]
+        if tag in points:
+            time = math.nan
+            for child in elem:
+                if child.tag.rsplit("}", 1)[-1] == "time":
+                    time = _gpx_time(child.text)
+            yield Fix(time, float(elem.get("lat")), float(elem.get("lon")))
+        elif stack and stack[-1].tag.rsplit("}", 1)[-1] in points:
+            continue  # Read (and dropped) with its point
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+
+# =========================
+# NMEA 0183 ($--RMC / $--GGA)
+# =========================
+def nmea_checksum_ok(sentence):
+    """True if the sentence has no checksum or its XOR checksum matches."""
+    body, star, given = sentence.partition("*")
+    if not star:
+        return True
+    value = 0
+    for ch in body.lstrip("$!").encode("ascii", "replace"):
+        value ^= ch
+    try:
+        return value == int(given[:2], 16)
+    except ValueError:
+        return False
+
+
+def _nmea_angle(value, hemi, deg_digits):
+    """ddmm.mmmm / dddmm.mmmm plus hemisphere to decimal degrees."""
+    degrees = int(value[:deg_digits])
+    minutes = float(value[deg_digits:])
+    if minutes >= 60:
+        raise ValueError(f"Invalid NMEA minutes: {value}")
+    angle = degrees + minutes / 60
+    return -angle if hemi in ("S", "W") else angle
+
+
+def _seconds_of_day(hhmmss):
+    return int(hhmmss[0:2]) * 3600 + int(hhmmss[2:4]) * 60 + float(hhmmss[4:])
+
+
+def read_nmea(lines):
+    """
+    Yield a Fix for every valid RMC (status A) and GGA (fix quality > 0) sentence of
+    any talker ($GP, $GN, ...). Sentences with a bad checksum or fields are skipped.
+    GGA has no date, so it takes the date of the last RMC (1970-01-01 before any RMC,
+    which keeps speeds right); a GGA repeating the time and position of the
+    previous fix is not yielded twice.
+    """
+    day = 0.0  # POSIX time of 00:00 UTC of the current date, from RMC
+    last_sod = None
+    last = None
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("ascii", "replace")
+        line = line.strip()
+        if len(line) < 7 or line[0] != "$" or not nmea_checksum_ok(line):
+            continue
+        fields = line.split("*", 1)[0].split(",")
+        kind = fields[0][3:]
+        # Every field is parsed before anything is kept, so a rejected sentence
+        # leaves the date alone
+        try:
+            if kind == "RMC" and len(fields) >= 10 and fields[2] == "A":
+                sod = _seconds_of_day(fields[1])
+                date = fields[9]
+                new_day = datetime(2000 + int(date[4:6]), int(date[2:4]), int(date[0:2]),
+                                   tzinfo=timezone.utc).timestamp()
+                lat = _nmea_angle(fields[3], fields[4], 2)
+                lon = _nmea_angle(fields[5], fields[6], 3)
+            elif kind == "GGA" and len(fields) >= 7 and fields[6] not in ("", "0"):
+                sod = _seconds_of_day(fields[1])
+                new_day = day
+                if last_sod is not None and sod < last_sod - 43200:
+                    new_day += 86400  # Midnight passed since the last RMC
+                lat = _nmea_angle(fields[2], fields[3], 2)
+                lon = _nmea_angle(fields[4], fields[5], 3)
+            else:
+                continue
+        except (ValueError, IndexError):
+            continue
+        day = new_day
+        last_sod = sod
+        fix = Fix(day + sod, lat, lon)
+        if last is not None and fix == last:
+            continue
+        last = fix
+        yield fix
+
+
+def read_track(path):
+    """Yield the fixes of a .gpx or NMEA file (chosen by extension)."""
+    if path.lower().endswith(".gpx"):
+        yield from read_gpx(path)
+    else:
+        with open(path, "rb") as f:
+            yield from read_nmea(f)
+
+
+# =========================
+# Per-leg statistics
+# =========================
+def track_legs(t, lat, lon, metric="rhumb", rhumb=None, pool=None):
+    """
+    Legs between consecutive fixes of time / position arrays (any buffer, e.g.
+    memory-mapped columns; the start and end arrays are views of the inputs).
+    Rhumb legs use Rhumb.inverse_batch; geodesic legs use geodesic_inverse_batch (or
+    pool.inverse when a ParallelGeodesic pool is given).
+    Returns: Legs of arrays
+    """
+    if metric not in METRICS:
+        raise ValueError(f"metric must be one of {', '.join(METRICS)}.")
+    rhumb = rhumb or Rhumb()
+    t, lat, lon = (np.asarray(c, dtype=float) for c in (t, lat, lon))
+    lat1, lon1, lat2, lon2 = lat[:-1], lon[:-1], lat[1:], lon[1:]
+    if metric == "rhumb":
+        s12, azi = rhumb.inverse_batch(lat1, lon1, lat2, lon2)
+    elif pool is not None:
+        s12, azi, _ = pool.inverse(lat1, lon1, lat2, lon2)
+    else:
+        s12, azi, _ = rhumb.geodesic_inverse_batch(lat1, lon1, lat2, lon2)
+    dt = t[1:] - t[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sog = np.where(dt > 0, s12 / dt * (3600 / 1852.0), np.nan)
+    return Legs(t[:-1], t[1:], lat1, lon1, lat2, lon2, s12, azi, sog)
+
+
+def leg_chunks(fixes, metric="rhumb", chunk_size=10000, rhumb=None, pool=None):
+    """
+    Turn a stream of fixes into per-leg results (see track_legs), chunk_size legs
+    at a time. Only one chunk of fixes is held at a time; the last fix of a chunk
+    starts the next one.
+    Yields: Legs of arrays
+    """
+    if metric not in METRICS:
+        raise ValueError(f"metric must be one of {', '.join(METRICS)}.")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    rhumb = rhumb or Rhumb()
+    fixes = iter(fixes)
+    carry = next(fixes, None)
+    if carry is None:
+        return
+    while True:
+        chunk = list(islice(fixes, chunk_size))
+        if not chunk:
+            return
+        chunk.insert(0, carry)
+        carry = chunk[-1]
+        yield track_legs(*zip(*chunk), metric=metric, rhumb=rhumb, pool=pool)
+
+
+class TrackSummary:
+    """
+    Running totals over the legs of a track: fixes, legs, distance run, elapsed time,
+    mean and maximum speed over ground, and (via finish) distance and course made good
+    from the first to the last fix.
+    """
+
+    def __init__(self):
+        self.fixes = 0
+        self.legs = 0
+        self.distance = 0.0
+        self.start = None
+        self.end = None
+        self.max_sog = math.nan
+
+    def start_at(self, time, lat, lon):
+        """Record the first fix of the track (so that a track of one fix has one fix)."""
+        if self.start is None:
+            self.start = self.end = (time, lat, lon)
+            self.fixes = 1
+
+    def add(self, legs):
+        """Fold in one Legs chunk."""
+        n = legs.s12.size
+        if n == 0:
+            return
+        if self.start is None:
+            self.start = (legs.time1[0], legs.lat1[0], legs.lon1[0])
+            self.fixes = 1
+        self.end = (legs.time2[-1], legs.lat2[-1], legs.lon2[-1])
+        self.fixes += n
+        self.legs += n
+        self.distance += float(legs.s12.sum())
+        if not np.isnan(legs.sog).all():
+            self.max_sog = float(np.fmax(self.max_sog, np.nanmax(legs.sog)))
+
+    def finish(self, rhumb=None, metric="rhumb"):
+        """
+        Returns: dict with fixes, legs, distance_m, elapsed_s, mean_sog_kn, max_sog_kn,
+        made_good_m and made_good_course (None when there are fewer than two fixes)
+        """
+        if self.legs == 0:
+            return {"fixes": self.fixes, "legs": 0, "distance_m": 0.0, "elapsed_s": None,
+                    "mean_sog_kn": None, "max_sog_kn": None, "made_good_m": None, "made_good_course": None}
+        rhumb = rhumb or Rhumb()
+        (t1, lat1, lon1), (t2, lat2, lon2) = self.start, self.end
+        if metric == "rhumb":
+            made_good, course = rhumb.Inverse(lat1, lon1, lat2, lon2)
+        else:
+            made_good, course, _ = rhumb.geodesic_inverse(lat1, lon1, lat2, lon2)
+        elapsed = t2 - t1
+        mean = self.distance / elapsed * (3600 / 1852.0) if elapsed > 0 else None
+        return {"fixes": self.fixes, "legs": self.legs, "distance_m": self.distance,
+                "elapsed_s": None if math.isnan(elapsed) else elapsed,
+                "mean_sog_kn": mean, "max_sog_kn": None if math.isnan(self.max_sog) else self.max_sog,
+                "made_good_m": made_good, "made_good_course": course}
+
+
+def summarize(fixes, metric="rhumb", chunk_size=10000, legs_out=None, rhumb=None, pool=None):
+    """
+    Stream fixes through leg_chunks into a TrackSummary, calling legs_out(chunk)
+    for every chunk when given (e.g. to write per-leg rows).
+    Returns: the summary dict (see TrackSummary.finish)
+    """
+    rhumb = rhumb or Rhumb()
+    summary = TrackSummary()
+    fixes = iter(fixes)
+    first = next(fixes, None)
+    if first is None:
+        return summary.finish(rhumb, metric)
+    summary.start_at(*first)
+    for chunk in leg_chunks(chain([first], fixes), metric, chunk_size, rhumb, pool):
+        summary.add(chunk)
+        if legs_out is not None:
+            legs_out(chunk)
+    return summary.finish(rhumb, metric)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-leg and summary statistics of a GPX or NMEA track.")
+    parser.add_argument("track", help="GPX (.gpx) or NMEA file")
+    parser.add_argument("--legs", metavar="PATH", help="write per-leg CSV rows to this file ('-' for stdout)")
+    parser.add_argument("--metric", choices=METRICS, default="rhumb")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--nm", action="store_true", help="distances in nautical miles instead of meters")
+    args = parser.parse_args(argv)
+    scale = 1852.0 if args.nm else 1.0
+    unit = "nm" if args.nm else "m"
+
+    legs_file = writer = None
+    if args.legs:
+        legs_file = sys.stdout if args.legs == "-" else open(args.legs, "w", newline="", encoding="utf-8")
+        writer = csv.writer(legs_file)
+        writer.writerow(["time1", "time2", "lat1", "lon1", "lat2", "lon2", f"s12_{unit}", "azi", "sog_kn"])
+
+    def write_legs(chunk):
+        columns = list(chunk)
+        columns[6] = chunk.s12 / scale
+        writer.writerows(zip(*(c.tolist() for c in columns)))
+
+    try:
+        summary = summarize(read_track(args.track), args.metric, args.chunk_size,
+                            write_legs if writer else None)
+    finally:
+        if legs_file is not None and legs_file is not sys.stdout:
+            legs_file.close()
+    if args.nm:
+        for key in ("distance_m", "made_good_m"):
+            value = summary.pop(key)
+            summary[key[:-2] + "_nm"] = None if value is None else value / scale
+    print(json.dumps(summary, indent=2), file=sys.stderr if args.legs == "-" else sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+# track_store_v0_1.py
+# Binary columnar store for archived voyages: float64 time / lat / lon columns
+# opened with memory mapping, plus a small JSON header indexing the voyages
+# Usage: python track_store_v0_1.py STORE import VOYAGE track.gpx
+#        python track_store_v0_1.py STORE stats VOYAGE [--start T] [--end T] [--metric geodesic] [--nm]
+#        python track_store_v0_1.py STORE list
+
+import argparse
+import json
+import mmap
+import os
+import sys
+from collections import namedtuple
+from itertools import islice
+
+import numpy as np
+from track_reader_v0_1 import METRICS, TrackSummary, read_gpx, track_legs
+from nmea_v0_1 import NmeaParser
+from rhumb_v0_2 import Rhumb
+
+COLUMNS = ("time", "lat", "lon")
+DTYPE = np.dtype("<f8")
+HEADER = "header.json"
+VERSION = 1
+
+# Fixes of one voyage (or time window) as arrays: POSIX time (seconds), degrees
+Track = namedtuple('Track', 'time lat lon')
+
+
+class TrackStore:
+    """
+    A directory holding one file per column (time.f8, lat.f8, lon.f8: little-endian
+    float64, nothing else) and header.json with the format version, the number of
+    fixes and, for each voyage in order, the [start, stop) rows it occupies.
+
+    A voyage is one run of rows with non-decreasing times, so it is found through the
+    index and a time window within it by binary search (np.searchsorted) on its
+    memory-mapped time column; nothing is scanned or parsed. The arrays handed out
+    are read-only views of the maps and go straight into Rhumb.inverse_batch.
+
+    Appending writes the new rows at the ends of the column files and then replaces
+    the header atomically. Rows beyond the header's count (an interrupted append) are
+    ignored and cut off by the next append. Only the last voyage can be extended.
+    """
+
+    def __init__(self, path, create=False):
+        self.path = path
+        header = os.path.join(path, HEADER)
+        if not os.path.exists(header):
+            if not create:
+                raise ValueError(f"{path} is not a track store.")
+            os.makedirs(path, exist_ok=True)
+            for name in COLUMNS:
+                open(self._column_path(name), "ab").close()
+            self._count = 0
+            self._voyages = []
+            self._save_header()
+        self._maps = None
+        self.refresh()
+
+    def _column_path(self, name):
+        return os.path.join(self.path, f"{name}.f8")
+
+    def _save_header(self):
+        tmp = os.path.join(self.path, f"{HEADER}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": VERSION, "count": self._count, "voyages": self._voyages}, f)
+        os.replace(tmp, os.path.join(self.path, HEADER))
+
+    def refresh(self):
+        """Re-read the header, e.g. to see fixes appended by another process."""
+        with open(os.path.join(self.path, HEADER), encoding="utf-8") as f:
+            header = json.load(f)
+        if header.get("version") != VERSION:
+            raise ValueError(f"Unsupported track store version: {header.get('version')}")
+        self._count = header["count"]
+        self._voyages = [list(v) for v in header["voyages"]]
+        self._index = {name: (start, stop) for name, start, stop in self._voyages}
+        self._maps = None
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, voyage):
+        return voyage in self._index
+
+    @property
+    def voyages(self):
+        """Voyage names in storage order."""
+        return [name for name, _, _ in self._voyages]
+
+    # =========================
+    # Reading
+    # =========================
+    def columns(self):
+        """Returns: Track of the whole time / lat / lon columns, memory-mapped read-only"""
+        if self._maps is None:
+            if self._count == 0:
+                self._maps = Track(*(np.empty(0, dtype=DTYPE) for _ in COLUMNS))
+            else:
+                self._maps = Track(*(np.memmap(self._column_path(name), dtype=DTYPE, mode="r",
+                                               shape=(self._count,)) for name in COLUMNS))
+        return self._maps
+
+    def rows(self, voyage, start_time=None, end_time=None):
+        """
+        Row range of a voyage, narrowed to start_time <= time <= end_time when given.
+        Returns: (start, stop) row numbers
+        """
+        try:
+            start, stop = self._index[voyage]
+        except KeyError:
+            raise ValueError(f"No voyage named {voyage!r}.")
+        if start_time is not None or end_time is not None:
+            time = self.columns().time[start:stop]
+            lo = 0 if start_time is None else int(np.searchsorted(time, start_time, side="left"))
+            hi = time.size if end_time is None else int(np.searchsorted(time, end_time, side="right"))
+            start, stop = start + lo, start + max(lo, hi)
+        return start, stop
+
+    def track(self, voyage, start_time=None, end_time=None):
+        """Returns: Track of zero-copy views of the voyage's fixes (optionally a time window)"""
+        start, stop = self.rows(voyage, start_time, end_time)
+        return Track(*(c[start:stop] for c in self.columns()))
+
+    def legs(self, voyage, start_time=None, end_time=None, metric="rhumb", rhumb=None, pool=None):
+        """Returns: track_reader_v0_1.Legs between the consecutive fixes of a voyage (or window)"""
+        return track_legs(*self.track(voyage, start_time, end_time), metric=metric, rhumb=rhumb, pool=pool)
+
+    def summary(self, voyage, start_time=None, end_time=None, metric="rhumb", rhumb=None, pool=None,
+                chunk_size=100000):
+        """
+        Summary statistics of a voyage (or window), chunk_size legs at a time: slices of
+        the memory-mapped columns overlapping by one fix (as leg_chunks) go through
+        TrackSummary, so only one chunk of legs is ever in memory.
+        Returns: the TrackSummary dict
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        rhumb = rhumb or Rhumb()
+        start, stop = self.rows(voyage, start_time, end_time)
+        columns = self.columns()
+        summary = TrackSummary()
+        if stop > start:
+            summary.start_at(*(float(c[start]) for c in columns))
+        for lo in range(start, stop - 1, chunk_size):
+            hi = min(lo + chunk_size + 1, stop)
+            summary.add(track_legs(*(c[lo:hi] for c in columns), metric=metric, rhumb=rhumb, pool=pool))
+        return summary.finish(rhumb, metric)
+
+    # =========================
+    # Appending
+    # =========================
+    def append(self, voyage, time, lat, lon):
+        """
+        Append fixes to voyage: a new voyage, or the last one. Times must not decrease
+        within the voyage.
+        Returns: number of fixes appended
+        """
+        arrays = [np.ascontiguousarray(a, dtype=DTYPE).ravel() for a in (time, lat, lon)]
+        n = arrays[0].size
+        if any(a.size != n for a in arrays):
+            raise ValueError("time, lat and lon must have the same length.")
+        if n == 0:
+            return 0
+        time = arrays[0]
+        if np.isnan(time).any() or (np.diff(time) < 0).any():
+            raise ValueError("Times must be known and non-decreasing within a voyage.")
+        if voyage in self._index:
+            name, start, stop = self._voyages[-1]
+            if name != voyage:
+                raise ValueError(f"Only the last voyage ({name!r}) can be extended.")
+            if stop > start and time[0] < self.columns().time[stop - 1]:
+                raise ValueError("Times must be known and non-decreasing within a voyage.")
+        else:
+            self._voyages.append([voyage, self._count, self._count])
+
+        self._maps = None  # Release the maps before the files change
+        for name, values in zip(COLUMNS, arrays):
+            with open(self._column_path(name), "r+b") as f:
+                f.truncate(self._count * DTYPE.itemsize)  # Drop rows of an interrupted append
+                f.seek(0, os.SEEK_END)
+                f.write(values.tobytes())
+        self._count += n
+        self._voyages[-1][2] = self._count
+        self._index[voyage] = tuple(self._voyages[-1][1:])
+        self._save_header()
+        return n
+
+    def import_fixes(self, voyage, fixes, chunk_size=100000):
+        """Append a stream of track_reader Fix tuples, chunk_size at a time. Returns: fixes appended"""
+        fixes = iter(fixes)
+        total = 0
+        while True:
+            chunk = list(islice(fixes, chunk_size))
+            if not chunk:
+                return total
+            total += self.append(voyage, *zip(*chunk))
+
+
+def import_track(store, voyage, path, chunk_bytes=1 << 20):
+    """
+    Append the fixes of a .gpx or NMEA file as voyage. An NMEA file is memory-mapped
+    and fed to one NmeaParser chunk_bytes at a time (the parser carries a line cut
+    at a chunk boundary over to the next chunk), each chunk's fixes being appended
+    before the next is read, so memory stays bounded however large the log.
+    Returns: fixes appended
+    """
+    if path.lower().endswith(".gpx"):
+        return store.import_fixes(voyage, read_gpx(path))
+    if chunk_bytes < 1:
+        raise ValueError("Chunk size must be at least 1 byte.")
+    parser = NmeaParser()
+    total = 0
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            view = memoryview(data)
+            try:
+                for start in range(0, len(data), chunk_bytes):
+                    fixes = parser.feed(view[start:start + chunk_bytes])
+                    total += store.append(voyage, fixes['time'], fixes['lat'], fixes['lon'])
+            finally:
+                view.release()
+    fixes = parser.flush()
+    return total + store.append(voyage, fixes['time'], fixes['lat'], fixes['lon'])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Store voyages in a memory-mapped track store and analyse them.")
+    parser.add_argument("store", help="track store directory (created by import)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    imp = commands.add_parser("import", help="append a GPX or NMEA file as a voyage")
+    imp.add_argument("voyage")
+    imp.add_argument("track")
+    stats = commands.add_parser("stats", help="summary statistics of a voyage")
+    stats.add_argument("voyage")
+    stats.add_argument("--start", type=float, help="first POSIX time to include")
+    stats.add_argument("--end", type=float, help="last POSIX time to include")
+    stats.add_argument("--metric", choices=METRICS, default="rhumb")
+    stats.add_argument("--nm", action="store_true", help="distances in nautical miles instead of meters")
+    commands.add_parser("list", help="list the voyages and their fixes")
+    args = parser.parse_args(argv)
+
+    try:
+        store = TrackStore(args.store, create=args.command == "import")
+        if args.command == "import":
+            print(f"{import_track(store, args.voyage, args.track)} fixes appended to {args.voyage}")
+        elif args.command == "list":
+            for name in store.voyages:
+                start, stop = store.rows(name)
+                print(f"{name}\t{stop - start}")
+        else:
+            summary = store.summary(args.voyage, args.start, args.end, args.metric)
+            if args.nm:
+                for key in ("distance_m", "made_good_m"):
+                    value = summary.pop(key)
+                    summary[key[:-2] + "_nm"] = None if value is None else value / 1852.0
+            print(json.dumps(summary, indent=2))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
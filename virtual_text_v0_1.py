@@ -0,0 +1,155 @@
+# virtual_text_v0_1.py
+# Shows very long line lists in a tk.Text, formatting only the lines in view
+# Used by the great circle tab for routes with thousands of waypoints
+
+import tkinter as tk
+import tkinter.font as tkfont
+
+
+class LineWindow:
+    """
+    Which slice of a list of total lines is in view, for a view page lines high.
+    Keeps the scrolling arithmetic apart from Tk so it can be tested on its own.
+    """
+
+    __slots__ = ('total', 'page', 'top')
+
+    def __init__(self, total, page):
+        self.total = total
+        self.page = max(1, page)
+        self.top = 0
+
+    def clamp(self):
+        self.top = max(0, min(self.top, self.total - self.page))
+
+    def moveto(self, fraction):
+        """Scroll so that the given fraction of the lines is above the view."""
+        self.top = int(round(float(fraction) * self.total))
+        self.clamp()
+
+    def scroll(self, count, what="units"):
+        """Scroll by count lines ("units") or count pages ("pages")."""
+        step = self.page - 1 if what == "pages" else 1
+        self.top += int(count) * max(1, step)
+        self.clamp()
+
+    def resize(self, page):
+        self.page = max(1, page)
+        self.clamp()
+
+    def span(self):
+        """Line numbers [first, last) in view."""
+        return self.top, min(self.total, self.top + self.page)
+
+    def fractions(self):
+        """(first, last) fractions for Scrollbar.set."""
+        if self.total <= 0:
+            return 0.0, 1.0
+        first, last = self.span()
+        return first / self.total, last / self.total
+
+
+class VirtualText:
+    """
+    Displays header lines followed by count rows in an existing tk.Text and its
+    vertical scrollbar. Rows come from format_row(i) and only the rows in view are
+    formatted and inserted; the scrollbar, mouse wheel and paging keys move the view.
+    The Text does not wrap while attached, so each row is one display line. Copying
+    with the whole view selected (e.g. after Select All) copies every row, formatted
+    on the spot. detach() gives the Text and scrollbar back their normal behaviour.
+    """
+
+    def __init__(self, text, scrollbar, header, count, format_row):
+        self.text = text
+        self.scrollbar = scrollbar
+        self.header = header
+        self.format_row = format_row
+        self._wrap = text.cget("wrap")
+        text.configure(wrap="none")
+        self.window = LineWindow(len(header) + count, self._page_lines())
+        self._bindings = []
+
+        scrollbar.configure(command=self._yview)
+        text.configure(yscrollcommand="")
+        for sequence, handler in (("<Configure>", self._on_configure),
+                                  ("<MouseWheel>", self._on_wheel),
+                                  ("<Button-4>", lambda e: self._scroll(-3, "units")),
+                                  ("<Button-5>", lambda e: self._scroll(3, "units")),
+                                  ("<Up>", lambda e: self._scroll(-1, "units")),
+                                  ("<Down>", lambda e: self._scroll(1, "units")),
+                                  ("<Prior>", lambda e: self._scroll(-1, "pages")),
+                                  ("<Next>", lambda e: self._scroll(1, "pages")),
+                                  ("<<Copy>>", self._on_copy)):
+            self._bindings.append((sequence, text.bind(sequence, handler, add="+")))
+        self.render()
+
+    def detach(self):
+        """Stop virtual scrolling and restore the Text's own scrolling."""
+        for sequence, funcid in self._bindings:
+            self.text.unbind(sequence, funcid)
+        self._bindings = []
+        self.scrollbar.configure(command=self.text.yview)
+        self.text.configure(yscrollcommand=self.scrollbar.set, wrap=self._wrap)
+
+    def _page_lines(self):
+        """Number of text lines the widget shows at its current size."""
+        text = self.text
+        height = text.winfo_height()
+        if height <= 1:  # Not mapped yet
+            return int(text.cget("height"))
+        pad = 2 * (int(text.cget("borderwidth")) + int(text.cget("highlightthickness")) + int(text.cget("pady")))
+        linespace = tkfont.Font(root=text, font=text.cget("font")).metrics("linespace")
+        return max(1, (height - pad) // linespace)
+
+    def line(self, i):
+        n = len(self.header)
+        return self.header[i] if i < n else self.format_row(i - n)
+
+    def all_text(self):
+        """Every line, header and all rows, as a plain Text would hold them."""
+        return "\n".join(self.line(i) for i in range(self.window.total))
+
+    def copy(self):
+        """Put the whole table on the clipboard."""
+        self.text.clipboard_clear()
+        self.text.clipboard_append(self.all_text())
+
+    def render(self):
+        first, last = self.window.span()
+        text = self.text
+        state = text.cget("state")
+        text.config(state="normal")
+        text.delete("1.0", tk.END)
+        text.insert(tk.END, "\n".join(self.line(i) for i in range(first, last)))
+        text.config(state=state)
+        self.scrollbar.set(*self.window.fractions())
+
+    def _yview(self, *args):
+        if args[0] == "moveto":
+            self.window.moveto(args[1])
+        elif args[0] == "scroll":
+            self.window.scroll(args[1], args[2])
+        self.render()
+
+    def _scroll(self, count, what):
+        self.window.scroll(count, what)
+        self.render()
+        return "break"
+
+    def _on_copy(self, event):
+        # A selection short of the whole view is copied as usual
+        text = self.text
+        ranges = text.tag_ranges("sel")
+        if not ranges or text.compare(ranges[0], ">", "1.0") or text.compare(ranges[-1], "<", "end-1c"):
+            return None
+        self.copy()
+        return "break"
+
+    def _on_wheel(self, event):
+        return self._scroll(-3 if event.delta > 0 else 3, "units")
+
+    def _on_configure(self, event):
+        page = self._page_lines()
+        if page != self.window.page:
+            self.window.resize(page)
+            self.render()